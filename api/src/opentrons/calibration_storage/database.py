@@ -0,0 +1,456 @@
+""" opentrons.calibration_storage.database: calibration storage in a
+single SQLite database.
+
+When the ``enableCalibrationDatabase`` feature flag is set, the functions in
+:py:mod:`.get`, :py:mod:`.modify` and :py:mod:`.delete` keep labware offsets,
+tip lengths, pipette offsets and deck calibration here instead of in one
+JSON file per calibration plus index files. Each calibration is a row keyed
+by what it is looked up by, holding the same dict that would have been saved
+in its file, and every function runs in its own transaction.
+
+The first time the database is opened, everything in the existing
+calibration files is copied into it. The files are left in place, and each
+time the database is opened again any calibration file modified since the
+last time is copied in over what the database holds, so calibration done
+while the flag was off is not lost. Nothing is ever written back to the
+files, and files deleted while the flag was off are not deleted from the
+database.
+
+These functions should only be imported inside the calibration_storage
+module.
+"""
+import contextlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+import typing
+from pathlib import Path
+
+from opentrons import config
+
+from . import file_operators as io, migration
+from .encoder_decoder import DateTimeEncoder, DateTimeDecoder
+
+if typing.TYPE_CHECKING:
+    from .dev_types import CalibrationIndexDict
+
+
+log = logging.getLogger(__name__)
+
+#: The version of the schema below, stored as the database's user_version
+SCHEMA_VERSION = 2
+
+_SCHEMA = (
+    """CREATE TABLE IF NOT EXISTS labware_offset (
+        calibration_id TEXT PRIMARY KEY,
+        uri TEXT NOT NULL,
+        parent TEXT NOT NULL,
+        full_parent TEXT NOT NULL,
+        data TEXT
+    )""",
+    'CREATE INDEX IF NOT EXISTS labware_offset_uri ON labware_offset (uri)',
+    """CREATE TABLE IF NOT EXISTS tip_length (
+        pipette TEXT NOT NULL,
+        tiprack TEXT NOT NULL,
+        data TEXT NOT NULL,
+        PRIMARY KEY (pipette, tiprack)
+    )""",
+    'CREATE INDEX IF NOT EXISTS tip_length_tiprack ON tip_length (tiprack)',
+    """CREATE TABLE IF NOT EXISTS pipette_offset (
+        mount TEXT NOT NULL,
+        pipette TEXT NOT NULL,
+        data TEXT NOT NULL,
+        PRIMARY KEY (mount, pipette)
+    )""",
+    'CREATE INDEX IF NOT EXISTS pipette_offset_pipette '
+    'ON pipette_offset (pipette)',
+    """CREATE TABLE IF NOT EXISTS deck_calibration (
+        id INTEGER PRIMARY KEY CHECK (id = 0),
+        data TEXT NOT NULL
+    )""",
+    # When the calibration files were last copied in, in ns since the epoch
+    """CREATE TABLE IF NOT EXISTS file_sync (
+        id INTEGER PRIMARY KEY CHECK (id = 0),
+        synced_ns INTEGER NOT NULL
+    )""",
+)
+
+#: How long to wait for another process to finish writing, in seconds
+LOCK_TIMEOUT = 10.0
+
+_connections: typing.Dict[str, sqlite3.Connection] = {}
+_lock = threading.RLock()
+
+
+def _encode(data: typing.Mapping) -> str:
+    return json.dumps(data, cls=DateTimeEncoder)
+
+
+def _decode(data: str) -> typing.Dict:
+    return json.loads(data, cls=DateTimeDecoder)
+
+
+def _open(path: Path) -> sqlite3.Connection:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # transactions are begun explicitly, see _transaction
+    conn = sqlite3.connect(
+        str(path), timeout=LOCK_TIMEOUT, isolation_level=None,
+        check_same_thread=False)
+    conn.execute('PRAGMA journal_mode=WAL')
+    # Taken before any file is read, so that a file written while they are
+    # being read is copied in again next time
+    started = time.time_ns()
+    with _begin(conn, write=True):
+        version = conn.execute('PRAGMA user_version').fetchone()[0]
+        if version < SCHEMA_VERSION:
+            for statement in _SCHEMA:
+                conn.execute(statement)
+        synced = conn.execute('SELECT synced_ns FROM file_sync').fetchone()
+        if version == 0:
+            _import_files(conn)
+            log.info(f'Copied calibration files into {path}')
+        elif synced:
+            _import_files(conn, since=synced[0])
+        # A database from before file_sync existed has no record of when
+        # the files were copied in, so it keeps what it holds
+        conn.execute(
+            'INSERT OR REPLACE INTO file_sync VALUES (0, ?)', (started,))
+        conn.execute(f'PRAGMA user_version = {SCHEMA_VERSION}')
+    return conn
+
+
+@contextlib.contextmanager
+def _begin(conn: sqlite3.Connection,
+           write: bool) -> typing.Iterator[sqlite3.Connection]:
+    # Writers take the write lock up front so that a read-modify-write
+    # cannot interleave with one in another process
+    conn.execute('BEGIN IMMEDIATE' if write else 'BEGIN')
+    try:
+        yield conn
+    except BaseException:
+        conn.execute('ROLLBACK')
+        raise
+    else:
+        conn.execute('COMMIT')
+
+
+@contextlib.contextmanager
+def _transaction(
+        write: bool = False) -> typing.Iterator[sqlite3.Connection]:
+    path = config.get_opentrons_path('calibration_database_file')
+    with _lock:
+        conn = _connections.get(str(path))
+        if conn is None:
+            conn = _open(path)
+            _connections[str(path)] = conn
+        with _begin(conn, write) as transaction:
+            yield transaction
+
+
+def close() -> None:
+    """ Close the database, which is reopened when it is next used """
+    with _lock:
+        for conn in _connections.values():
+            conn.close()
+        _connections.clear()
+
+
+def _import_files(
+        conn: sqlite3.Connection, since: typing.Optional[int] = None) -> None:
+    """ Copy the calibration files into the database
+
+    :param since: If given, only copy files modified after this time, in ns
+                  since the epoch
+    """
+    def changed(path: Path) -> bool:
+        try:
+            modified = path.stat().st_mtime_ns
+        except FileNotFoundError:
+            return False
+        return since is None or modified > since
+
+    _import_labware_offsets(conn, changed)
+    _import_tip_lengths(conn, changed)
+    _import_pipette_offsets(conn, changed)
+    _import_deck_calibration(conn, changed)
+
+
+def _import_labware_offsets(
+        conn: sqlite3.Connection,
+        changed: typing.Callable[[Path], bool]) -> None:
+    offset_dir = \
+        config.get_opentrons_path('labware_calibration_offsets_dir_v2')
+    index_path = offset_dir / 'index.json'
+    migration.check_index_version(index_path)
+    try:
+        index = io.read_cal_file(str(index_path)).get('data', {})
+    except FileNotFoundError:
+        index = {}
+    for calibration_id, entry in index.items():
+        module = entry['module']
+        conn.execute(
+            'INSERT OR IGNORE INTO labware_offset VALUES (?, ?, ?, ?, NULL)',
+            (calibration_id, entry['uri'], module.get('parent', ''),
+             module.get('fullParent', '')))
+        offset_path = offset_dir / f'{calibration_id}.json'
+        if changed(offset_path):
+            conn.execute(
+                'UPDATE labware_offset SET data = ? WHERE calibration_id = ?',
+                (_encode(io.read_cal_file(str(offset_path))),
+                 calibration_id))
+
+
+def _import_tip_lengths(
+        conn: sqlite3.Connection,
+        changed: typing.Callable[[Path], bool]) -> None:
+    tip_length_dir = config.get_tip_length_cal_path()
+    for path in sorted(tip_length_dir.glob('*.json')):
+        if path.name == 'index.json' or not changed(path):
+            continue
+        for tiprack, info in io.read_cal_file(str(path)).items():
+            _put_tip_length(conn, path.stem, tiprack, _encode(info))
+
+
+def _import_pipette_offsets(
+        conn: sqlite3.Connection,
+        changed: typing.Callable[[Path], bool]) -> None:
+    pipette_dir = config.get_opentrons_path('pipette_calibration_dir')
+    for path in sorted(pipette_dir.glob('*/*.json')):
+        if changed(path):
+            _put_pipette_offset(
+                conn, path.parent.name, path.stem,
+                _encode(io.read_cal_file(str(path))))
+
+
+def _import_deck_calibration(
+        conn: sqlite3.Connection,
+        changed: typing.Callable[[Path], bool]) -> None:
+    deck_path = config.get_opentrons_path('robot_calibration_dir')\
+        / 'deck_calibration.json'
+    if changed(deck_path):
+        conn.execute(
+            'INSERT OR REPLACE INTO deck_calibration VALUES (0, ?)',
+            (_encode(io.read_cal_file(str(deck_path))),))
+
+
+def _index_entry(
+        calibration_id: str, uri: str,
+        parent: str, full_parent: str) -> 'CalibrationIndexDict':
+    return {
+        'uri': uri,
+        'slot': calibration_id,
+        'module': {'parent': parent, 'fullParent': full_parent}
+        if parent else {}}  # type: ignore
+
+
+def get_all_labware_offsets() -> typing.List[
+        typing.Tuple['CalibrationIndexDict', typing.Dict]]:
+    """ The index entry and offset of every labware that has one, in the
+    order they were first saved """
+    with _transaction() as conn:
+        rows = conn.execute(
+            'SELECT calibration_id, uri, parent, full_parent, data '
+            'FROM labware_offset WHERE data IS NOT NULL '
+            'ORDER BY rowid').fetchall()
+    return [(_index_entry(*row[:4]), _decode(row[4])) for row in rows]
+
+
+def get_labware_offset(
+        calibration_id: str) -> typing.Optional[typing.Dict]:
+    with _transaction() as conn:
+        row = conn.execute(
+            'SELECT data FROM labware_offset WHERE calibration_id = ?',
+            (calibration_id,)).fetchone()
+    if row is None or row[0] is None:
+        return None
+    return _decode(row[0])
+
+
+def add_labware_to_index(
+        calibration_id: str, uri: str, parent: str, slot: str) -> None:
+    """ Record the uri and parent of a labware, unless it is already
+    recorded """
+    with _transaction(write=True) as conn:
+        conn.execute(
+            'INSERT OR IGNORE INTO labware_offset VALUES (?, ?, ?, ?, NULL)',
+            (calibration_id, uri, parent,
+             f'{slot}-{parent}' if parent else ''))
+
+
+def save_labware_offset(
+        calibration_id: str, uri: str, parent: str, slot: str,
+        update: typing.Callable[
+            [typing.Optional[typing.Dict]], typing.Dict]) -> None:
+    """ Save a labware's offset, adding it to the index if needed.
+
+    :param update: Called with the saved offset (or None) in the same
+                   transaction, and returns the offset to save
+    """
+    with _transaction(write=True) as conn:
+        conn.execute(
+            'INSERT OR IGNORE INTO labware_offset VALUES (?, ?, ?, ?, NULL)',
+            (calibration_id, uri, parent,
+             f'{slot}-{parent}' if parent else ''))
+        row = conn.execute(
+            'SELECT data FROM labware_offset WHERE calibration_id = ?',
+            (calibration_id,)).fetchone()
+        current = _decode(row[0]) if row[0] is not None else None
+        conn.execute(
+            'UPDATE labware_offset SET data = ? WHERE calibration_id = ?',
+            (_encode(update(current)), calibration_id))
+
+
+def delete_labware_offset(calibration_id: str) -> None:
+    """
+    :raises KeyError: If there is no such calibration
+    """
+    with _transaction(write=True) as conn:
+        deleted = conn.execute(
+            'DELETE FROM labware_offset WHERE calibration_id = ?',
+            (calibration_id,)).rowcount
+    if not deleted:
+        raise KeyError(calibration_id)
+
+
+def clear_labware_offsets() -> None:
+    with _transaction(write=True) as conn:
+        conn.execute('DELETE FROM labware_offset')
+
+
+def get_tip_length(
+        pipette: str,
+        tiprack: str) -> typing.Optional[typing.Dict]:
+    with _transaction() as conn:
+        row = conn.execute(
+            'SELECT data FROM tip_length WHERE pipette = ? AND tiprack = ?',
+            (pipette, tiprack)).fetchone()
+    return _decode(row[0]) if row else None
+
+
+def get_all_tip_lengths() -> typing.List[
+        typing.Tuple[str, str, typing.Dict]]:
+    """ The pipette, tiprack and tip length of every tip length
+    calibration """
+    with _transaction() as conn:
+        rows = conn.execute(
+            'SELECT pipette, tiprack, data FROM tip_length '
+            'ORDER BY pipette, rowid').fetchall()
+    return [(pipette, tiprack, _decode(data))
+            for pipette, tiprack, data in rows]
+
+
+def save_tip_lengths(
+        pipette: str, tip_lengths: typing.Mapping[str, typing.Mapping]) -> None:
+    with _transaction(write=True) as conn:
+        for tiprack, data in tip_lengths.items():
+            _put_tip_length(conn, pipette, tiprack, _encode(data))
+
+
+def _put_tip_length(
+        conn: sqlite3.Connection,
+        pipette: str, tiprack: str, encoded: str) -> None:
+    # Updated in place rather than replaced, to keep the row's order
+    updated = conn.execute(
+        'UPDATE tip_length SET data = ? '
+        'WHERE pipette = ? AND tiprack = ?',
+        (encoded, pipette, tiprack)).rowcount
+    if not updated:
+        conn.execute(
+            'INSERT INTO tip_length VALUES (?, ?, ?)',
+            (pipette, tiprack, encoded))
+
+
+def delete_tip_length(pipette: str, tiprack: str) -> None:
+    """
+    :raises FileNotFoundError: If there are no tip lengths for the pipette
+    """
+    with _transaction(write=True) as conn:
+        deleted = conn.execute(
+            'DELETE FROM tip_length WHERE pipette = ? AND tiprack = ?',
+            (pipette, tiprack)).rowcount
+        if not deleted and not conn.execute(
+                'SELECT 1 FROM tip_length WHERE pipette = ?',
+                (pipette,)).fetchone():
+            raise FileNotFoundError(
+                f'No tip length calibration for pipette {pipette}')
+
+
+def clear_tip_lengths() -> None:
+    with _transaction(write=True) as conn:
+        conn.execute('DELETE FROM tip_length')
+
+
+def get_pipette_offset(
+        pipette: str,
+        mount: str) -> typing.Optional[typing.Dict]:
+    with _transaction() as conn:
+        row = conn.execute(
+            'SELECT data FROM pipette_offset '
+            'WHERE mount = ? AND pipette = ?',
+            (mount, pipette)).fetchone()
+    return _decode(row[0]) if row else None
+
+
+def get_all_pipette_offsets() -> typing.List[
+        typing.Tuple[str, str, typing.Dict]]:
+    """ The mount, pipette and offset of every pipette offset
+    calibration """
+    with _transaction() as conn:
+        rows = conn.execute(
+            'SELECT mount, pipette, data FROM pipette_offset '
+            'ORDER BY mount, rowid').fetchall()
+    return [(mount, pipette, _decode(data))
+            for mount, pipette, data in rows]
+
+
+def save_pipette_offset(
+        pipette: str, mount: str, data: typing.Mapping) -> None:
+    encoded = _encode(data)
+    with _transaction(write=True) as conn:
+        _put_pipette_offset(conn, mount, pipette, encoded)
+
+
+def _put_pipette_offset(
+        conn: sqlite3.Connection,
+        mount: str, pipette: str, encoded: str) -> None:
+    updated = conn.execute(
+        'UPDATE pipette_offset SET data = ? '
+        'WHERE mount = ? AND pipette = ?',
+        (encoded, mount, pipette)).rowcount
+    if not updated:
+        conn.execute(
+            'INSERT INTO pipette_offset VALUES (?, ?, ?)',
+            (mount, pipette, encoded))
+
+
+def delete_pipette_offset(pipette: str, mount: str) -> None:
+    with _transaction(write=True) as conn:
+        conn.execute(
+            'DELETE FROM pipette_offset WHERE mount = ? AND pipette = ?',
+            (mount, pipette))
+
+
+def clear_pipette_offsets() -> None:
+    with _transaction(write=True) as conn:
+        conn.execute('DELETE FROM pipette_offset')
+
+
+def get_deck_calibration() -> typing.Optional[typing.Dict]:
+    with _transaction() as conn:
+        row = conn.execute(
+            'SELECT data FROM deck_calibration').fetchone()
+    return _decode(row[0]) if row else None
+
+
+def save_deck_calibration(data: typing.Mapping) -> None:
+    with _transaction(write=True) as conn:
+        conn.execute(
+            'INSERT OR REPLACE INTO deck_calibration VALUES (0, ?)',
+            (_encode(data),))
+
+
+def delete_deck_calibration() -> None:
+    with _transaction(write=True) as conn:
+        conn.execute('DELETE FROM deck_calibration')
@@ -4,9 +4,10 @@ file system.
 """
 from pathlib import Path
 
-from . import types as local_types, file_operators as io
+from . import types as local_types, database, file_operators as io
 
 from opentrons import config
+from opentrons.config import feature_flags as ff
 from opentrons.types import Mount
 
 
@@ -15,6 +16,9 @@ def clear_calibrations():
     Delete all calibration files for labware. This includes deleting tip-length
     data for tipracks.
     """
+    if ff.enable_calibration_database():
+        database.clear_labware_offsets()
+        return
     calibration_path =\
         config.get_opentrons_path('labware_calibration_offsets_dir_v2')
     try:
@@ -49,6 +53,9 @@ def delete_offset_file(calibration_id: local_types.CalibrationID):
 
     :param calibration_id: labware hash
     """
+    if ff.enable_calibration_database():
+        database.delete_labware_offset(calibration_id)
+        return
     offset_path =\
         config.get_opentrons_path('labware_calibration_offsets_dir_v2')
     offset = offset_path / f'{calibration_id}.json'
@@ -80,6 +87,9 @@ def delete_tip_length_calibration(tiprack: str, pipette: str):
     :param tiprack: tiprack hash
     :param pipette: pipette serial number
     """
+    if ff.enable_calibration_database():
+        database.delete_tip_length(pipette, tiprack)
+        return
     tip_length_dir = config.get_tip_length_cal_path()
     tip_length_path = tip_length_dir / f'{pipette}.json'
     blob = io.read_cal_file(str(tip_length_path))
@@ -97,6 +107,9 @@ def clear_tip_length_calibration():
     """
     Delete all tip length calibration files.
     """
+    if ff.enable_calibration_database():
+        database.clear_tip_lengths()
+        return
     tip_length_path = config.get_tip_length_cal_path()
     try:
         targets = (
@@ -136,6 +149,9 @@ def delete_pipette_offset_file(pipette: str, mount: Mount):
     :param pipette: pipette serial number
     :param mount: pipette mount
     """
+    if ff.enable_calibration_database():
+        database.delete_pipette_offset(pipette, mount.name.lower())
+        return
     offset_dir = config.get_opentrons_path('pipette_calibration_dir')
     offset_path = offset_dir / mount.name.lower() / f'{pipette}.json'
 
@@ -150,6 +166,9 @@ def clear_pipette_offset_calibrations():
     """
     Delete all pipette offset calibration files.
     """
+    if ff.enable_calibration_database():
+        database.clear_pipette_offsets()
+        return
 
     def _remove_json_files_in_directories(p: Path):
         for item in p.iterdir():
@@ -169,6 +188,9 @@ def delete_robot_deck_attitude():
     """
     Delete the robot deck attitude calibration.
     """
+    if ff.enable_calibration_database():
+        database.delete_deck_calibration()
+        return
 
     robot_dir = config.get_opentrons_path('robot_calibration_dir')
     gantry_path = robot_dir / 'deck_calibration.json'
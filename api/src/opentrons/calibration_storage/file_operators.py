@@ -4,10 +4,29 @@ manipulate the file system.
 These methods should only be imported inside the calibration_storage
 module, except in the special case of v2 labware support in
 the v1 API.
+
+Files are read through an in-memory cache keyed by path, which is checked
+against each file's modification time and size so that changes made outside
+of these functions are picked up, and which :py:func:`save_to_file` writes
+through.
+
+Lookups go through :py:func:`read_cal_directory`, which lists a calibration
+directory once, so that files which do not exist are found missing without
+touching the disk. The listing is checked against the modification time of
+the directory, which changes when a file is added, removed or replaced, and
+the files in it are read through the cache above, so a file rewritten in
+place by another process is seen on its next lookup.
 """
+import copy
 import json
 import datetime
+import os
+import threading
+import time
 import typing
+from dataclasses import dataclass
+
+from opentrons.util.caching import Stamp, file_stamp
 
 from .types import StrPath
 from .encoder_decoder import DateTimeEncoder, DateTimeDecoder
@@ -15,27 +34,102 @@ from .encoder_decoder import DateTimeEncoder, DateTimeDecoder
 
 DecoderType = typing.Type[json.JSONDecoder]
 EncoderType = typing.Type[json.JSONEncoder]
+CacheKey = typing.Tuple[str, DecoderType]
 
 
-def read_cal_file(
-        filepath: StrPath,
-        decoder: DecoderType = DateTimeDecoder) -> typing.Dict:
+@dataclass(frozen=True)
+class _CachedFile:
+    stamp: Stamp
+    data: typing.Dict
+
+
+_cache: typing.Dict[CacheKey, _CachedFile] = {}
+_cache_lock = threading.Lock()
+
+
+def _cache_key(filepath: StrPath, decoder: DecoderType) -> CacheKey:
+    return os.path.abspath(filepath), decoder
+
+
+def _directory_stamp(path: str) -> typing.Optional[Stamp]:
+    try:
+        return file_stamp(path)
+    except FileNotFoundError:
+        return None
+
+
+# A directory changed this soon before it was listed may change again
+# without its modification time moving on (timestamps are coarse), so it is
+# listed again until it has been quiet this long
+RACY_INTERVAL_NS = 2 * 10**9
+
+
+class CalibrationDirectory:
+    """ The calibration files in one directory, by name without the
+    ``.json`` extension.
+
+    Files are read through :py:func:`read_cached_cal_file`, so the data is
+    shared and must not be modified.
     """
-    Function used to read data from a file
 
-    :param filepath: path to look for data at
-    :param decoder: if there is any specialized decoder needed.
-    The default decoder is the date time decoder.
-    :return: Data from the file
+    def __init__(self, path: str) -> None:
+        listed_at = time.time_ns()
+        self.stamp = _directory_stamp(path)
+        self._paths: typing.Dict[str, str] = {}
+        if self.stamp is not None:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    name, extension = os.path.splitext(entry.name)
+                    if extension == '.json' and entry.is_file():
+                        self._paths[name] = entry.path
+        self.settled = self.stamp is not None \
+            and self.stamp[0] < listed_at - RACY_INTERVAL_NS
+
+    def names(self) -> typing.KeysView[str]:
+        return self._paths.keys()
+
+    def get(self, name: str) -> typing.Optional[typing.Dict]:
+        """ The contents of ``name.json``, or None if there is no such file
+        """
+        path = self._paths.get(name)
+        if path is None:
+            return None
+        try:
+            return read_cached_cal_file(path)
+        except FileNotFoundError:
+            return None
+
+
+_directories: typing.Dict[str, CalibrationDirectory] = {}
+
+
+def read_cal_directory(dirpath: StrPath) -> CalibrationDirectory:
+    """
+    Function used to look up the calibration files in a directory, at the
+    cost of checking the directory's modification time.
+
+    :param dirpath: The directory to look in. It does not need to exist.
+    :return: The files in the directory
     """
+    path = os.path.abspath(dirpath)
+    with _cache_lock:
+        directory = _directories.get(path)
+    if directory is None or not directory.settled \
+            or _directory_stamp(path) != directory.stamp:
+        directory = CalibrationDirectory(path)
+        with _cache_lock:
+            _directories[path] = directory
+    return directory
+
+
+def _decode(contents: str, decoder: DecoderType) -> typing.Dict:
     # TODO(6/16): We should use tagged unions for
     # both the calibration and tip length dicts to better
     # categorize the Typed Dicts used here.
     # This can be done when the labware endpoints
     # are refactored to grab tip length calibration
     # from the correct locations.
-    with open(filepath, 'r') as f:
-        calibration_data = json.load(f, cls=decoder)
+    calibration_data = json.loads(contents, cls=decoder)
     if isinstance(calibration_data.values(), dict):
         for value in calibration_data.values():
             if value.get('lastModified'):
@@ -47,6 +141,46 @@ def read_cal_file(
     return calibration_data
 
 
+def read_cached_cal_file(
+        filepath: StrPath,
+        decoder: DecoderType = DateTimeDecoder) -> typing.Dict:
+    """
+    Function used to read data from a file without copying it out of the
+    cache. The data is shared, so it must not be modified.
+
+    :param filepath: path to look for data at
+    :param decoder: if there is any specialized decoder needed.
+    The default decoder is the date time decoder.
+    :return: Data from the file
+    :raises FileNotFoundError: If there is no file at filepath
+    """
+    key = _cache_key(filepath, decoder)
+    stamp = file_stamp(key[0])
+    with _cache_lock:
+        cached = _cache.get(key)
+    if cached and cached.stamp == stamp:
+        return cached.data
+    with open(filepath, 'r') as f:
+        calibration_data = _decode(f.read(), decoder)
+    with _cache_lock:
+        _cache[key] = _CachedFile(stamp=stamp, data=calibration_data)
+    return calibration_data
+
+
+def read_cal_file(
+        filepath: StrPath,
+        decoder: DecoderType = DateTimeDecoder) -> typing.Dict:
+    """
+    Function used to read data from a file
+
+    :param filepath: path to look for data at
+    :param decoder: if there is any specialized decoder needed.
+    The default decoder is the date time decoder.
+    :return: Data from the file, which the caller may modify
+    """
+    return copy.deepcopy(read_cached_cal_file(filepath, decoder))
+
+
 def save_to_file(
         filepath: StrPath,
         data: typing.Mapping,
@@ -59,5 +193,25 @@ def save_to_file(
     :param encoder: if there is any specialized encoder needed.
     The default encoder is the date time encoder.
     """
+    contents = json.dumps(data, cls=encoder)
+    path = os.path.abspath(filepath)
+    with _cache_lock:
+        for key in [key for key in _cache if key[0] == path]:
+            del _cache[key]
     with open(filepath, 'w') as f:
-        json.dump(data, f, cls=encoder)
+        f.write(contents)
+    try:
+        cached = _CachedFile(
+            stamp=file_stamp(path), data=_decode(contents, DateTimeDecoder))
+    except Exception:
+        # it will be read from the file if it is needed
+        return
+    with _cache_lock:
+        _cache[(path, DateTimeDecoder)] = cached
+
+
+def clear_cache() -> None:
+    """ Forget all cached file contents """
+    with _cache_lock:
+        _cache.clear()
+        _directories.clear()
@@ -6,14 +6,16 @@ labware calibration from its designated file location.
 import itertools
 import json
 import typing
+from pathlib import Path
 from typing_extensions import Literal
 
 from opentrons import config
+from opentrons.config import feature_flags as ff
 from opentrons.types import Point, Mount
 
 from . import (
     types as local_types,
-    file_operators as io, helpers, migration, modify)
+    file_operators as io, database, helpers, migration, modify)
 if typing.TYPE_CHECKING:
     from opentrons_shared_data.labware.dev_types import LabwareDefinition
     from opentrons_shared_data.pipette.dev_types import LabwareUri
@@ -23,7 +25,7 @@ if typing.TYPE_CHECKING:
 def _format_calibration_type(
         data: 'CalibrationDict') -> local_types.LabwareCalibrationTypes:
     offset = local_types.OffsetData(
-        value=data['default']['offset'],
+        value=list(data['default']['offset']),
         last_modified=data['default']['lastModified']
     )
     # TODO(6/16): Tip calibration no longer exists in
@@ -55,38 +57,64 @@ def get_all_calibrations() -> typing.List[local_types.CalibrationInformation]:
     labware calibration files found on the robot.
     """
     all_calibrations: typing.List[local_types.CalibrationInformation] = []
+    if ff.enable_calibration_database():
+        for data, cal_blob in database.get_all_labware_offsets():
+            all_calibrations.append(
+                local_types.CalibrationInformation(
+                    calibration=_format_calibration_type(
+                        cal_blob),  # type: ignore
+                    parent=_format_parent(data),
+                    labware_id=data['slot'],
+                    uri=data['uri']))
+        return all_calibrations
+
     offset_path =\
         config.get_opentrons_path('labware_calibration_offsets_dir_v2')
-    index_path = offset_path / 'index.json'
-    if not index_path.exists():
+    offsets = _labware_offsets(offset_path)
+    index_file = offsets.get('index')
+    if index_file is None:
         return all_calibrations
 
-    migration.check_index_version(index_path)
-    index_file = io.read_cal_file(str(index_path))
     calibration_index = index_file.get('data', {})
     for key, data in calibration_index.items():
-        cal_path = offset_path / f'{key}.json'
-        if cal_path.exists():
-            cal_blob = io.read_cal_file(str(cal_path))
-            calibration = _format_calibration_type(cal_blob)  # type: ignore
-            all_calibrations.append(
-                local_types.CalibrationInformation(
-                    calibration=calibration,
-                    parent=_format_parent(data),
-                    labware_id=key,
-                    uri=data['uri']))
+        saved = offsets.get(key)
+        if saved is None:
+            continue
+        calibration = _format_calibration_type(saved)  # type: ignore
+        all_calibrations.append(
+            local_types.CalibrationInformation(
+                calibration=calibration,
+                parent=_format_parent(data),
+                labware_id=key,
+                uri=data['uri']))
     return all_calibrations
 
 
+def _labware_offsets(offset_path: Path) -> io.CalibrationDirectory:
+    offsets = io.read_cal_directory(offset_path)
+    index_file = offsets.get('index')
+    if index_file is not None and index_file.get('version', 0) == 0:
+        migration.migrate_index_0_to_1(offset_path / 'index.json')
+        offsets = io.read_cal_directory(offset_path)
+    return offsets
+
+
 def _get_tip_length_data(
         pip_id: str, labware_hash: str,
         labware_load_name: str, labware_uri: 'LabwareUri'
 ) -> local_types.TipLengthCalibration:
     try:
-        pip_tip_length_path = config.get_tip_length_cal_path()/f'{pip_id}.json'
-        tip_rack_data =\
-            io.read_cal_file(str(pip_tip_length_path))
-        tip_length_info = tip_rack_data[labware_hash]
+        if ff.enable_calibration_database():
+            saved = database.get_tip_length(pip_id, labware_hash)
+            if saved is None:
+                raise KeyError(labware_hash)
+            tip_length_info = saved
+        else:
+            tip_rack_data = io.read_cal_directory(
+                config.get_tip_length_cal_path()).get(pip_id)
+            if tip_rack_data is None:
+                raise KeyError(pip_id)
+            tip_length_info = tip_rack_data[labware_hash]
         return local_types.TipLengthCalibration(
             tip_length=tip_length_info['tipLength'],
             pipette=pip_id,
@@ -95,7 +123,7 @@ def _get_tip_length_data(
             source=_get_calibration_source(tip_length_info),
             status=_get_calibration_status(tip_length_info),
             uri=labware_uri)
-    except (FileNotFoundError, KeyError):
+    except KeyError:
         raise local_types.TipLengthCalNotFound(
             f'Tip length of {labware_load_name} has not been '
             f'calibrated for this pipette: {pip_id} and cannot'
@@ -114,14 +142,24 @@ def get_labware_calibration(
     :return: A point which represents the delta from well A1 origin of
     a labware
     """
+    offset = Point(0, 0, 0)
+    if ff.enable_calibration_database():
+        calibration = database.get_labware_offset(
+            Path(lookup_path).stem)
+        if calibration:
+            offset = Point(*calibration['default']['offset'])
+        return offset
+
     offset_path =\
         config.get_opentrons_path('labware_calibration_offsets_dir_v2')
-    offset = Point(0, 0, 0)
     labware_path = offset_path / lookup_path
-    if labware_path.exists():
-        modify.add_existing_labware_to_index_file(definition, parent, slot)
-        migration.check_index_version(offset_path / 'index.json')
-        calibration_data = io.read_cal_file(str(labware_path))
+    offsets = _labware_offsets(labware_path.parent)
+    calibration_data = offsets.get(labware_path.stem)
+    if calibration_data is not None:
+        index_file = offsets.get('index') or {}
+        if labware_path.stem not in index_file.get('data', {}):
+            modify.add_existing_labware_to_index_file(
+                definition, parent, slot)
         offset_array = calibration_data['default']['offset']
         offset = Point(x=offset_array[0], y=offset_array[1], z=offset_array[2])
     return offset
@@ -163,30 +201,40 @@ def get_all_tip_length_calibrations() \
     tip length calibration files found on the robot.
     """
     all_calibrations: typing.List[local_types.TipLengthCalibration] = []
-    tip_length_dir = config.get_opentrons_path('tip_length_calibration_dir')
-    index_path = tip_length_dir / 'index.json'
-    if not index_path.exists():
+    if ff.enable_calibration_database():
+        for pip, tiprack, info in database.get_all_tip_lengths():
+            all_calibrations.append(_format_tip_length(pip, tiprack, info))
+        return all_calibrations
+
+    tip_lengths = io.read_cal_directory(
+        config.get_opentrons_path('tip_length_calibration_dir'))
+    index_file = tip_lengths.get('index')
+    if index_file is None:
         return all_calibrations
 
-    index_file = io.read_cal_file(str(index_path))
     unique_pips = set(itertools.chain(*index_file.values()))
     for pip in unique_pips:
-        cal_path = tip_length_dir / f'{pip}.json'
-        if cal_path.exists():
-            data = io.read_cal_file(str(cal_path))
-            for tiprack, info in data.items():
-                all_calibrations.append(
-                    local_types.TipLengthCalibration(
-                        tip_length=info['tipLength'],
-                        pipette=pip,
-                        tiprack=tiprack,
-                        last_modified=info['lastModified'],
-                        source=_get_calibration_source(info),
-                        status=_get_calibration_status(info),
-                        uri=_get_tip_rack_uri(info)))
+        data = tip_lengths.get(pip)
+        if data is None:
+            continue
+        for tiprack, info in data.items():
+            all_calibrations.append(_format_tip_length(pip, tiprack, info))
     return all_calibrations
 
 
+def _format_tip_length(
+        pip: str, tiprack: str,
+        info: typing.Dict) -> local_types.TipLengthCalibration:
+    return local_types.TipLengthCalibration(
+        tip_length=info['tipLength'],
+        pipette=pip,
+        tiprack=tiprack,
+        last_modified=info['lastModified'],
+        source=_get_calibration_source(info),
+        status=_get_calibration_status(info),
+        uri=_get_tip_rack_uri(info))
+
+
 def _get_calibration_source(data: typing.Dict) -> local_types.SourceType:
     if 'source' not in data.keys():
         return local_types.SourceType.unknown
@@ -213,13 +261,16 @@ def _get_tip_rack_uri(data: typing.Dict) -> typing.Union['LabwareUri', Literal['
 
 def get_robot_deck_attitude() \
             -> typing.Optional[local_types.DeckCalibration]:
-    robot_dir = config.get_opentrons_path('robot_calibration_dir')
-    gantry_path = robot_dir / 'deck_calibration.json'
-    if gantry_path.exists():
-        data = io.read_cal_file(gantry_path)
+    if ff.enable_calibration_database():
+        data = database.get_deck_calibration()
+    else:
+        data = io.read_cal_directory(
+            config.get_opentrons_path('robot_calibration_dir')).get(
+                'deck_calibration')
+    if data is not None:
         try:
             return local_types.DeckCalibration(
-                attitude=data['attitude'],
+                attitude=[list(row) for row in data['attitude']],
                 source=_get_calibration_source(data),
                 pipette_calibrated_with=data['pipette_calibrated_with'],
                 tiprack=data['tiprack'],
@@ -235,13 +286,15 @@ def get_pipette_offset(
         pip_id: str,
         mount: Mount
 ) -> typing.Optional[local_types.PipetteOffsetByPipetteMount]:
-    pip_dir = config.get_opentrons_path('pipette_calibration_dir')
-    offset_path = pip_dir / mount.name.lower() / f'{pip_id}.json'
-    if offset_path.exists():
-        data = io.read_cal_file(offset_path)
+    if ff.enable_calibration_database():
+        data = database.get_pipette_offset(pip_id, mount.name.lower())
+    else:
+        pip_dir = config.get_opentrons_path('pipette_calibration_dir')
+        data = io.read_cal_directory(pip_dir / mount.name.lower()).get(pip_id)
+    if data is not None:
         assert 'offset' in data.keys(), 'Not valid pipette calibration data'
         return local_types.PipetteOffsetByPipetteMount(
-            offset=data['offset'],
+            offset=list(data['offset']),
             source=_get_calibration_source(data),
             tiprack=data['tiprack'],
             uri=data['uri'],
@@ -261,30 +314,42 @@ def get_all_pipette_offset_calibrations() \
     pipette offset calibration files found on the robot.
     """
     all_calibrations: typing.List[local_types.PipetteOffsetCalibration] = []
+    if ff.enable_calibration_database():
+        for mount_key, pip, data in database.get_all_pipette_offsets():
+            all_calibrations.append(
+                _format_pipette_offset(pip, mount_key, data))
+        return all_calibrations
+
     pip_dir = config.get_opentrons_path('pipette_calibration_dir')
-    index_path = pip_dir / 'index.json'
-    if not index_path.exists():
+    index_file = io.read_cal_directory(pip_dir).get('index')
+    if index_file is None:
         return all_calibrations
 
-    index_file = io.read_cal_file(str(index_path))
     for mount_key, pips in index_file.items():
+        offsets = io.read_cal_directory(pip_dir / mount_key)
         for pip in pips:
-            cal_path = pip_dir / mount_key / f'{pip}.json'
-            if cal_path.exists():
-                data = io.read_cal_file(str(cal_path))
-                all_calibrations.append(
-                    local_types.PipetteOffsetCalibration(
-                        pipette=pip,
-                        mount=mount_key,
-                        offset=data['offset'],
-                        tiprack=data['tiprack'],
-                        uri=data['uri'],
-                        last_modified=data['last_modified'],
-                        source=_get_calibration_source(data),
-                        status=_get_calibration_status(data)))
+            saved = offsets.get(pip)
+            if saved is None:
+                continue
+            all_calibrations.append(
+                _format_pipette_offset(pip, mount_key, saved))
     return all_calibrations
 
 
+def _format_pipette_offset(
+        pip: str, mount_key: str,
+        data: typing.Dict) -> local_types.PipetteOffsetCalibration:
+    return local_types.PipetteOffsetCalibration(
+        pipette=pip,
+        mount=mount_key,
+        offset=list(data['offset']),
+        tiprack=data['tiprack'],
+        uri=data['uri'],
+        last_modified=data['last_modified'],
+        source=_get_calibration_source(data),
+        status=_get_calibration_status(data))
+
+
 def get_custom_tiprack_definition_for_tlc(labware_uri: str) -> 'LabwareDefinition':
     """
     Return the custom tiprack definition saved in the custom tiprack directory
@@ -5,11 +5,14 @@ This module has functions that you can import to save robot or
 labware calibration to its designated file location.
 """
 import json
-from typing import Union, List, Dict, TYPE_CHECKING, cast
+import marshal
+from typing import Union, List, Dict, Optional, TYPE_CHECKING, cast
 from dataclasses import is_dataclass, asdict
 
 
-from hashlib import sha256
+from hashlib import blake2b, sha256
+
+from opentrons.util.caching import LRUCache
 
 from . import types as local_types
 
@@ -20,6 +23,15 @@ if TYPE_CHECKING:
 
 DictionaryFactoryType = Union[List, Dict]
 
+#: How many labware definition hashes to remember
+LABWARE_HASH_CACHE_SIZE = 128
+
+# Digests of labware definitions, keyed by a fingerprint of their exact
+# contents. marshal serializes a definition an order of magnitude faster
+# than the canonical JSON the digest is taken over, and any change to the
+# definition (including in place) changes its fingerprint.
+_labware_hashes: 'LRUCache[bytes, str]' = LRUCache(LABWARE_HASH_CACHE_SIZE)
+
 
 def dict_filter_none(data: DictionaryFactoryType) -> Dict:
     """
@@ -51,9 +63,33 @@ def hash_labware_def(labware_def: 'LabwareDefinition') -> str:
     blocklist = ['metadata', 'brand', 'groups']
     def_no_metadata = {
         k: v for k, v in labware_def.items() if k not in blocklist}
+    fingerprint = _fingerprint(def_no_metadata)
+    if fingerprint is not None:
+        cached = _labware_hashes.get(fingerprint)
+        if cached is not None:
+            return cached
     sorted_def_str = json.dumps(
         def_no_metadata, sort_keys=True, separators=(',', ':'))
-    return sha256(sorted_def_str.encode('utf-8')).hexdigest()
+    digest = sha256(sorted_def_str.encode('utf-8')).hexdigest()
+    if fingerprint is not None:
+        _labware_hashes.put(fingerprint, digest)
+    return digest
+
+
+def _fingerprint(contents: Dict) -> Optional[bytes]:
+    try:
+        # marshal version 2 predates references between objects, so equal
+        # contents serialize the same however they were built
+        return blake2b(
+            marshal.dumps(contents, 2), digest_size=20).digest()
+    except ValueError:
+        # something in there marshal can't serialize; just hash it
+        return None
+
+
+def clear_labware_hash_cache() -> None:
+    """ Forget the hashes :py:func:`hash_labware_def` has computed """
+    _labware_hashes.clear()
 
 
 def details_from_uri(uri: str, delimiter='/') -> local_types.UriDetails:
@@ -9,6 +9,7 @@ from pathlib import Path
 
 from dataclasses import asdict
 from opentrons import config
+from opentrons.config import feature_flags as ff
 from opentrons.types import Mount, Point
 
 from opentrons.protocols.api_support.constants import OPENTRONS_NAMESPACE
@@ -17,6 +18,7 @@ from opentrons.util.helpers import utc_now
 from . import (
     file_operators as io,
     types as local_types,
+    database,
     helpers,
     migration)
 
@@ -72,6 +74,10 @@ def add_existing_labware_to_index_file(
         definition: 'LabwareDefinition', parent: str = '', slot: str = ''):
     labware_hash = helpers.hash_labware_def(definition)
     uri = helpers.uri_from_definition(definition)
+    if ff.enable_calibration_database():
+        database.add_labware_to_index(
+            f'{labware_hash}{parent}', uri, parent, slot)
+        return
     _add_to_index_offset_file(parent, slot, uri, labware_hash)
 
 
@@ -94,11 +100,17 @@ def save_labware_calibration(
     [not yet implemented so it will currently only be an empty string]
     :param parent: parent of the labware, either a slot or a module.
     """
+    labware_hash = helpers.hash_labware_def(definition)
+    uri = helpers.uri_from_definition(definition)
+    if ff.enable_calibration_database():
+        database.save_labware_offset(
+            Path(labware_path).stem, uri, parent, slot,
+            lambda current: _update_offset_data(current, delta))
+        return
+
     offset_path =\
         config.get_opentrons_path('labware_calibration_offsets_dir_v2')
     labware_offset_path = offset_path / labware_path
-    labware_hash = helpers.hash_labware_def(definition)
-    uri = helpers.uri_from_definition(definition)
     _add_to_index_offset_file(parent, slot, uri, labware_hash)
     calibration_data = _helper_offset_data_format(
         str(labware_offset_path), delta)
@@ -161,6 +173,15 @@ def _save_custom_tiprack_definition(
 
 def _helper_offset_data_format(filepath: str, delta: Point) -> dict:
     if not Path(filepath).is_file():
+        return _update_offset_data(None, delta)
+    else:
+        return _update_offset_data(io.read_cal_file(filepath), delta)
+
+
+def _update_offset_data(
+        calibration_data: typing.Optional[typing.Dict],
+        delta: Point) -> typing.Dict:
+    if calibration_data is None:
         calibration_data = {
             "default": {
                 "offset": [delta.x, delta.y, delta.z],
@@ -168,7 +189,6 @@ def _helper_offset_data_format(filepath: str, delta: Point) -> dict:
             }
         }
     else:
-        calibration_data = io.read_cal_file(filepath)
         calibration_data['default']['offset'] = [delta.x, delta.y, delta.z]
         calibration_data['default']['lastModified'] =\
             utc_now()
@@ -199,6 +219,10 @@ def save_tip_length_calibration(
     :param tip_length_cal: results of the data created using
            :meth:`create_tip_length_data`
     """
+    if ff.enable_calibration_database():
+        database.save_tip_lengths(pip_id, tip_length_cal)
+        return
+
     tip_length_dir_path = config.get_tip_length_cal_path()
     tip_length_dir_path.mkdir(parents=True, exist_ok=True)
     pip_tip_length_path = tip_length_dir_path/f'{pip_id}.json'
@@ -222,9 +246,6 @@ def save_robot_deck_attitude(
         lw_hash: typing.Optional[str],
         source: local_types.SourceType = None,
         cal_status: local_types.CalibrationStatus = None):
-    robot_dir = config.get_opentrons_path('robot_calibration_dir')
-    robot_dir.mkdir(parents=True, exist_ok=True)
-    gantry_path = robot_dir/'deck_calibration.json'
     if cal_status:
         status = cal_status
     else:
@@ -240,6 +261,12 @@ def save_robot_deck_attitude(
         'source': source or local_types.SourceType.user,
         'status': status_dict
     }
+    if ff.enable_calibration_database():
+        database.save_deck_calibration(gantry_dict)
+        return
+    robot_dir = config.get_opentrons_path('robot_calibration_dir')
+    robot_dir.mkdir(parents=True, exist_ok=True)
+    gantry_path = robot_dir/'deck_calibration.json'
     io.save_to_file(gantry_path, gantry_dict)
 
 
@@ -265,16 +292,12 @@ def save_pipette_calibration(
         pip_id: str, mount: Mount,
         tiprack_hash: str, tiprack_uri: str,
         cal_status: local_types.CalibrationStatus = None):
-    pip_dir = config.get_opentrons_path(
-        'pipette_calibration_dir') / mount.name.lower()
-    pip_dir.mkdir(parents=True, exist_ok=True)
     if cal_status:
         status = cal_status
     else:
         status = local_types.CalibrationStatus()
     status_dict: 'CalibrationStatusDict' =\
         helpers.convert_to_dict(status)  # type: ignore
-    offset_path = pip_dir/f'{pip_id}.json'
     offset_dict: 'PipetteCalibrationData' = {
         'offset': [offset.x, offset.y, offset.z],
         'tiprack': tiprack_hash,
@@ -283,6 +306,13 @@ def save_pipette_calibration(
         'source': local_types.SourceType.user,
         'status': status_dict
     }
+    if ff.enable_calibration_database():
+        database.save_pipette_offset(pip_id, mount.name.lower(), offset_dict)
+        return
+    pip_dir = config.get_opentrons_path(
+        'pipette_calibration_dir') / mount.name.lower()
+    pip_dir.mkdir(parents=True, exist_ok=True)
+    offset_path = pip_dir/f'{pip_id}.json'
     io.save_to_file(offset_path, offset_dict)
     _add_to_pipette_offset_index_file(pip_id, mount)
 
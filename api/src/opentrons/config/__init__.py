@@ -202,6 +202,12 @@ CONFIG_ELEMENTS = (
                   Path('robot') / 'pipettes',
                   ConfigElementType.DIR,
                   'The dir where pipette calibration is stored'),
+    ConfigElement('calibration_database_file',
+                  'Calibration Database',
+                  Path('robot') / 'calibration.db',
+                  ConfigElementType.FILE,
+                  'The SQLite database where calibration is stored when the '
+                  'enableCalibrationDatabase feature flag is set'),
     ConfigElement('custom_tiprack_dir',
                   'Custom Tiprack Directory',
                   Path('tip_lengths') / 'custom_tiprack_definitions',
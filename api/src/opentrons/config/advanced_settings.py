@@ -187,6 +187,34 @@ settings = [
             "your protocols will break if you enable this setting."
         ),
         restart_required=False,
+    ),
+    SettingDefinition(
+        _id='enableCalibrationDatabase',
+        title='Store Calibration in a Database',
+        description='Keep labware, tip length, pipette offset and deck '
+                    'calibration in a single database file rather than in '
+                    'separate files. Calibration files are copied into the '
+                    'database when it is first used, and again whenever they '
+                    'have changed since. Calibration saved while this is on '
+                    'is not written back to the files, so it is lost if this '
+                    'is turned off again.',
+        restart_required=True,
+    ),
+    SettingDefinition(
+        _id='enableCorridorArcPlanning',
+        title='Plan Arcs Over Only the Slots They Cross',
+        description='Raise the pipette between labware only as high as the '
+                    'tallest item in the slots it passes over, rather than '
+                    'above the tallest item on the deck.',
+        restart_required=False,
+    ),
+    SettingDefinition(
+        _id='enableSmoothieStreaming',
+        title='Stream Motion Commands',
+        description='Queue motion commands in the motor controller rather '
+                    'than waiting for each move to finish before sending '
+                    'the next.',
+        restart_required=True,
     )
 ]
 
@@ -393,9 +421,40 @@ def _migrate8to9(previous: SettingsMap) -> SettingsMap:
     return newmap
 
 
+def _migrate9to10(previous: SettingsMap) -> SettingsMap:
+    """
+    Migration to version 10 of the feature flags file. Adds the
+    enableCalibrationDatabase config element.
+    """
+    newmap = {k: v for k, v in previous.items()}
+    newmap['enableCalibrationDatabase'] = None
+    return newmap
+
+
+def _migrate10to11(previous: SettingsMap) -> SettingsMap:
+    """
+    Migration to version 11 of the feature flags file. Adds the
+    enableCorridorArcPlanning config element.
+    """
+    newmap = {k: v for k, v in previous.items()}
+    newmap['enableCorridorArcPlanning'] = None
+    return newmap
+
+
+def _migrate11to12(previous: SettingsMap) -> SettingsMap:
+    """
+    Migration to version 12 of the feature flags file. Adds the
+    enableSmoothieStreaming config element.
+    """
+    newmap = {k: v for k, v in previous.items()}
+    newmap['enableSmoothieStreaming'] = None
+    return newmap
+
+
 _MIGRATIONS = [_migrate0to1, _migrate1to2, _migrate2to3, _migrate3to4,
                _migrate4to5, _migrate5to6, _migrate6to7, _migrate7to8,
-               _migrate8to9]
+               _migrate8to9, _migrate9to10, _migrate10to11,
+               _migrate11to12]
 """
 List of all migrations to apply, indexed by (version - 1). See _migrate below
 for how the migration functions are applied. Each migration function should
@@ -41,3 +41,15 @@ def enable_protocol_engine() -> bool:
     """Get if the ProtocolEngine should be used to run protocol files."""
 
     return advs.get_setting_with_env_overload("enableProtocolEngine")
+
+
+def enable_calibration_database() -> bool:
+    return advs.get_setting_with_env_overload('enableCalibrationDatabase')
+
+
+def enable_corridor_arc_planning() -> bool:
+    return advs.get_setting_with_env_overload('enableCorridorArcPlanning')
+
+
+def enable_smoothie_streaming() -> bool:
+    return advs.get_setting_with_env_overload('enableSmoothieStreaming')
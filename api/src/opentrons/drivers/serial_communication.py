@@ -1,7 +1,14 @@
 import serial  # type: ignore
 from serial.tools import list_ports  # type: ignore
+import asyncio
 import contextlib
 import logging
+import threading
+import time
+from typing import Dict, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .serial_recording import SerialRecorder, SerialReplayer
 
 log = logging.getLogger(__name__)
 
@@ -9,6 +16,22 @@ RECOVERY_TIMEOUT = 10
 DEFAULT_SERIAL_TIMEOUT = 5
 DEFAULT_WRITE_TIMEOUT = 30
 
+# see opentrons.drivers.serial_recording
+_recorder: Optional['SerialRecorder'] = None
+_replayer: Optional['SerialReplayer'] = None
+
+
+def install_recorder(recorder: Optional['SerialRecorder']):
+    '''Record every write_and_return exchange to recorder, or stop if None'''
+    global _recorder
+    _recorder = recorder
+
+
+def install_replayer(replayer: Optional['SerialReplayer']):
+    '''Connect to replayer's recording instead of hardware, or stop if None'''
+    global _replayer
+    _replayer = replayer
+
 
 class SerialNoResponse(Exception):
     pass
@@ -66,12 +89,12 @@ def _write_to_device_and_return(cmd, ack, device_connection, tag=None):
 
     encoded_write = cmd.encode()
     encoded_ack = ack.encode()
-    log.debug(f'{tag}: Write -> {encoded_write}')
+    log.debug('%s: Write -> %s', tag, encoded_write)
     device_connection.write(encoded_write)
     response = device_connection.read_until(encoded_ack)
-    log.debug(f'{tag}: Read <- {response}')
+    log.debug('%s: Read <- %s', tag, response)
     if encoded_ack not in response:
-        log.warning(f'{tag}: timed out after {device_connection.timeout}')
+        log.warning('%s: timed out after %s', tag, device_connection.timeout)
         raise SerialNoResponse(
             'No response from serial port after {} second(s)'.format(
                 device_connection.timeout))
@@ -106,18 +129,166 @@ def _attempt_command_recovery(command, ack, serial_conn, tag=None):
     return response
 
 
+class _PendingExchange:
+    '''The response to a write_and_return_async, as it arrives.
+
+    The reader callback runs in the event loop while finish_blocking may run
+    in another thread, so the buffer and the completion state are only
+    touched with the lock held.
+    '''
+
+    def __init__(self, loop, connection, ack, timeout):
+        self.loop = loop
+        self.connection = connection
+        self.ack = ack
+        self.deadline = time.monotonic() + timeout
+        self.buffer = bytearray()
+        self.future = loop.create_future()
+        self.lock = threading.Lock()
+        self.finished = False
+
+    def _resolve(self, response):
+        if not self.future.done():
+            self.future.set_result(response)
+
+    def on_readable(self):
+        # if another thread holds the lock it is finishing the exchange
+        # itself, and the event loop must not wait for it
+        if not self.lock.acquire(blocking=False):
+            return
+        try:
+            if self.finished:
+                return
+            try:
+                self.buffer += self.connection.read(
+                    self.connection.in_waiting or 1)
+            except Exception as e:
+                self.finished = True
+                self.future.set_exception(e)
+                return
+            if self.ack in self.buffer:
+                self.finished = True
+                self._resolve(bytes(self.buffer))
+        finally:
+            self.lock.release()
+
+    def finish_blocking(self):
+        '''Read the rest of the response synchronously, so the connection
+        can be used for something else'''
+        with self.lock:
+            if self.finished:
+                return
+            self.finished = True
+            while self.ack not in self.buffer:
+                remaining = self.deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                with serial_with_temp_timeout(self.connection, remaining):
+                    data = self.connection.read(
+                        self.connection.in_waiting or 1)
+                if not data:
+                    break
+                self.buffer += data
+            response = bytes(self.buffer)
+        self.loop.call_soon_threadsafe(self._resolve, response)
+
+    def received(self):
+        '''What has arrived so far'''
+        with self.lock:
+            self.finished = True
+            return bytes(self.buffer)
+
+
+# async exchanges waiting for a response, by id of their connection
+_pending: Dict[int, _PendingExchange] = {}
+
+
+def _finish_pending(serial_connection):
+    exchange = _pending.pop(id(serial_connection), None)
+    if exchange:
+        exchange.finish_blocking()
+
+
+def _record(recorder, serial_connection, command, response, started):
+    recorder.record_exchange(
+        serial_connection.port, command, response,
+        started, time.monotonic() - started)
+
+
 def write_and_return(
         command, ack, serial_connection,
         timeout=DEFAULT_WRITE_TIMEOUT, tag=None):
     '''Write a command and return the response'''
+    _finish_pending(serial_connection)
     clear_buffer(serial_connection)
-    with serial_with_temp_timeout(
-            serial_connection, timeout) as device_connection:
-        response = _write_to_device_and_return(
-            command, ack, device_connection, tag)
+    recorder = _recorder
+    if recorder:
+        started = time.monotonic()
+    try:
+        with serial_with_temp_timeout(
+                serial_connection, timeout) as device_connection:
+            response = _write_to_device_and_return(
+                command, ack, device_connection, tag)
+    except SerialNoResponse:
+        if recorder:
+            _record(recorder, serial_connection, command, None, started)
+        raise
+    if recorder:
+        _record(recorder, serial_connection, command, response, started)
     return response
 
 
+async def write_and_return_async(
+        command, ack, serial_connection,
+        timeout=DEFAULT_WRITE_TIMEOUT, tag=None):
+    '''Write a command and return the response without blocking the event
+    loop while the device answers.
+
+    The response is read by a reader callback on the running loop. A
+    write_and_return on the same connection while this is waiting finishes
+    reading this response first, so the two never interleave.
+    '''
+    if _replayer:
+        # replayed connections answer on the read, not through the fd
+        return write_and_return(
+            command, ack, serial_connection, timeout, tag)
+    _finish_pending(serial_connection)
+    clear_buffer(serial_connection)
+    if not tag:
+        tag = serial_connection.port
+    loop = asyncio.get_event_loop()
+    encoded_ack = ack.encode()
+    exchange = _PendingExchange(loop, serial_connection, encoded_ack, timeout)
+    fd = serial_connection.fileno()
+    recorder = _recorder
+    started = time.monotonic()
+    log.debug('%s: Write -> %s', tag, command.encode())
+    serial_connection.write(command.encode())
+    _pending[id(serial_connection)] = exchange
+    loop.add_reader(fd, exchange.on_readable)
+    try:
+        response = await asyncio.wait_for(exchange.future, timeout)
+    except asyncio.TimeoutError:
+        response = exchange.received()
+    finally:
+        loop.remove_reader(fd)
+        if _pending.get(id(serial_connection)) is exchange:
+            del _pending[id(serial_connection)]
+    log.debug('%s: Read <- %s', tag, response)
+    if encoded_ack not in response:
+        log.warning('%s: timed out after %s', tag, timeout)
+        if recorder:
+            _record(recorder, serial_connection, command, None, started)
+        raise SerialNoResponse(
+            'No response from serial port after {} second(s)'.format(
+                timeout))
+    clean_response = _parse_serial_response(response, encoded_ack)
+    result = clean_response.decode() if clean_response else ''
+    if recorder:
+        _record(recorder, serial_connection, command, result, started)
+    return result
+
+
 def connect(device_name=None, port=None, baudrate=115200):
     '''
     Creates a serial connection
@@ -125,7 +296,13 @@ def connect(device_name=None, port=None, baudrate=115200):
     :param baudrate: integer frequency for serial communication
     :return: serial.Serial connection
     '''
-    if not port:
-        port = get_ports_by_name(device_name=device_name)[0]
-    log.debug("Device name: {}, Port: {}".format(device_name, port))
-    return _connect(port_name=port, baudrate=baudrate)
+    if _replayer:
+        connection = _replayer.connect(device_name, port, baudrate)
+    else:
+        if not port:
+            port = get_ports_by_name(device_name=device_name)[0]
+        log.debug("Device name: {}, Port: {}".format(device_name, port))
+        connection = _connect(port_name=port, baudrate=baudrate)
+    if _recorder:
+        _recorder.record_connect(connection.port, device_name, baudrate)
+    return connection
@@ -0,0 +1,271 @@
+"""
+Recording and deterministic replay of serial traffic.
+
+A :py:class:`SerialRecorder` captures every exchange that goes through
+:py:func:`.serial_communication.write_and_return` - the bytes written, the
+response (or the lack of one) and how long the device took to answer - along
+with the ports that were connected. Every serial driver (smoothie, temp deck,
+mag deck and thermocycler) sends its commands that way, so one recording
+covers a whole robot.
+
+A :py:class:`SerialReplayer` serves a recording back. While it is installed,
+:py:func:`.serial_communication.connect` hands out :py:class:`ReplaySerial`
+connections that answer each write with the recorded response, optionally
+with the recorded timing, so the drivers run exactly as they did against
+hardware. Recording while replaying produces a new log that can be compared
+exchange for exchange with the original.
+
+The log is a text file with one JSON array per line, gzipped if the file
+name ends in ``.gz``::
+
+    ["c", <seconds since start>, <port>, <device name>, <baudrate>]
+    ["x", <seconds since start>, <port>, <command>, <response>, <duration>]
+
+where a response of ``null`` means the device did not answer.
+"""
+import collections
+import gzip
+import json
+import logging
+import os
+import threading
+import time
+from typing import (
+    Any, Deque, Dict, IO, Iterator, List, NamedTuple, Optional)
+
+from . import serial_communication
+
+
+log = logging.getLogger(__name__)
+
+CONNECT = 'c'
+EXCHANGE = 'x'
+
+
+class SerialReplayError(Exception):
+    pass
+
+
+class Exchange(NamedTuple):
+    at: float
+    port: str
+    command: str
+    response: Optional[str]
+    duration: float
+
+
+def _open_log(path: str, mode: str) -> IO[str]:
+    if path.endswith('.gz'):
+        return gzip.open(path, mode + 't', encoding='utf-8')  # type: ignore
+    return open(path, mode, encoding='utf-8')
+
+
+def read_recording(path: str) -> Iterator[List[Any]]:
+    """ Iterate over the raw entries of a recording """
+    with _open_log(path, 'r') as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def read_exchanges(path: str) -> Iterator[Exchange]:
+    """ Iterate over the command/response exchanges of a recording """
+    for entry in read_recording(path):
+        if entry[0] == EXCHANGE:
+            yield Exchange(*entry[1:])
+
+
+class SerialRecorder:
+    """ Records serial traffic to a file while installed.
+
+    Use as a context manager, or call :py:meth:`start` and :py:meth:`stop`.
+    """
+
+    def __init__(self, path: str) -> None:
+        self._path = path
+        self._file: Optional[IO[str]] = None
+        self._lock = threading.Lock()
+        self._start = 0.0
+
+    def start(self) -> 'SerialRecorder':
+        self._file = _open_log(self._path, 'w')
+        self._start = time.monotonic()
+        serial_communication.install_recorder(self)
+        return self
+
+    def stop(self) -> None:
+        serial_communication.install_recorder(None)
+        with self._lock:
+            if self._file:
+                self._file.close()
+                self._file = None
+
+    def __enter__(self) -> 'SerialRecorder':
+        return self.start()
+
+    def __exit__(self, *args) -> None:
+        self.stop()
+
+    def _write(self, entry: List[Any]) -> None:
+        line = json.dumps(entry, separators=(',', ':'))
+        with self._lock:
+            if self._file:
+                self._file.write(line + '\n')
+
+    def record_connect(
+            self, port: str, device_name: Optional[str],
+            baudrate: int) -> None:
+        self._write([CONNECT, round(time.monotonic() - self._start, 6),
+                     port, device_name, baudrate])
+
+    def record_exchange(
+            self, port: str, command: str, response: Optional[str],
+            started: float, duration: float) -> None:
+        self._write([EXCHANGE, round(started - self._start, 6), port,
+                     command, response, round(duration, 6)])
+
+
+class ReplaySerial:
+    """ A stand-in for a :py:class:`serial.Serial` that answers each write
+    with the next exchange recorded for its port. """
+
+    def __init__(self, replayer: 'SerialReplayer', port: str,
+                 baudrate: int) -> None:
+        self.port = port
+        self.baudrate = baudrate
+        self.timeout: Optional[float] = serial_communication\
+            .DEFAULT_SERIAL_TIMEOUT
+        self.is_open = True
+        self._replayer = replayer
+        self._pending: Optional[Exchange] = None
+        # something that select and poll can wait on, for drivers that
+        # watch the connection for unsolicited messages
+        self._wake_read, self._wake_write = os.pipe()
+
+    def __repr__(self) -> str:
+        return f'<ReplaySerial {self.port}>'
+
+    def __del__(self) -> None:
+        os.close(self._wake_read)
+        os.close(self._wake_write)
+
+    def fileno(self) -> int:
+        return self._wake_read
+
+    def open(self) -> None:
+        self.is_open = True
+
+    def close(self) -> None:
+        self.is_open = False
+
+    def isOpen(self) -> bool:
+        return self.is_open
+
+    @property
+    def in_waiting(self) -> int:
+        return 0
+
+    def reset_input_buffer(self) -> None:
+        pass
+
+    def flush(self) -> None:
+        pass
+
+    def write(self, data: bytes) -> int:
+        self._pending = self._replayer.next_exchange(
+            self.port, data.decode())
+        return len(data)
+
+    def read_until(self, expected: bytes = b'\n') -> bytes:
+        exchange, self._pending = self._pending, None
+        if exchange is None:
+            return b''
+        self._replayer.wait(exchange.duration)
+        if exchange.response is None:
+            return b''
+        # the recording holds the parsed response, without the ack
+        return exchange.response.encode() + expected
+
+
+class SerialReplayer:
+    """ Serves a recording back to drivers while installed.
+
+    :param path: The recording to replay
+    :param time_scale: Multiplier on the recorded response times. 1 replays
+                       with the recorded timing, 0 answers immediately.
+    :param strict: If True, a driver writing anything other than what was
+                   recorded raises :py:class:`SerialReplayError`. Otherwise
+                   the mismatch is logged and counted, and the recorded
+                   response is returned anyway.
+    """
+
+    def __init__(self, path: str,
+                 time_scale: float = 0.0, strict: bool = True) -> None:
+        self.time_scale = time_scale
+        self.strict = strict
+        self.mismatches: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+        self._exchanges: Dict[str, Deque[Exchange]] = \
+            collections.defaultdict(collections.deque)
+        self._ports_by_device: Dict[Optional[str], str] = {}
+        for entry in read_recording(path):
+            if entry[0] == CONNECT:
+                _, _, port, device_name, _ = entry
+                self._ports_by_device.setdefault(device_name, port)
+            elif entry[0] == EXCHANGE:
+                exchange = Exchange(*entry[1:])
+                self._exchanges[exchange.port].append(exchange)
+
+    def start(self) -> 'SerialReplayer':
+        serial_communication.install_replayer(self)
+        return self
+
+    def stop(self) -> None:
+        serial_communication.install_replayer(None)
+
+    def __enter__(self) -> 'SerialReplayer':
+        return self.start()
+
+    def __exit__(self, *args) -> None:
+        self.stop()
+
+    def remaining(self) -> Dict[str, int]:
+        """ The number of recorded exchanges not yet replayed, by port """
+        with self._lock:
+            return {port: len(exchanges)
+                    for port, exchanges in self._exchanges.items()
+                    if exchanges}
+
+    def connect(self, device_name: Optional[str], port: Optional[str],
+                baudrate: int) -> ReplaySerial:
+        if not port:
+            try:
+                port = self._ports_by_device[device_name]
+            except KeyError:
+                raise SerialReplayError(
+                    f'No connection to {device_name} in the recording')
+        return ReplaySerial(self, port, baudrate)
+
+    def next_exchange(self, port: str, command: str) -> Exchange:
+        with self._lock:
+            try:
+                exchange = self._exchanges[port].popleft()
+            except IndexError:
+                raise SerialReplayError(
+                    f'{port}: wrote {command!r} past the end of the recording')
+        if exchange.command != command:
+            mismatch = {'port': port,
+                        'expected': exchange.command,
+                        'actual': command}
+            self.mismatches.append(mismatch)
+            if self.strict:
+                raise SerialReplayError(
+                    f'{port}: wrote {command!r} but the recording has '
+                    f'{exchange.command!r}')
+            log.warning(f'{port}: wrote {command!r}, recorded '
+                        f'{exchange.command!r}')
+        return exchange
+
+    def wait(self, duration: float) -> None:
+        if self.time_scale and duration:
+            time.sleep(duration * self.time_scale)
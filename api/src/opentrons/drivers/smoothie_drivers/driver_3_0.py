@@ -2,9 +2,11 @@ import asyncio
 import contextlib
 from os import environ
 import logging
+import re
 from time import sleep, time
 from threading import Event, RLock
-from typing import Any, Dict, Optional, Union, List, Tuple, cast
+from typing import (
+    Any, Dict, FrozenSet, Optional, Union, List, Tuple, cast)
 
 from math import isclose
 from serial.serialutil import SerialException  # type: ignore
@@ -114,6 +116,26 @@ GCODE_ROUNDING_PRECISION = 3
 SMOOTHIE_COMMAND_TERMINATOR = '\r\n\r\n'
 SMOOTHIE_ACK = 'ok\r\nok\r\n'
 
+# Streaming mode: gcodes that only append to smoothie's planner queue, and so
+# can follow in-flight moves without first waiting for them to finish
+PLANNER_GCODES = frozenset((
+    GCODES['MOVE'], GCODES['DWELL'],
+    GCODES['ABSOLUTE_COORDS'], GCODES['RELATIVE_COORDS']))
+# gcodes that take effect immediately and return no data. They need the
+# planner to be empty before they are sent, but do not need an M400 after
+STREAMABLE_GCODES = PLANNER_GCODES | frozenset((
+    GCODES['SET_CURRENT'], GCODES['SET_MAX_SPEED'],
+    GCODES['ACCELERATION'].split(' ')[0], GCODES['STEPS_PER_MM'],
+    *(codes[state]
+      for codes in MICROSTEPPING_GCODES.values()
+      for state in ('ENABLE', 'DISABLE'))))
+# Number of streamed commands to allow in flight before syncing with an M400
+DEFAULT_STREAMING_QUEUE_DEPTH = 8
+
+_GCODE_RE = re.compile(r'(?:^|\s)([GM]\d+(?:\.\d+)?)')
+_GCODE_GROUP_START_RE = re.compile(r'[GM]\d')
+_SET_SPEED_RE = re.compile(r'^' + GCODES['SET_SPEED'] + r'[\d.]+$')
+
 
 class SmoothieError(Exception):
     def __init__(self, ret_code: str = None, command: str = None) -> None:
@@ -159,6 +181,101 @@ class ParseError(Exception):
     pass
 
 
+def _parse_gcodes(command: str) -> FrozenSet[str]:
+    """
+    Returns the set of gcodes (e.g. 'G0', 'M907', 'M203.1') present in a
+    command string, ignoring their arguments
+    """
+    return frozenset(_GCODE_RE.findall(command))
+
+
+class _BoardState:
+    """
+    The driver's model of the settings smoothie is currently running with,
+    as last acknowledged by the board. Anything not in the model is unknown,
+    and so will always be sent.
+    """
+    def __init__(self) -> None:
+        self.current: Dict[str, float] = {}
+        self.max_speed: Dict[str, float] = {}
+        self.acceleration: Dict[str, float] = {}
+        self.feedrate: Optional[str] = None
+
+    def copy(self) -> '_BoardState':
+        other = _BoardState()
+        other.current = self.current.copy()
+        other.max_speed = self.max_speed.copy()
+        other.acceleration = self.acceleration.copy()
+        other.feedrate = self.feedrate
+        return other
+
+
+def _split_gcode_groups(command: str) -> List[List[str]]:
+    """
+    Split a command line into groups of a gcode followed by its arguments,
+    e.g. 'M907 X1 Y2 G4P0.005' -> [['M907', 'X1', 'Y2'], ['G4P0.005']]
+    """
+    groups: List[List[str]] = []
+    for token in command.split():
+        if not groups or _GCODE_GROUP_START_RE.match(token):
+            groups.append([token])
+        else:
+            groups[-1].append(token)
+    return groups
+
+
+def _parse_group_settings(group: List[str]) -> Dict[str, float]:
+    """ Parse the 'X1.5'-style arguments of a gcode group """
+    return {arg[0]: float(arg[1:]) for arg in group[1:]}
+
+
+def _elide_redundant_state(
+        command: str, state: _BoardState) -> Tuple[str, _BoardState]:
+    """
+    Remove the parts of a command that would only set smoothie to a state it
+    is already in: current (and the dwell that lets it settle), feedrate,
+    max speed and acceleration settings that match `state`.
+
+    Returns the command to send (which may be empty) and the state smoothie
+    will be in once it has acknowledged that command.
+    """
+    new_state = state.copy()
+    settings_for = {
+        GCODES['SET_CURRENT']: new_state.current,
+        GCODES['SET_MAX_SPEED']: new_state.max_speed,
+        GCODES['ACCELERATION'].split(' ')[0]: new_state.acceleration,
+    }
+    current_delay = GCODES['DWELL'] + 'P' + str(CURRENT_CHANGE_DELAY)
+    kept: List[str] = []
+    elided_current = False
+    for group in _split_gcode_groups(command):
+        code = group[0]
+        if elided_current and group == [current_delay]:
+            # no need to let an unchanged current settle
+            continue
+        elided_current = False
+        if code in settings_for:
+            try:
+                settings = _parse_group_settings(group)
+            except (ValueError, IndexError):
+                # unexpected arguments; send them and forget what we know
+                settings_for[code].clear()
+                kept.extend(group)
+                continue
+            known = settings_for[code]
+            if settings and all(
+                    known.get(key) == val for key, val in settings.items()):
+                elided_current = code == GCODES['SET_CURRENT']
+                continue
+            known.update(settings)
+        elif _SET_SPEED_RE.match(code) and len(group) == 1:
+            if code == new_state.feedrate:
+                continue
+            new_state.feedrate = code
+        kept.extend(group)
+    return ' '.join(kept), new_state
+
+
 def _parse_number_from_substring(smoothie_substring):
     """
     Returns the number in the expected string "N:12.3", where "N" is the
@@ -296,7 +413,9 @@ class SmoothieDriver_3_0_0:
             self,
             config: RobotConfig,
             gpio_chardev: GPIODriverLike = None,
-            handle_locks: bool = True):
+            handle_locks: bool = True,
+            streaming: bool = False,
+            streaming_queue_depth: int = DEFAULT_STREAMING_QUEUE_DEPTH):
         self.run_flag = Event()
         self.run_flag.set()
 
@@ -398,6 +517,18 @@ class SmoothieDriver_3_0_0:
         #: Cache of currently configured splits from callers
         self._axes_moved_at = AxisMoveTimestamp(AXES)
 
+        # Streaming mode: when enabled, motion commands are not each followed
+        # by an M400. Instead they are acked as smoothie queues them in its
+        # planner, and tracked here (with their execute timeouts) until the
+        # next command that needs a settled machine syncs them all at once.
+        self._streaming = streaming
+        self._streaming_queue_depth = max(1, streaming_queue_depth)
+        self._pending_commands: List[Tuple[str, float]] = []
+
+        # What smoothie is currently set to, so that commands which would not
+        # change its currents, speeds or acceleration are not sent at all
+        self._board_state = _BoardState()
+
     @property
     def gpio_chardev(self):
         return self._gpio_chardev
@@ -410,6 +541,41 @@ class SmoothieDriver_3_0_0:
     def homed_position(self) -> Dict[str, float]:
         return self._homed_position.copy()
 
+    @property
+    def streaming(self) -> bool:
+        """
+        Whether motion commands are streamed into smoothie's planner queue
+        rather than each being followed by a blocking M400. Commands that
+        need a settled machine (homing, probing, position and switch reads,
+        pipette memory access, current and speed changes) always wait for
+        streamed commands to finish first.
+        """
+        return self._streaming
+
+    @streaming.setter
+    def streaming(self, enabled: bool):
+        if not enabled:
+            self.wait_for_moves()
+        self._streaming = enabled
+
+    @contextlib.contextmanager
+    def streaming_moves(self):
+        """ Enable streaming mode for the duration of the context """
+        was_streaming = self._streaming
+        self.streaming = True
+        try:
+            yield
+        finally:
+            self.streaming = was_streaming
+
+    def wait_for_moves(self):
+        """
+        Block until every command streamed to smoothie has finished executing.
+        Does nothing if no commands are in flight.
+        """
+        if self._streaming:
+            self._send_command(GCODES['WAIT'])
+
     @property
     def axis_bounds(self) -> Dict[str, float]:
         bounds = {k: v for k, v in self._homed_position.items()}
@@ -593,6 +759,8 @@ class SmoothieDriver_3_0_0:
         if self.is_connected():
             self._connection.close()  # type: ignore
         self._connection = None
+        self._pending_commands.clear()
+        self._board_state = _BoardState()
         self.simulating = True
 
     def is_connected(self) -> bool:
@@ -982,10 +1150,13 @@ class SmoothieDriver_3_0_0:
         if not self.simulating:
             sleep(DEFAULT_STABILIZE_DELAY)
         log.debug("reset_from_error")
+        # anything still streamed to the planner was flushed by the error,
+        # and we can no longer be sure what settings smoothie is running with
+        self._pending_commands.clear()
+        self._board_state = _BoardState()
         self._send_command(GCODES['RESET_FROM_ERROR'])
         self.update_homed_flags()
 
-    # Potential place for command optimization (buffering, flushing, etc)
     def _send_command(
             self,
             command: str,
@@ -995,9 +1166,11 @@ class SmoothieDriver_3_0_0:
             suppress_home_after_error: bool = False):
         """
         Submit a GCODE command to the robot, followed by M400 to block until
-        done. This method also ensures that any command on the B or C axis
-        (the axis for plunger control) do current ramp-up and ramp-down, so
-        that plunger motors rest at a low current to prevent burn-out.
+        done. In streaming mode, the M400 is deferred for commands that only
+        queue motion (see :py:attr:`streaming`). This method also ensures that
+        any command on the B or C axis (the axis for plunger control) do
+        current ramp-up and ramp-down, so that plunger motors rest at a low
+        current to prevent burn-out.
 
         In the case of a limit-switch alarm during any command other than home,
         the robot should home the axis from the alarm and then raise a
@@ -1042,26 +1215,103 @@ class SmoothieDriver_3_0_0:
             # is locking at a higher level like in APIv2.
             self._reset_from_error()
             error_axis = se.ret_code.strip()[-1]
+            # errors from streamed commands surface when they are synced,
+            # which may be while sending a later command
+            failed_command = se.command or command
             if not suppress_error_msg:
                 log.warning(
-                        f"alarm/error: command={command}, resp={se.ret_code}")
-            if (GCODES['MOVE'] in command or GCODES['PROBE'] in command)\
+                        f"alarm/error: command={failed_command}, "
+                        f"resp={se.ret_code}")
+            if (GCODES['MOVE'] in failed_command
+                    or GCODES['PROBE'] in failed_command)\
                and not suppress_home_after_error:
                 if error_axis not in 'XYZABC':
                     error_axis = AXES
                 log.info("Homing after alarm/error")
                 self.home(error_axis)
-            raise SmoothieError(se.ret_code, command)
+            raise SmoothieError(se.ret_code, failed_command)
 
     def _send_command_unsynchronized(self,
                                      command: str,
                                      ack_timeout: float,
                                      execute_timeout: float):
+        original_command = command
+        command, new_state = _elide_redundant_state(
+            command, self._board_state)
+        if original_command.strip() and not command:
+            log.debug(f"skipping redundant command: {original_command}")
+            return ''
+        sent_with = self._board_state
+        if self._streaming:
+            cmd_ret = self._stream_command(
+                command, ack_timeout, execute_timeout, original_command)
+        else:
+            cmd_ret = self._write_and_check(
+                command, ack_timeout, original_command)
+            self._wait_for_idle(execute_timeout)
+        if self._board_state is not sent_with:
+            # a retry forgot the board state and re-sent the full command,
+            # so only what that command set is known
+            _, new_state = _elide_redundant_state(
+                original_command, self._board_state)
+        self._board_state = new_state
+        return cmd_ret
+
+    def _stream_command(self,
+                        command: str,
+                        ack_timeout: float,
+                        execute_timeout: float,
+                        full_command: Optional[str] = None):
+        """
+        Send a command in streaming mode. Commands that only add to the
+        planner queue are sent right behind any in-flight commands. Anything
+        else first waits for in-flight commands to finish. Commands without
+        a response are then left in flight, and are synced once
+        `_streaming_queue_depth` of them are outstanding.
+        """
+        gcodes = _parse_gcodes(command)
+        if gcodes == {GCODES['WAIT']}:
+            # an explicit wait is exactly a sync of what is in flight
+            self._flush_pending_commands()
+            return ''
+        if not gcodes or not gcodes <= PLANNER_GCODES:
+            self._flush_pending_commands()
+        cmd_ret = self._write_and_check(command, ack_timeout, full_command)
+        if gcodes and gcodes <= STREAMABLE_GCODES:
+            self._pending_commands.append((command, execute_timeout))
+            if len(self._pending_commands) >= self._streaming_queue_depth:
+                self._flush_pending_commands()
+        else:
+            self._wait_for_idle(execute_timeout)
+        return cmd_ret
+
+    def _flush_pending_commands(self):
+        """ Wait for all streamed commands to finish executing """
+        if not self._pending_commands:
+            return
+        pending = self._pending_commands
+        self._pending_commands = []
+        try:
+            self._wait_for_idle(sum(timeout for _, timeout in pending))
+        except SmoothieError as se:
+            raise SmoothieError(
+                se.ret_code, ' '.join(cmd for cmd, _ in pending))
+
+    def _write_and_check(self, command: str, ack_timeout: float,
+                         full_command: Optional[str] = None) -> str:
+        """ Write a command, wait for its ack and check it for errors.
+        If the command had redundant settings removed, full_command is the
+        command with them, to send instead on a retry. """
         cmd_ret = self._write_with_retries(
             command + SMOOTHIE_COMMAND_TERMINATOR,
-            ack_timeout, DEFAULT_COMMAND_RETRIES)
+            ack_timeout, DEFAULT_COMMAND_RETRIES,
+            full_command and full_command + SMOOTHIE_COMMAND_TERMINATOR)
         cmd_ret = self._remove_unwanted_characters(command, cmd_ret)
         self._handle_return(cmd_ret)
+        return cmd_ret.strip()
+
+    def _wait_for_idle(self, execute_timeout: float):
+        """ Send an M400 and block until smoothie has finished all motion """
         wait_ret = serial_communication.write_and_return(
             GCODES['WAIT'] + SMOOTHIE_COMMAND_TERMINATOR,
             SMOOTHIE_ACK, self._connection, timeout=execute_timeout,
@@ -1069,7 +1319,6 @@ class SmoothieDriver_3_0_0:
         wait_ret = self._remove_unwanted_characters(
             GCODES['WAIT'], wait_ret)
         self._handle_return(wait_ret)
-        return cmd_ret.strip()
 
     def _handle_return(self, ret_code: str):
         """ Check the return string from smoothie for an error condition.
@@ -1132,7 +1381,8 @@ class SmoothieDriver_3_0_0:
 
         return modified_response
 
-    def _write_with_retries(self, cmd: str, timeout: float, retries: int):
+    def _write_with_retries(self, cmd: str, timeout: float, retries: int,
+                            full_cmd: Optional[str] = None):
         for attempt in range(retries):
             try:
                 ret = serial_communication.write_and_return(
@@ -1146,6 +1396,11 @@ class SmoothieDriver_3_0_0:
                         f"required {attempt} retries for {cmd.strip()}")
                 return ret
             except serial_communication.SerialNoResponse:
+                # the command may or may not have been received, so the
+                # board state is unknown and any settings elided from the
+                # command must be sent again
+                self._board_state = _BoardState()
+                cmd = full_cmd or cmd
                 if not self.simulating:
                     sleep(DEFAULT_STABILIZE_DELAY)
                 if self._connection:
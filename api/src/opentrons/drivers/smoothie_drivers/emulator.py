@@ -0,0 +1,438 @@
+"""
+A Smoothieboard emulator on a pseudo-terminal.
+
+Unlike the simulating modes of the driver and of the hardware controller,
+which never touch a serial port, this lets the real serial path
+(:py:mod:`opentrons.drivers.serial_communication`,
+:py:class:`.SmoothieDriver_3_0_0` and the hardware controller's
+``Controller`` backend) run against something that speaks the subset of
+G-code the driver uses, with configurable command latency and motion timing.
+It is meant for benchmarking and load testing that path without a robot.
+
+In process::
+
+    with SmoothieEmulator(command_latency=0.001) as emulator:
+        driver = SmoothieDriver_3_0_0(robot_configs.load())
+        driver.connect(emulator.port)
+
+or standalone, printing the port to connect to::
+
+    python -m opentrons.drivers.smoothie_drivers.emulator --latency 0.001
+
+Passing ``--bench N`` instead runs N moves through a real driver connected
+to the emulator and reports the command rate.
+"""
+import argparse
+import logging
+import math
+import os
+import re
+import select
+import threading
+import time
+import tty
+from typing import Dict, List, Optional, Tuple
+
+from opentrons.config import robot_configs
+from . import HOMED_POSITION
+
+
+log = logging.getLogger(__name__)
+
+AXES = 'XYZABC'
+SEC_PER_MIN = 60
+
+DEFAULT_FIRMWARE_VERSION = 'edge-8414642'
+DEFAULT_FEEDRATE = 400 * SEC_PER_MIN  # mm/min
+DEFAULT_PROBE_FEEDRATE = 420  # mm/min
+
+_CODE_RE = re.compile(r'([GM]\d+(?:\.\d+)?)')
+_ARG_RE = re.compile(r'([A-Z])(-?\d+(?:\.\d+)?)')
+
+
+def _trapezoid_time(distance: float, speed: float, accel: float) -> float:
+    """ Time to travel a distance from rest to rest, accelerating to at
+    most `speed` """
+    if distance <= 0 or speed <= 0:
+        return 0.0
+    if accel <= 0:
+        return distance / speed
+    accel_distance = speed * speed / accel
+    if distance >= accel_distance:
+        return distance / speed + speed / accel
+    return 2 * math.sqrt(distance / accel)
+
+
+def _parse_args(text: str) -> Dict[str, float]:
+    return {ax: float(val) for ax, val in _ARG_RE.findall(text)}
+
+
+class SmoothieEmulator:
+    """ Emulates a Smoothieboard running Opentrons firmware on a pty.
+
+    Commands are acknowledged the way the board does it: one ``ok`` per
+    line, with moves and dwells acked as soon as they are queued in the
+    planner, and homes, probes and ``M400`` only acked once the planner has
+    finished all queued motion.
+
+    :param command_latency: Seconds to wait before answering each command,
+                            to model the board's processing and transfer
+                            time.
+    :param time_scale: Multiplier on emulated motion time. 1 moves in real
+                       time, 0 makes all motion instantaneous.
+    :param firmware_version: The version reported to the ``version`` query.
+    :param pipettes: Pipette memory by mount letter (``'L'`` or ``'R'``), as
+                     ``{'id': ..., 'model': ...}``. Mounts not listed report
+                     no instrument.
+    """
+
+    def __init__(self,
+                 command_latency: float = 0.0,
+                 time_scale: float = 1.0,
+                 firmware_version: str = DEFAULT_FIRMWARE_VERSION,
+                 pipettes: Dict[str, Dict[str, str]] = None) -> None:
+        self.command_latency = command_latency
+        self.time_scale = time_scale
+        self.firmware_version = firmware_version
+        self._pipettes = {mount: dict(memory)
+                          for mount, memory in (pipettes or {}).items()}
+
+        self._master: Optional[int] = None
+        self._slave: Optional[int] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+        self.command_count = 0
+        self.bytes_received = 0
+        self.bytes_sent = 0
+        self._started_at: Optional[float] = None
+        self.reset_board()
+
+    def reset_board(self) -> None:
+        """ Return the emulated board to its power-on state """
+        self.position = {ax: 0.0 for ax in AXES}
+        self.homed_position = dict(HOMED_POSITION)
+        self.homed = {ax: False for ax in AXES}
+        self.engaged = {ax: True for ax in AXES}
+        self.current: Dict[str, float] = {ax: 0.0 for ax in AXES}
+        self.max_speed: Dict[str, float] = {
+            ax: float(speed)  # type: ignore
+            for ax, speed in robot_configs.DEFAULT_MAX_SPEEDS.items()}
+        self.acceleration = dict(robot_configs.DEFAULT_ACCELERATION)
+        self.steps_per_mm: Dict[str, float] = {}
+        self.feedrate = float(DEFAULT_FEEDRATE)
+        self.relative = False
+        self._busy_until = time.monotonic()
+
+    @property
+    def port(self) -> str:
+        """ The path of the serial port to connect the driver to """
+        assert self._slave is not None, 'emulator is not started'
+        return os.ttyname(self._slave)
+
+    def start(self) -> 'SmoothieEmulator':
+        self._master, self._slave = os.openpty()
+        # no echo or line discipline, like a real uart
+        tty.setraw(self._slave)
+        self._stop.clear()
+        self._started_at = time.monotonic()
+        self._thread = threading.Thread(
+            target=self._run, name='smoothie-emulator', daemon=True)
+        self._thread.start()
+        log.info(f"Smoothie emulator listening on {self.port}")
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+        for fd in (self._master, self._slave):
+            if fd is not None:
+                os.close(fd)
+        self._master = self._slave = None
+
+    def __enter__(self) -> 'SmoothieEmulator':
+        return self.start()
+
+    def __exit__(self, *args) -> None:
+        self.stop()
+
+    def stats(self) -> Dict[str, float]:
+        """ Traffic counters since the emulator was started """
+        elapsed = time.monotonic() - (self._started_at or time.monotonic())
+        return {
+            'commands': self.command_count,
+            'bytes_received': self.bytes_received,
+            'bytes_sent': self.bytes_sent,
+            'elapsed': elapsed,
+            'commands_per_second':
+                self.command_count / elapsed if elapsed else 0.0,
+        }
+
+    # ----------- I/O --------------- #
+
+    def _run(self) -> None:
+        assert self._master is not None
+        buf = b''
+        while not self._stop.is_set():
+            readable, _, _ = select.select([self._master], [], [], 0.05)
+            if not readable:
+                continue
+            try:
+                data = os.read(self._master, 4096)
+            except OSError:
+                # the other end is not open right now
+                self._stop.wait(0.05)
+                continue
+            self.bytes_received += len(data)
+            buf += data
+            while b'\n' in buf:
+                raw, buf = buf.split(b'\n', 1)
+                line = raw.decode(errors='replace').strip()
+                response = self._handle_line(line)
+                if line and self.command_latency:
+                    # the empty line of a command's terminator is not a
+                    # command of its own
+                    self._stop.wait(self.command_latency)
+                self._write(response)
+
+    def _write(self, response: str) -> None:
+        assert self._master is not None
+        encoded = response.encode()
+        self.bytes_sent += len(encoded)
+        os.write(self._master, encoded)
+
+    # ----------- Motion --------------- #
+
+    def _wait_for_idle(self) -> None:
+        remaining = self._busy_until - time.monotonic()
+        if remaining > 0:
+            self._stop.wait(remaining)
+
+    def _queue(self, duration: float) -> None:
+        start = max(time.monotonic(), self._busy_until)
+        self._busy_until = start + duration * self.time_scale
+
+    def _resolve_target(self, args: Dict[str, float]) -> Dict[str, float]:
+        target = {}
+        for ax, val in args.items():
+            if ax not in AXES:
+                continue
+            target[ax] = self.position[ax] + val if self.relative else val
+        return target
+
+    def _move_duration(self, target: Dict[str, float],
+                       feedrate: float) -> float:
+        deltas = {ax: abs(val - self.position[ax])
+                  for ax, val in target.items()}
+        cartesian = math.sqrt(
+            sum(deltas.get(ax, 0.0) ** 2 for ax in 'XYZ'))
+        durations: List[float] = [0.0]
+        feed = feedrate / SEC_PER_MIN
+        for ax, delta in deltas.items():
+            if not delta:
+                continue
+            if ax in 'XYZ' and cartesian:
+                # cartesian axes share the feedrate along the move
+                speed = min(feed * delta / cartesian, self.max_speed[ax])
+            else:
+                speed = min(feed, self.max_speed[ax])
+            durations.append(_trapezoid_time(
+                delta, speed, self.acceleration.get(ax, 0.0)))
+        return max(durations)
+
+    def _move(self, target: Dict[str, float], feedrate: float) -> None:
+        self._queue(self._move_duration(target, feedrate))
+        self.position.update(target)
+        for ax in target:
+            self.engaged[ax] = True
+
+    # ----------- Commands --------------- #
+
+    def _handle_line(self, line: str) -> str:  # noqa: C901
+        """ Run one line of gcode, returning the full response to it """
+        if not line:
+            return 'ok\r\n'
+        self.command_count += 1
+        if line.lower().startswith('version'):
+            return (f'Build version: {self.firmware_version}, '
+                    'Build date: Jan 1 2020 00:00:00, MCU: LPC1769, '
+                    'System Clock: 120MHz\r\nok\r\n')
+        data: List[str] = []
+        for code, text in self._split_codes(line):
+            try:
+                result = self._handle_code(code, text)
+            except _EmulatorError as e:
+                return f'{e}\r\nok\r\n'
+            if result:
+                data.append(result)
+        data.append('ok')
+        return '\r\n'.join(data) + '\r\n'
+
+    @staticmethod
+    def _split_codes(line: str) -> List[Tuple[str, str]]:
+        parts = _CODE_RE.split(line)
+        # parts alternates text before the first code, code, args, code, ...
+        return [(parts[i], parts[i + 1].strip())
+                for i in range(1, len(parts) - 1, 2)]
+
+    def _handle_code(self, code: str, text: str) -> Optional[str]:  # noqa: C901,E501
+        args = _parse_args(text)
+        if code == 'G0':
+            if 'F' in args:
+                self.feedrate = args['F']
+            target = self._resolve_target(args)
+            if target:
+                self._move(target, self.feedrate)
+        elif code == 'G4':
+            self._queue(args.get('P', 0.0))
+        elif code == 'G90':
+            self.relative = False
+        elif code == 'G91':
+            self.relative = True
+        elif code == 'G28.2':
+            self._home(''.join(ax for ax in text.upper() if ax in AXES))
+        elif code == 'G28.6':
+            return ' '.join(
+                f'{ax}:{int(self.homed[ax])}' for ax in AXES)
+        elif code == 'G38.2':
+            self._wait_for_idle()
+            target = self._resolve_target(args)
+            self._move(target, args.get('F', DEFAULT_PROBE_FEEDRATE))
+            self._wait_for_idle()
+        elif code == 'M114.2':
+            return 'ok MCS: ' + ' '.join(
+                f'{ax}:{self.position[ax]:.4f}' for ax in AXES)
+        elif code == 'M119':
+            return self._switch_report()
+        elif code == 'M400':
+            self._wait_for_idle()
+        elif code == 'M907':
+            self.current.update(
+                {ax: val for ax, val in args.items() if ax in AXES})
+        elif code == 'M203.1':
+            self.max_speed.update(
+                {ax: val for ax, val in args.items() if ax in AXES})
+        elif code == 'M204':
+            self.acceleration.update(
+                {ax: val for ax, val in args.items() if ax in AXES})
+        elif code == 'M92':
+            self.steps_per_mm.update(args)
+        elif code == 'M18':
+            for ax in text.upper():
+                if ax in AXES:
+                    self.engaged[ax] = False
+        elif code == 'M365.0':
+            self.homed_position.update(
+                {ax: val for ax, val in args.items() if ax in AXES})
+        elif code == 'M999':
+            self._busy_until = time.monotonic()
+        elif code in ('M369', 'M371'):
+            return self._read_pipette(code, text)
+        elif code in ('M370', 'M372'):
+            self._write_pipette(code, text)
+        # everything else the driver sends (M52-M55 microstepping,
+        # M365.1-3 pipette config, M120/M121) needs no emulated state
+        return None
+
+    def _home(self, axes: str) -> None:
+        self._wait_for_idle()
+        duration = 0.0
+        for ax in axes:
+            distance = abs(self.homed_position[ax] - self.position[ax])
+            duration += _trapezoid_time(
+                distance, self.max_speed[ax], self.acceleration.get(ax, 0.0))
+            self.position[ax] = self.homed_position[ax]
+            self.homed[ax] = True
+            self.engaged[ax] = True
+        self._queue(duration)
+        self._wait_for_idle()
+
+    def _switch_report(self) -> str:
+        maxes = ' '.join(f'{ax}_max:0' for ax in AXES)
+        pins = ' '.join(f'({ax}L)2.01:0' for ax in AXES)
+        return f'{maxes} _pins {pins} Probe: 0'
+
+    def _pipette_memory(self, text: str) -> Tuple[str, Dict[str, str]]:
+        mount = text[:1].upper()
+        if mount not in self._pipettes:
+            raise _EmulatorError(f'error:no {mount} instrument found')
+        return mount, self._pipettes[mount]
+
+    def _read_pipette(self, code: str, text: str) -> str:
+        mount, memory = self._pipette_memory(text)
+        field = 'id' if code == 'M369' else 'model'
+        return f'{mount}:{memory.get(field, "").encode().hex()}'
+
+    def _write_pipette(self, code: str, text: str) -> None:
+        mount, memory = self._pipette_memory(text)
+        field = 'id' if code == 'M370' else 'model'
+        memory[field] = bytes.fromhex(text[1:]).decode()
+
+
+class _EmulatorError(Exception):
+    pass
+
+
+def run_benchmark(emulator: SmoothieEmulator,
+                  moves: int,
+                  streaming: bool = False) -> Dict[str, float]:
+    """ Drive a real smoothie driver through `moves` moves on the emulator
+    and return the emulator's traffic counters for them """
+    from .driver_3_0 import SmoothieDriver_3_0_0
+
+    driver = SmoothieDriver_3_0_0(
+        robot_configs.load(), streaming=streaming)
+    driver.connect(emulator.port)
+    try:
+        driver.home()
+        emulator.command_count = 0
+        emulator.bytes_received = emulator.bytes_sent = 0
+        emulator._started_at = time.monotonic()
+        for i in range(moves):
+            offset = 10 * (i % 2)
+            driver.move({'X': 100 + offset, 'Y': 100 + offset, 'Z': 100})
+        driver.update_position()
+        results = emulator.stats()
+        results['moves_per_second'] = moves / results['elapsed']
+        return results
+    finally:
+        driver.disconnect()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description='Emulate a smoothieboard on a pseudo-terminal')
+    parser.add_argument(
+        '--latency', type=float, default=0.0,
+        help='Seconds to wait before answering each line of gcode')
+    parser.add_argument(
+        '--time-scale', type=float, default=1.0,
+        help='Multiplier on emulated motion time; 0 for instant motion')
+    parser.add_argument(
+        '--bench', type=int, default=0, metavar='MOVES',
+        help='Run this many moves through a driver and report the rate')
+    parser.add_argument(
+        '--streaming', action='store_true',
+        help='Benchmark the driver in streaming mode')
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+
+    with SmoothieEmulator(command_latency=args.latency,
+                          time_scale=args.time_scale) as emulator:
+        if args.bench:
+            for key, value in run_benchmark(
+                    emulator, args.bench, args.streaming).items():
+                print(f'{key}: {value:.3f}')
+            return
+        print(emulator.port, flush=True)
+        try:
+            while True:
+                time.sleep(1)
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == '__main__':
+    main()
@@ -1,7 +1,6 @@
 from os import environ
 import logging
-import asyncio
-from threading import Event, Thread, Lock
+from threading import Event, Lock
 from time import sleep
 from typing import Any, Optional, Mapping, Dict, Tuple
 from serial.serialutil import SerialException  # type: ignore
@@ -80,6 +79,9 @@ class SimulatingDriver:
     def update_temperature(self):
         pass
 
+    async def poll_temperature(self):
+        pass
+
     def connect(self, port: str):
         self._port = port
 
@@ -119,7 +121,7 @@ class TempDeck:
         self._config = config
 
         self._temperature = {'current': 25, 'target': None}
-        self._update_thread = None
+        self._status_waiters = utils.StatusWaiters()
         self._port = None
         self._lock = None
 
@@ -179,8 +181,8 @@ class TempDeck:
         except (TempDeckError, SerialException, SerialNoResponse) as e:
             return str(e)
         self._temperature.update({'target': celsius})
-        while self.status != 'holding at target':
-            await asyncio.sleep(0.1)
+        await self._status_waiters.wait_for(
+            lambda: self.status == 'holding at target')
         return ''
 
     def start_set_temperature(self, celsius) -> str:
@@ -205,22 +207,36 @@ class TempDeck:
         self._temperature.update({'target': celsius})
         return ''
 
-    def update_temperature(self, default=None) -> str:
-        if self._update_thread and self._update_thread.is_alive():
-            updated_temperature = default or self._temperature.copy()
-            self._temperature.update(updated_temperature)
-        else:
-            # comment
-            try:
-                self._update_thread = Thread(
-                    target=self._recursive_update_temperature,
-                    args=[DEFAULT_COMMAND_RETRIES],
-                    name='Tempdeck recursive update temperature')
-                self._update_thread.start()
-            except (TempDeckError, SerialException, SerialNoResponse) as e:
-                return str(e)
+    def update_temperature(self) -> str:
+        try:
+            self._recursive_update_temperature(DEFAULT_COMMAND_RETRIES)
+        except (TempDeckError, SerialException, SerialNoResponse) as e:
+            return str(e)
         return ''
 
+    async def poll_temperature(self) -> None:
+        '''
+        Read the temperature without blocking the event loop. A failed read
+        is logged and left for the next poll to retry.
+        '''
+        if not self.is_connected():
+            return
+        try:
+            res = await serial_communication.write_and_return_async(
+                GCODES['GET_TEMP'] + ' ' + TEMP_DECK_COMMAND_TERMINATOR,
+                TEMP_DECK_ACK,
+                self._connection,
+                DEFAULT_TEMP_DECK_TIMEOUT,
+                tag=f'tempdeck {id(self)} poll')
+            self._check_response(res)
+            res = utils.parse_temperature_response(
+                res.strip(), utils.TEMPDECK_GCODE_ROUNDING_PRECISION)
+            self._temperature.update(res)
+            self._status_waiters.notify()
+        except (TempDeckError, SerialException, SerialNoResponse,
+                utils.ParseError) as e:
+            log.warning(f'Failed to read temp deck temperature: {e}')
+
     @property
     def target(self) -> Optional[int]:
         return self._temperature.get('target')
@@ -317,15 +333,16 @@ class TempDeck:
             command_line = command + ' ' + TEMP_DECK_COMMAND_TERMINATOR
             ret_code = self._recursive_write_and_return(
                 command_line, timeout, DEFAULT_COMMAND_RETRIES)
-
-            # Smoothieware returns error state if a switch was hit while moving
-            if (ERROR_KEYWORD in ret_code.lower()) or \
-                    (ALARM_KEYWORD in ret_code.lower()):
-                log.error(f'Received error message from Temp-Deck: {ret_code}')
-                raise TempDeckError(ret_code)
-
+            self._check_response(ret_code)
             return ret_code.strip()
 
+    def _check_response(self, ret_code):
+        # Smoothieware returns error state if a switch was hit while moving
+        if (ERROR_KEYWORD in ret_code.lower()) or \
+                (ALARM_KEYWORD in ret_code.lower()):
+            log.error(f'Received error message from Temp-Deck: {ret_code}')
+            raise TempDeckError(ret_code)
+
     def _recursive_write_and_return(self, cmd, timeout, retries, tag=None):
         if not tag:
             tag = f'tempdeck {id(self)}'
@@ -355,6 +372,7 @@ class TempDeck:
             res = utils.parse_temperature_response(
                 res, utils.TEMPDECK_GCODE_ROUNDING_PRECISION)
             self._temperature.update(res)
+            self._status_waiters.notify()
             return None
         except utils.ParseError as e:
             retries -= 1
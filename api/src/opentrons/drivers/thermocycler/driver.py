@@ -1,27 +1,16 @@
 import asyncio
 import logging
-import os
-import threading
 import serial  # type: ignore
-from queue import Queue
 try:
     import select
 except ModuleNotFoundError:
     select = None  # type: ignore
-from time import sleep
 from collections import deque
-from typing import Callable, Optional, Mapping, Tuple, Deque, TYPE_CHECKING
+from typing import Optional, Mapping, Deque
 from serial.serialutil import SerialException  # type: ignore
 from opentrons.drivers import serial_communication, utils
 from opentrons.drivers.serial_communication import SerialNoResponse
 
-if TYPE_CHECKING:
-    # avoid an issue where Queue doesn't support generics at runtime
-    CommandQueue = Queue[Tuple[str, Callable[[str], None]]]
-else:
-    CommandQueue = Queue
-
-
 log = logging.getLogger(__name__)
 
 GCODES = {
@@ -188,181 +177,49 @@ class SimulatingDriver:
     async def enter_programming_mode(self):
         pass
 
-
-class TCPoller(threading.Thread):
-    def __init__(self, port, interrupt_callback, temp_status_callback,
-                 lid_status_callback, lid_temp_status_callback):
-        if not select:
-            raise RuntimeError("Cannot connect to a Thermocycler from Windows")
-        self._port = port
-        self._connection = self._connect_to_port()
-        self._interrupt_callback = interrupt_callback
-        self._temp_status_callback = temp_status_callback
-        self._lid_status_callback = lid_status_callback
-        self._lid_temp_status_callback = lid_temp_status_callback
-        self._lock = threading.Lock()
-        self._command_queue: CommandQueue = Queue()
-
-        # Note: the options and order of operations for opening file
-        # descriptors is very specific. For more info, see:
-        # http://pubs.opengroup.org/onlinepubs/007908799/xsh/open.html
-        self._send_path = '/var/run/tc_send_fifo_{}'.format(hash(self))
-        os.mkfifo(self._send_path)
-        send_read_fd = os.open(
-            self._send_path, flags=os.O_RDONLY | os.O_NONBLOCK)
-        self._send_read_file = os.fdopen(send_read_fd, 'rb')
-        self._send_write_fd = open(self._send_path, 'wb', buffering=0)
-
-        self._halt_path = '/var/run/tc_halt_fifo_{}'.format(hash(self))
-        os.mkfifo(self._halt_path)
-        halt_read_fd = os.open(
-            self._halt_path, flags=os.O_RDONLY | os.O_NONBLOCK)
-        self._halt_read_file = os.fdopen(halt_read_fd, 'rb')
-        self._halt_write_fd = open(self._halt_path, 'wb', buffering=0)
-
-        self._poller = select.poll()
-        self._poller.register(self._send_read_file, select.POLLIN)
-        self._poller.register(self._halt_read_file, select.POLLIN)
-        self._poller.register(self._connection, select.POLLIN)
-        serial_thread_name = 'tc_serial_poller_{}'.format(hash(self))
-        super().__init__(target=self._serial_poller, name=serial_thread_name)
-        log.info("Starting TC thread {}".format(serial_thread_name))
-        super().start()
-
-    @property
-    def port(self):
-        return self._port
-
-    def _serial_poller(self):
-        """ Priority-sorted list of checks
-
-        Highest priority is the 'halt' channel, which is used to kill the
-        thread and the serial communication channel and allow everything to be
-        cleaned up.
-
-        Second is the lid-open interrupt, which should trigger a callback
-        (typically to halt the robot).
-
-        Third is an enqueued command to send to the Thermocycler.
-
-        Fourth (if no other work is available) is to query the Thermocycler for
-        its current temp, target temp, and time remaining in its current cycle.
-        """
-        while True:
-            _next = dict(self._poller.poll(POLLING_FREQUENCY_MS))
-            if self._halt_read_file.fileno() in _next:
-                log.debug("Poller [{}]: halt".format(hash(self)))
-                self._halt_read_file.read()
-                # Note: this is discarded because we send a set message to halt
-                # the thread--don't currently need to parse it
-                break
-
-            elif self._connection.fileno() in _next:
-                # Lid-open interrupt
-                log.debug("Poller [{}]: interrupt".format(hash(self)))
-                res = self._connection.read_until(SERIAL_ACK)
-                self._interrupt_callback(res)
-
-            elif self._send_read_file.fileno() in _next:
-                self._send_read_file.read(1)
-                command, callback = self._command_queue.get()
-                log.debug("Poller [{}]: send {}".format(hash(self), command))
-                res = self._send_command(command)
-                callback(res)
-            else:
-                # Nothing else to do--update device status
-                log.debug("Poller [{}]: updating temp".format(hash(self)))
-                res = self._send_command(GCODES['GET_PLATE_TEMP'])
-                self._temp_status_callback(res)
-                res = self._send_command(GCODES['GET_LID_STATUS'])
-                self._lid_status_callback(res)
-                res = self._send_command(GCODES['GET_LID_TEMP'])
-                self._lid_temp_status_callback(res)
-        log.info("Exiting TC poller loop [{}]".format(hash(self)))
-
-    def _wait_for_ack(self):
-        """
-        This method writes a sequence of newline characters, which will
-        guarantee the device responds with 'ok\r\nok\r\n' within 1 second
-        """
-        self._send_command(SERIAL_ACK, timeout=DEFAULT_TC_TIMEOUT)
-
-    def _send_command(self, command, timeout=DEFAULT_TC_TIMEOUT):
-        command_line = command + ' ' + TC_COMMAND_TERMINATOR
-        ret_code = self._recursive_write_and_return(
-            command_line, timeout, DEFAULT_COMMAND_RETRIES)
-        if ERROR_KEYWORD in ret_code.lower():
-            log.error('Received error message from Thermocycler: {}'.format(
-                ret_code))
-            raise ThermocyclerError(ret_code)
-        return ret_code.strip()
-
-    def _recursive_write_and_return(self, cmd, timeout, retries):
-        try:
-            return serial_communication.write_and_return(
-                cmd, TC_ACK, self._connection, timeout,
-                tag=f'thermocycler {id(self)}')
-        except SerialNoResponse as e:
-            retries -= 1
-            if retries <= 0:
-                raise e
-            sleep(DEFAULT_STABILIZE_DELAY)
-            if self._connection:
-                self._connection.close()
-                self._connection.open()
-            return self._recursive_write_and_return(
-                cmd, timeout, retries)
-
-    def _connect_to_port(self):
-        try:
-            return serial_communication.connect(port=self._port,
-                                                baudrate=TC_BAUDRATE)
-        except SerialException:
-            raise SerialException(
-                "Thermocycler device not found on {}".format(self._port))
-
-    def send(self, command, callback):
-        with self._lock:
-            self._command_queue.put((command, callback))
-            self._send_write_fd.write(b'c')
-
-    def close(self):
-        self._halt_write_fd.write(b'q')
-
-    def __del__(self):
-        """ Clean up thread fifos"""
-        try:
-            os.unlink(self._send_path)
-        except NameError:
-            pass
-        try:
-            os.unlink(self._halt_path)
-        except NameError:
-            pass
+    async def update_status(self):
+        pass
 
 
 class Thermocycler:
+    """ Driver for a thermocycler.
+
+    Commands are sent from the event loop the driver connected on, without
+    blocking it while the thermocycler answers, and lid interrupts are read
+    by a reader on that loop. The driver does not poll the thermocycler's
+    status by itself: :py:meth:`update_status` must be called regularly (the
+    hardware controller's module polling service does this). The
+    temperature setters read the status once after sending the new targets,
+    and then wait for the status to report them.
+    """
     def __init__(self, interrupt_callback):
-        self._poller = None
-        self._update_thread = None
+        self._connection = None
+        self._port: Optional[str] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lock: Optional[asyncio.Lock] = None
         self._current_temp = None
         self._target_temp = None
         self._ramp_rate = None
         self._hold_time = None
         self._lid_status = None
         self._interrupt_cb = interrupt_callback
+        # the part of a lid interrupt received so far
+        self._interrupt_buffer = b''
         self._lid_target = None
         self._lid_temp = None
         # to store previous _current_temp values:
         self._block_temp_buffer: Deque = deque(maxlen=TEMP_BUFFER_MAX_LEN)
+        self._status_waiters = utils.StatusWaiters()
 
     async def connect(self, port: str) -> 'Thermocycler':
+        if not select:
+            raise RuntimeError("Cannot connect to a Thermocycler from Windows")
         self.disconnect()
-        self._poller = TCPoller(
-            port, self._interrupt_callback,
-            self._temp_status_update_callback,
-            self._lid_status_update_callback,
-            self._lid_temp_status_callback)
+        self._loop = asyncio.get_event_loop()
+        self._lock = asyncio.Lock(loop=self._loop)
+        self._connection = self._connect_to_port(port)
+        self._port = port
+        self._watch_interrupts()
 
         # Check initial device lid state
         _lid_status_res = await self._write_and_wait(GCODES['GET_LID_STATUS'])
@@ -372,12 +229,26 @@ class Thermocycler:
         return self
 
     def disconnect(self) -> 'Thermocycler':
-        if self.is_connected():
-            self._poller.close()  # type: ignore
-            self._poller.join()  # type: ignore
-        self._poller = None
+        if self._connection:
+            self._unwatch_interrupts()
+            self._connection.close()
+        self._connection = None
+        self._interrupt_buffer = b''
+        self._port = None
         return self
 
+    async def update_status(self) -> None:
+        """ Query the plate temperature, lid status and lid temperature """
+        if not self.is_connected():
+            return
+        self._temp_status_update_callback(
+            await self._write_and_wait(GCODES['GET_PLATE_TEMP']))
+        self._lid_status_update_callback(
+            await self._write_and_wait(GCODES['GET_LID_STATUS']))
+        self._lid_temp_status_callback(
+            await self._write_and_wait(GCODES['GET_LID_TEMP']))
+        self._status_waiters.notify()
+
     async def deactivate_all(self):
         await self._write_and_wait(GCODES['DEACTIVATE_ALL'])
 
@@ -388,9 +259,9 @@ class Thermocycler:
         await self._write_and_wait(GCODES['DEACTIVATE_BLOCK'])
 
     def is_connected(self) -> bool:
-        if not self._poller:
+        if not self._connection:
             return False
-        return self._poller.is_alive()
+        return self._connection.is_open
 
     async def open(self):
         await self._write_and_wait(GCODES['OPEN_LID'])
@@ -431,18 +302,20 @@ class Thermocycler:
                                           hold_time=hold_time,
                                           volume=volume)
         await self._write_and_wait(temp_cmd)
-        retries = 0
-        while self._target_temp != temp or \
-                not self.hold_time_probably_set(hold_time):
+        # Rather than wait for the next poll, which may be a while away
+        await self.update_status()
+        try:
             # Wait for the poller to update
-            await asyncio.sleep(DEFAULT_POLLER_WAIT_SECONDS)
-            retries += 1
-            if retries > TEMP_UPDATE_RETRIES:
-                raise ThermocyclerError(f'Thermocycler driver set the block '
-                                        f'temp to T={temp} & H={hold_time} '
-                                        f'but status reads '
-                                        f'T={self._target_temp} & '
-                                        f'H={self._hold_time}')
+            await self._status_waiters.wait_for(
+                lambda: self._target_temp == temp
+                and self.hold_time_probably_set(hold_time),
+                TEMP_UPDATE_RETRIES * DEFAULT_POLLER_WAIT_SECONDS)
+        except asyncio.TimeoutError:
+            raise ThermocyclerError(f'Thermocycler driver set the block '
+                                    f'temp to T={temp} & H={hold_time} '
+                                    f'but status reads '
+                                    f'T={self._target_temp} & '
+                                    f'H={self._hold_time}')
 
     async def set_lid_temperature(self, temp: float) -> None:
         if temp is None:
@@ -457,15 +330,17 @@ class Thermocycler:
 
         lid_temp_cmd = '{} S{}'.format(GCODES['SET_LID_TEMP'], _lid_target)
         await self._write_and_wait(lid_temp_cmd)
-        retries = 0
-        while self._lid_target != _lid_target:
+        # Rather than wait for the next poll, which may be a while away
+        await self.update_status()
+        try:
             # Wait for the poller to update
-            await asyncio.sleep(DEFAULT_POLLER_WAIT_SECONDS)
-            retries += 1
-            if retries > TEMP_UPDATE_RETRIES:
-                raise ThermocyclerError(f'Thermocycler driver set lid temp to'
-                                        f' {_lid_target} but self._lid_target'
-                                        f' reads {self._lid_target}')
+            await self._status_waiters.wait_for(
+                lambda: self._lid_target == _lid_target,
+                TEMP_UPDATE_RETRIES * DEFAULT_POLLER_WAIT_SECONDS)
+        except asyncio.TimeoutError:
+            raise ThermocyclerError(f'Thermocycler driver set lid temp to'
+                                    f' {_lid_target} but self._lid_target'
+                                    f' reads {self._lid_target}')
 
     def _lid_status_update_callback(self, lid_response):
         if lid_response:
@@ -572,9 +447,7 @@ class Thermocycler:
 
     @property
     def port(self) -> Optional[str]:
-        if not self._poller:
-            return None
-        return self._poller.port
+        return self._port
 
     @property
     def lid_status(self):
@@ -600,19 +473,73 @@ class Thermocycler:
             raise ThermocyclerError("Thermocycler did not return device info")
 
     async def _write_and_wait(self, command):
-        ret = None
+        assert self._lock, 'not connected'
+        async with self._lock:
+            # the response must not be taken for a lid interrupt
+            self._unwatch_interrupts()
+            try:
+                return await self._send_command(command)
+            finally:
+                if self._connection:
+                    self._watch_interrupts()
+
+    async def _send_command(self, command, timeout=DEFAULT_TC_TIMEOUT):
+        command_line = command + ' ' + TC_COMMAND_TERMINATOR
+        ret_code = await self._recursive_write_and_return(
+            command_line, timeout, DEFAULT_COMMAND_RETRIES)
+        if ERROR_KEYWORD in ret_code.lower():
+            log.error('Received error message from Thermocycler: {}'.format(
+                ret_code))
+            raise ThermocyclerError(ret_code)
+        return ret_code.strip()
 
-        def cb(cmd):
-            nonlocal ret
-            ret = cmd
+    async def _recursive_write_and_return(self, cmd, timeout, retries):
+        try:
+            return await serial_communication.write_and_return_async(
+                cmd, TC_ACK, self._connection, timeout,
+                tag=f'thermocycler {id(self)}')
+        except SerialNoResponse as e:
+            retries -= 1
+            if retries <= 0:
+                raise e
+            await asyncio.sleep(DEFAULT_STABILIZE_DELAY)
+            if self._connection:
+                self._connection.close()
+                self._connection.open()
+            return await self._recursive_write_and_return(
+                cmd, timeout, retries)
+
+    def _connect_to_port(self, port):
+        try:
+            return serial_communication.connect(port=port,
+                                                baudrate=TC_BAUDRATE)
+        except SerialException:
+            raise SerialException(
+                "Thermocycler device not found on {}".format(port))
 
-        assert self._poller, 'not connected'
-        self._poller.send(command, cb)
+    def _watch_interrupts(self):
+        self._loop.add_reader(  # type: ignore
+            self._connection.fileno(),  # type: ignore
+            self._read_interrupt)
 
-        while None is ret:
-            await asyncio.sleep(0.05)
+    def _unwatch_interrupts(self):
+        try:
+            self._loop.remove_reader(  # type: ignore
+                self._connection.fileno())  # type: ignore
+        except Exception:
+            # the loop or the connection is already closed
             pass
-        return ret
+
+    def _read_interrupt(self):
+        # Lid-open interrupt. This runs in the event loop, so only take the
+        # bytes that have arrived and wait for the rest of the message.
+        self._interrupt_buffer += self._connection.read(  # type: ignore
+            self._connection.in_waiting)  # type: ignore
+        ack = SERIAL_ACK.encode()
+        while ack in self._interrupt_buffer:
+            res, self._interrupt_buffer = self._interrupt_buffer.split(ack, 1)
+            log.debug("Thermocycler [{}]: interrupt".format(hash(self)))
+            self._interrupt_callback(res + ack)
 
     async def enter_programming_mode(self):
         trigger_connection = serial.Serial(
@@ -623,6 +550,6 @@ class Thermocycler:
 
     def __del__(self):
         try:
-            self._poller.close()  # type: ignore
+            self.disconnect()
         except Exception:
             log.exception('Exception while cleaning up Thermocycler:')
@@ -1,6 +1,8 @@
+import asyncio
 import logging
 import time
-from typing import Dict, Optional, Mapping, Iterable, Sequence
+from typing import (
+    Callable, Dict, List, Optional, Mapping, Iterable, Sequence, Tuple)
 
 log = logging.getLogger(__name__)
 
@@ -141,3 +143,41 @@ class AxisMoveTimestamp:
     def reset_moved(self, axis_iter: Iterable[str]):
         """ Reset the clocks for a set of axes """
         self._moved_at.update({ax: None for ax in axis_iter})
+
+
+class StatusWaiters:
+    """ Coroutines waiting for a device's status to meet some condition.
+
+    Rather than sleeping and checking, waiters are woken when whatever
+    updates the status calls :py:meth:`notify`.
+    """
+
+    def __init__(self):
+        self._waiters: List[Tuple[Callable[[], bool], asyncio.Future]] = []
+
+    async def wait_for(self, predicate: Callable[[], bool],
+                       timeout: Optional[float] = None):
+        """ Return once predicate() is true, checking it now and on every
+        notify. Raises :py:class:`asyncio.TimeoutError` if it is still false
+        after timeout seconds. """
+        if predicate():
+            return
+        waiter = (predicate, asyncio.get_event_loop().create_future())
+        self._waiters.append(waiter)
+        try:
+            await asyncio.wait_for(waiter[1], timeout)
+        finally:
+            self._waiters.remove(waiter)
+
+    def notify(self):
+        """ Wake the waiters whose conditions the status now meets """
+        for predicate, future in self._waiters:
+            if future.done():
+                continue
+            try:
+                met = predicate()
+            except Exception as e:
+                future.set_exception(e)
+            else:
+                if met:
+                    future.set_result(None)
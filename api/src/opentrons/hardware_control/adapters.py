@@ -2,7 +2,9 @@
 """
 import asyncio
 import functools
-from typing import TYPE_CHECKING
+import threading
+import weakref
+from typing import Any, Callable, Dict, Tuple, TYPE_CHECKING
 
 from .types import HardwareAPILike
 
@@ -10,6 +12,74 @@ if TYPE_CHECKING:
     from .dev_types import HasLoop  # noqa: F501
 
 
+def _coroutine_check(attr: Any) -> Any:
+    """ Find the thing to check for coroutine-ness in an attribute, looking
+    through partials and decorators """
+    check = attr
+    if isinstance(attr, functools.partial):
+        # if partial func check passed in func
+        check = attr.func
+    try:
+        # if decorated func check wrapped func
+        check = check.__wrapped__
+    except AttributeError:
+        pass
+    return check
+
+
+@functools.lru_cache(maxsize=None)
+def is_coroutine_method(func: Callable) -> bool:
+    """ Whether a function defined on a class is a coroutine function.
+
+    The answer is cached per function, so adapters only pay for the check the
+    first time they see each method of the class they wrap.
+    """
+    return asyncio.iscoroutinefunction(_coroutine_check(func))
+
+
+# event loop -> ident of the thread that runs it
+_loop_threads: 'weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, int]'
+_loop_threads = weakref.WeakKeyDictionary()
+
+
+def set_loop_thread(loop: asyncio.AbstractEventLoop) -> None:
+    """ Record that the calling thread is the one that runs ``loop`` """
+    _loop_threads[loop] = threading.get_ident()
+
+
+def on_loop_thread(loop: asyncio.AbstractEventLoop) -> bool:
+    """ Whether the calling thread is the one that runs ``loop``.
+
+    For a loop registered with :py:func:`set_loop_thread` this compares
+    thread idents; otherwise it checks whether the caller is running in the
+    loop right now.
+    """
+    owner = _loop_threads.get(loop)
+    if owner is not None:
+        return owner == threading.get_ident()
+    try:
+        return asyncio.get_running_loop() is loop
+    except RuntimeError:
+        return False
+
+
+def run_sync(loop: asyncio.AbstractEventLoop, coro: Any) -> Any:
+    """ Run a coroutine in ``loop`` and wait for its result.
+
+    An idle loop that no other thread owns is simply run here. A loop running
+    in another thread is handed the coroutine. Waiting on the loop from its
+    own thread would deadlock, so that raises before anything is run.
+    """
+    if on_loop_thread(loop):
+        coro.close()
+        raise RuntimeError(
+            'Cannot wait synchronously for the hardware from its own '
+            'event loop')
+    if not loop.is_running() and loop not in _loop_threads:
+        return loop.run_until_complete(coro)
+    return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
+
 # TODO: BC 2020-02-25 instead of overwriting __get_attribute__ in this class
 # use inspect.getmembers to iterate over appropriate members of adapted
 # instance and setattr on the outer instance with the proper async resolution
@@ -46,14 +116,15 @@ class SynchronousAdapter(HardwareAPILike):
         :param asynchronous_instance: The asynchronous class instance to wrap
         """
         self._obj_to_adapt = asynchronous_instance
+        # attribute name -> (function, instance, synchronous wrapper)
+        self._dispatch: Dict[str, Tuple[Callable, Any, Callable]] = {}
 
     def __repr__(self):
         return '<SynchronousAdapter>'
 
     @staticmethod
     def call_coroutine_sync(loop, to_call, *args, **kwargs):
-        fut = asyncio.run_coroutine_threadsafe(to_call(*args, **kwargs), loop)
-        return fut.result()
+        return run_sync(loop, to_call(*args, **kwargs))
 
     def __getattribute__(self, attr_name):
         """ Retrieve attributes from our API and wrap coroutines """
@@ -66,15 +137,25 @@ class SynchronousAdapter(HardwareAPILike):
             # Maybe this actually was for us? Let’s find it
             return object.__getattribute__(self, attr_name)
 
-        check = inner_attr
-        if isinstance(inner_attr, functools.partial):
-            # if partial func check passed in func
-            check = inner_attr.func
-        try:
-            # if decorated func check wrapped func
-            check = check.__wrapped__
-        except AttributeError:
-            pass
+        func = getattr(inner_attr, '__func__', None)
+        if func is not None:
+            # A bound method. Reuse the wrapper we built for it last time
+            # unless the method has been replaced since.
+            dispatch = object.__getattribute__(self, '_dispatch')
+            bound_to = inner_attr.__self__
+            cached = dispatch.get(attr_name)
+            if cached and cached[0] is func and cached[1] is bound_to:
+                return cached[2]
+            if is_coroutine_method(func):
+                wrapper = functools.partial(
+                    object.__getattribute__(self, 'call_coroutine_sync'),
+                    obj_to_adapt._loop, inner_attr)
+            else:
+                wrapper = inner_attr
+            dispatch[attr_name] = (func, bound_to, wrapper)
+            return wrapper
+
+        check = _coroutine_check(inner_attr)
         if asyncio.iscoroutinefunction(check):
             # Return a synchronized version of the coroutine
             return functools.partial(
@@ -82,7 +163,6 @@ class SynchronousAdapter(HardwareAPILike):
                     obj_to_adapt._loop, inner_attr)
         elif asyncio.iscoroutine(check):
             # Catch awaitable properties and reify the future before returning
-            fut = asyncio.run_coroutine_threadsafe(check, obj_to_adapt._loop)
-            return fut.result()
+            return run_sync(obj_to_adapt._loop, check)
 
         return inner_attr
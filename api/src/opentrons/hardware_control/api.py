@@ -82,6 +82,9 @@ class API(HardwareAPILike):
             top_types.Mount.LEFT: None,
             top_types.Mount.RIGHT: None
         }
+        # mount -> (instrument state version, dict built at that version)
+        self._instrument_dicts: Dict[
+            top_types.Mount, Tuple[int, 'PipetteDict']] = {}
         self._attached_modules: List[modules.AbstractModule] = []
         self._last_moved_mount: Optional[top_types.Mount] = None
         # The motion lock synchronizes calls to long-running physical tasks
@@ -92,19 +95,22 @@ class API(HardwareAPILike):
         self._motion_lock = asyncio.Lock(loop=self._loop)
         self._door_state = DoorState.CLOSED
         self._robot_calibration = rb_cal.load()
+        self._deck_transform = linal.DeckTransform(
+            self._robot_calibration.deck_calibration.attitude)
 
     @property
     def robot_calibration(self) -> rb_cal.RobotCalibration:
         return self._robot_calibration
 
     def reset_robot_calibration(self):
-        self._calculate_valid_attitude.cache_clear()
-        self._robot_calibration = rb_cal.load()
+        self.set_robot_calibration(rb_cal.load())
 
     def set_robot_calibration(
             self, robot_calibration: rb_cal.RobotCalibration):
         self._calculate_valid_attitude.cache_clear()
         self._robot_calibration = robot_calibration
+        self._deck_transform = linal.DeckTransform(
+            robot_calibration.deck_calibration.attitude)
 
     @property
     def door_state(self) -> DoorState:
@@ -449,8 +455,34 @@ class API(HardwareAPILike):
             for m in (top_types.Mount.LEFT, top_types.Mount.RIGHT)
         }
 
-    def get_attached_instrument(self, mount: top_types.Mount) -> 'PipetteDict':
+    def get_instrument_state_version(self, mount: top_types.Mount) -> int:
+        """ A number that changes whenever the instrument on ``mount`` changes
+        state or is swapped for another; 0 if nothing is attached.
+
+        This is much cheaper than :py:meth:`get_attached_instrument`, and can
+        be used to tell whether a dict from that method is still current.
+        """
         instr = self._attached_instruments[mount]
+        return instr.state_version if instr else 0
+
+    def get_attached_instrument(self, mount: top_types.Mount) -> 'PipetteDict':
+        """ Get the status dict of the instrument attached to ``mount``.
+
+        The dict is only rebuilt when the instrument has changed (see
+        :py:meth:`get_instrument_state_version`); until then every call
+        returns a copy of the one built last, which the caller may modify.
+        """
+        version = self.get_instrument_state_version(mount)
+        cached = self._instrument_dicts.get(mount)
+        if not cached or cached[0] != version:
+            cached = (version, self._build_instrument_dict(
+                self._attached_instruments[mount]))
+            self._instrument_dicts[mount] = cached
+        return cast('PipetteDict', {
+            key: dict(value) if isinstance(value, dict) else value
+            for key, value in cached[1].items()})
+
+    def _build_instrument_dict(self, instr: Optional[Pipette]) -> 'PipetteDict':
         result: Dict[str, Any] = {}
         if instr:
             configs = ['name', 'min_volume', 'max_volume', 'channels',
@@ -685,23 +717,15 @@ class API(HardwareAPILike):
             mount: top_types.Mount,
             tip_length: float):
         instr = self._attached_instruments[mount]
-        attached = self.attached_instruments
-        instr_dict = attached[mount]
         if instr and not instr.has_tip:
             instr.add_tip(tip_length=tip_length)
-            instr_dict['has_tip'] = True
-            instr_dict['tip_length'] = tip_length
         else:
             mod_log.warning('attach tip called while tip already attached')
 
     async def remove_tip(self, mount: top_types.Mount):
         instr = self._attached_instruments[mount]
-        attached = self.attached_instruments
-        instr_dict = attached[mount]
         if instr and instr.has_tip:
             instr.remove_tip()
-            instr_dict['has_tip'] = False
-            instr_dict['tip_length'] = 0.0
         else:
             mod_log.warning('detach tip called with no tip')
 
@@ -734,12 +758,8 @@ class API(HardwareAPILike):
                 with_enum[Axis.Y],
                 with_enum[Axis.by_mount(top_types.Mount.LEFT)])
 
-        gantry_calibration =\
-            self.robot_calibration.deck_calibration.attitude
-        right_deck = linal.apply_reverse(
-            gantry_calibration, right)
-        left_deck = linal.apply_reverse(
-            gantry_calibration, left)
+        right_deck = self._deck_transform.apply_reverse(right)
+        left_deck = self._deck_transform.apply_reverse(left)
         deck_pos = {Axis.X: right_deck[0],
                     Axis.Y: right_deck[1],
                     Axis.by_mount(top_types.Mount.RIGHT): right_deck[2],
@@ -912,6 +932,31 @@ class API(HardwareAPILike):
             target_position, speed=speed,
             max_speeds=max_speeds, secondary_z=secondary_z)
 
+    async def move_through(
+            self, mount: Union[top_types.Mount, PipettePair],
+            moves: Sequence[Tuple[top_types.Point, Optional[CriticalPoint]]],
+            speed: float = None,
+            max_speeds: Dict[Axis, float] = None):
+        """ Move the specified mount through a sequence of positions, such as
+        the arc planned by :py:func:`.planning.plan_moves`.
+
+        This is the same as calling :py:meth:`move_to` for each position in
+        turn, but when called through a synchronous adapter or thread manager
+        the whole sequence runs in a single call into the hardware thread.
+
+        :param mount: The mount to move
+        :param moves: The (position, critical point) pairs to move through,
+                      in order. See :py:meth:`move_to` for the meaning of
+                      each.
+        :param speed: An overall head speed to use during every move
+        :param max_speeds: An optional override for per-axis maximum speeds,
+                           applied to every move.
+        """
+        for position, critical_point in moves:
+            await self.move_to(
+                mount, position, speed=speed,
+                critical_point=critical_point, max_speeds=max_speeds)
+
     async def move_rel(self, mount: Union[top_types.Mount, PipettePair],
                        delta: top_types.Point,
                        speed: float = None,
@@ -1013,16 +1058,14 @@ class API(HardwareAPILike):
             to_transform_primary: Tuple[float, ...],
             to_transform_secondary: Tuple[float, ...]
             ) -> Tuple[Tuple, Tuple]:
-        # Type ignored below because linal.apply_transform (rightly) specifies
+        # Type ignored below because DeckTransform.apply (rightly) specifies
         # Tuple[float, float, float] and the implied type from
         # target_position.items() is (rightly) Tuple[float, ...] with unbounded
         # size; unfortunately, mypy can’t quite figure out the length check
         # above that makes this OK
-        primary_transformed = linal.apply_transform(
-            self.robot_calibration.deck_calibration.attitude,
+        primary_transformed = self._deck_transform.apply(
             to_transform_primary)  # type: ignore
-        secondary_transformed = linal.apply_transform(
-            self.robot_calibration.deck_calibration.attitude,
+        secondary_transformed = self._deck_transform.apply(
             to_transform_secondary)  # type: ignore
         return primary_transformed, secondary_transformed
 
@@ -13,7 +13,7 @@ except OSError:
 from opentrons.drivers.smoothie_drivers import driver_3_0
 from opentrons.drivers.rpi_drivers import build_gpio_chardev
 import opentrons.config
-from opentrons.config import pipette_config
+from opentrons.config import pipette_config, feature_flags as ff
 from opentrons.config.types import RobotConfig
 from opentrons.types import Mount
 
@@ -76,7 +76,7 @@ class Controller:
         # We handle our own locks in the hardware controller thank you
         self._smoothie_driver = driver_3_0.SmoothieDriver_3_0_0(
             config=self.config, gpio_chardev=self._gpio_chardev,
-            handle_locks=False)
+            handle_locks=False, streaming=ff.enable_smoothie_streaming())
         self._cached_fw_version: Optional[str] = None
         try:
             self._module_watcher = aionotify.Watcher()
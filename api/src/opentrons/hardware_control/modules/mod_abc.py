@@ -3,10 +3,12 @@ import asyncio
 import logging
 import re
 from pkg_resources import parse_version
-from typing import Mapping, Optional
+from typing import Callable, Mapping, Optional
 from opentrons.config import IS_ROBOT, ROBOT_FIRMWARE_DIR
+from opentrons.drivers.utils import StatusWaiters
 from opentrons.hardware_control.util import use_or_initialize_loop
 from ..execution_manager import ExecutionManager
+from . import polling
 from .types import BundledFirmware, UploadFunction, InterruptCallback, LiveData
 
 mod_log = logging.getLogger(__name__)
@@ -15,6 +17,9 @@ mod_log = logging.getLogger(__name__)
 class AbstractModule(abc.ABC):
     """ Defines the common methods of a module. """
 
+    #: How often the module's status is polled, or None if it is not
+    POLL_RATE: Optional[polling.PollRate] = None
+
     @classmethod
     @abc.abstractmethod
     async def build(cls,
@@ -44,6 +49,7 @@ class AbstractModule(abc.ABC):
         self._execution_manager = execution_manager
         self._device_info: Mapping[str, str]
         self._bundled_fw: Optional[BundledFirmware] = self.get_bundled_fw()
+        self._status_waiters = StatusWaiters()
 
     def get_bundled_fw(self) -> Optional[BundledFirmware]:
         """ Get absolute path to bundled version of module fw if available. """
@@ -79,6 +85,40 @@ class AbstractModule(abc.ABC):
     async def make_cancellable(self, task: asyncio.Task):
         self._execution_manager.register_cancellable_task(task)
 
+    async def poll(self) -> None:
+        """ Read the module's status from the device and wake anything
+        waiting for the status to change.
+
+        Called by the module polling service, at :py:attr:`POLL_RATE`, once
+        the module starts polling.
+        """
+        await self._update_status()
+        self._status_waiters.notify()
+
+    async def _update_status(self) -> None:
+        pass
+
+    async def _wait_for_status(self, predicate: Callable[[], bool]) -> None:
+        """ Wait until predicate() is true, checking it now and after every
+        poll rather than on a timer """
+        await self._status_waiters.wait_for(predicate)
+
+    @property
+    def is_changing(self) -> bool:
+        """ Whether the module's status is expected to change soon, so it
+        should be polled at its active rate rather than its idle rate """
+        return False
+
+    def _start_polling(self):
+        if self.POLL_RATE and not self.is_simulated:
+            polling.get_service(self._loop).add(self, self.POLL_RATE)
+
+    def _stop_polling(self):
+        polling.get_service(self._loop).remove(self)
+
+    def _poll_soon(self):
+        polling.get_service(self._loop).poll_soon(self)
+
     @abc.abstractmethod
     def deactivate(self):
         """ Deactivate the module. """
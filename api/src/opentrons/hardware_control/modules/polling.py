@@ -0,0 +1,173 @@
+"""
+Status polling for modules.
+
+Modules that need their status read from the device register with the
+:py:class:`ModulePollingService` for their event loop. A single task on that
+loop calls each module's :py:meth:`.AbstractModule.poll` when it is due, so
+however many modules are attached there are no poller threads, and the
+drivers do their serial I/O without blocking the loop.
+
+Each module is polled at its active rate while
+:py:attr:`.AbstractModule.is_changing` (for instance while it heats or
+cools) and at its idle rate otherwise. Subscribers are called with the module
+after every poll.
+"""
+import asyncio
+import logging
+import weakref
+from asyncio import AbstractEventLoop
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .mod_abc import AbstractModule  # noqa: F401
+
+
+log = logging.getLogger(__name__)
+
+StatusCallback = Callable[['AbstractModule'], None]
+
+
+@dataclass(frozen=True)
+class PollRate:
+    """ Seconds between polls of a module, while its status is changing and
+    while it is not """
+    active: float
+    idle: float
+
+
+class _Entry:
+    __slots__ = ('rate', 'due')
+
+    def __init__(self, rate: PollRate, due: float) -> None:
+        self.rate = rate
+        self.due = due
+
+
+class ModulePollingService:
+    """ Polls the modules registered with it from one task on its loop.
+
+    Use :py:func:`get_service` rather than building one of these, so every
+    module on a loop shares the same service.
+    """
+
+    def __init__(self, loop: AbstractEventLoop) -> None:
+        self._loop = loop
+        self._entries: Dict['weakref.ref[AbstractModule]', _Entry] = {}
+        self._subscribers: List[StatusCallback] = []
+        self._wakeup = asyncio.Event(loop=loop)
+        self._task: Optional[asyncio.Task] = None
+
+    def add(self, module: 'AbstractModule', rate: PollRate) -> None:
+        """ Start polling a module, beginning now. The service only keeps a
+        weak reference to the module. """
+        self._entries[weakref.ref(module, self._forget)] = _Entry(
+            rate, self._loop.time())
+        if not self._task or self._task.done():
+            self._task = self._loop.create_task(self._run())
+        self._wakeup.set()
+
+    def remove(self, module: 'AbstractModule') -> None:
+        """ Stop polling a module """
+        if self._entries.pop(weakref.ref(module), None):
+            self._wakeup.set()
+
+    def _forget(self, ref: 'weakref.ref[AbstractModule]') -> None:
+        # the module was garbage collected, possibly on another thread
+        self._entries.pop(ref, None)
+        try:
+            self._loop.call_soon_threadsafe(self._wakeup.set)
+        except RuntimeError:
+            # the loop is closed
+            pass
+
+    def is_polling(self, module: 'AbstractModule') -> bool:
+        return weakref.ref(module) in self._entries
+
+    def get_rate(self, module: 'AbstractModule') -> PollRate:
+        return self._entries[weakref.ref(module)].rate
+
+    def set_rate(self, module: 'AbstractModule', rate: PollRate) -> None:
+        """ Change how often a module is polled, from its next poll """
+        entry = self._entries[weakref.ref(module)]
+        entry.rate = rate
+        entry.due = min(entry.due, self._loop.time() + rate.active)
+        self._wakeup.set()
+
+    def poll_soon(self, module: 'AbstractModule') -> None:
+        """ Poll a module as soon as possible, for instance because a command
+        just changed its state. Does nothing if the module is not polled. """
+        entry = self._entries.get(weakref.ref(module))
+        if entry:
+            entry.due = self._loop.time()
+            self._wakeup.set()
+
+    def subscribe(self, callback: StatusCallback) -> Callable[[], None]:
+        """ Call callback with the module after every poll.
+
+        :returns: A function that unsubscribes the callback
+        """
+        self._subscribers.append(callback)
+
+        def unsubscribe():
+            try:
+                self._subscribers.remove(callback)
+            except ValueError:
+                pass
+        return unsubscribe
+
+    async def _run(self) -> None:
+        while self._entries:
+            self._wakeup.clear()
+            # in its own coroutine so nothing here holds on to a module
+            # while waiting
+            await self._poll_due()
+            if not self._entries:
+                break
+            delay = min(entry.due for entry in self._entries.values())\
+                - self._loop.time()
+            if delay > 0:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), delay)
+                except asyncio.TimeoutError:
+                    pass
+
+    async def _poll_due(self) -> None:
+        now = self._loop.time()
+        due = [ref() for ref, entry in list(self._entries.items())
+               if entry.due <= now]
+        for module in due:
+            if module:
+                await self._poll(module)
+
+    async def _poll(self, module: 'AbstractModule') -> None:
+        try:
+            await module.poll()
+        except Exception:
+            log.exception(f'Failed to poll {module.name()} on {module.port}')
+        entry = self._entries.get(weakref.ref(module))
+        if entry is None:
+            # removed while it was polled
+            return
+        interval = entry.rate.active if module.is_changing \
+            else entry.rate.idle
+        entry.due = self._loop.time() + interval
+        for callback in list(self._subscribers):
+            try:
+                callback(module)
+            except Exception:
+                log.exception('Error in module status subscriber')
+
+
+_services: 'weakref.WeakKeyDictionary[AbstractEventLoop, ModulePollingService]'\
+    = weakref.WeakKeyDictionary()
+
+
+def get_service(loop: AbstractEventLoop) -> ModulePollingService:
+    """ The module polling service for an event loop """
+    try:
+        return _services[loop]
+    except KeyError:
+        service = ModulePollingService(loop)
+        _services[loop] = service
+        return service
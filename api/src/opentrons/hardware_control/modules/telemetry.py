@@ -0,0 +1,209 @@
+"""
+Temperature history for modules.
+
+Each temperature-controlled module records its polled readings in a
+:py:class:`TemperatureHistory`, which holds them in fixed memory at three
+resolutions: the latest raw readings, per-second averages for the last hour
+and per-minute averages for the last day (with the default capacities).
+Clients can fetch a time range of it in one call with
+:py:meth:`TemperatureHistory.query` instead of sampling live status.
+"""
+import math
+import time
+from array import array
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+RAW = 'raw'
+SECOND = '1s'
+MINUTE = '1min'
+RESOLUTIONS = (RAW, SECOND, MINUTE)
+
+_PERIODS = {SECOND: 1.0, MINUTE: 60.0}
+
+# fields whose bucket value is their last reading rather than the mean, since
+# an averaged setpoint is a temperature nobody asked for
+_SETPOINT_SUFFIX = 'target'
+
+Values = Sequence[Optional[float]]
+
+
+def _to_float(value: Optional[float]) -> float:
+    return math.nan if value is None else float(value)
+
+
+def _from_float(value: float) -> Optional[float]:
+    return None if math.isnan(value) else round(value, 3)
+
+
+class _Ring:
+    """ A fixed number of timestamped rows, overwriting the oldest """
+
+    def __init__(self, capacity: int, width: int) -> None:
+        self.capacity = capacity
+        self._times = array('d', bytes(8 * capacity))
+        self._columns = [array('d', bytes(8 * capacity))
+                         for _ in range(width)]
+        self._start = 0
+        self._len = 0
+
+    def __len__(self) -> int:
+        return self._len
+
+    def _slot(self, index: int) -> int:
+        return (self._start + index) % self.capacity
+
+    def append(self, at: float, values: Sequence[float]) -> None:
+        if self._len < self.capacity:
+            slot = self._slot(self._len)
+            self._len += 1
+        else:
+            slot = self._start
+            self._start = (self._start + 1) % self.capacity
+        self._times[slot] = at
+        for column, value in zip(self._columns, values):
+            column[slot] = value
+
+    def time_at(self, index: int) -> float:
+        return self._times[self._slot(index)]
+
+    def bisect(self, at: float, after: bool = False) -> int:
+        """ The index of the first row at or after at (or strictly after at,
+        if after) """
+        lo, hi = 0, self._len
+        while lo < hi:
+            mid = (lo + hi) // 2
+            mid_at = self.time_at(mid)
+            if mid_at < at or (after and mid_at == at):
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def rows(self, lo: int, hi: int) -> List[Tuple[float, List[float]]]:
+        rows = []
+        for index in range(lo, hi):
+            slot = self._slot(index)
+            rows.append((self._times[slot],
+                         [column[slot] for column in self._columns]))
+        return rows
+
+
+class _Bucket:
+    """ Readings accumulating towards one row of a downsampled tier """
+
+    def __init__(self, fields: Sequence[str]) -> None:
+        self._setpoint = [name.endswith(_SETPOINT_SUFFIX) for name in fields]
+        self.key: Optional[int] = None
+        self._sums = [0.0] * len(fields)
+        self._counts = [0] * len(fields)
+        self._last = [math.nan] * len(fields)
+
+    def add(self, values: Sequence[float]) -> None:
+        for index, value in enumerate(values):
+            self._last[index] = value
+            if not math.isnan(value):
+                self._sums[index] += value
+                self._counts[index] += 1
+
+    def value(self) -> List[float]:
+        return [last if setpoint else (total / count if count else math.nan)
+                for setpoint, last, total, count
+                in zip(self._setpoint, self._last, self._sums, self._counts)]
+
+    def reset(self, key: int) -> None:
+        self.key = key
+        self._sums = [0.0] * len(self._sums)
+        self._counts = [0] * len(self._counts)
+
+
+class TemperatureHistory:
+    """ Timestamped readings of a module's temperatures and targets.
+
+    :param fields: The names of the values in each reading, for instance
+                   ``('temperature', 'target')``. Fields ending in
+                   ``target`` are downsampled to their last value, the rest
+                   to their mean.
+    :param raw_capacity: How many raw readings to keep
+    :param second_capacity: How many per-second averages to keep
+    :param minute_capacity: How many per-minute averages to keep
+    """
+
+    def __init__(self, fields: Sequence[str],
+                 raw_capacity: int = 600,
+                 second_capacity: int = 3600,
+                 minute_capacity: int = 1440) -> None:
+        self.fields = tuple(fields)
+        self._tiers = {
+            RAW: _Ring(raw_capacity, len(fields)),
+            SECOND: _Ring(second_capacity, len(fields)),
+            MINUTE: _Ring(minute_capacity, len(fields)),
+        }
+        self._buckets = {resolution: _Bucket(fields)
+                         for resolution in _PERIODS}
+
+    def record(self, values: Values, at: Optional[float] = None) -> None:
+        """ Add a reading, with values in the order of :py:attr:`fields`,
+        taken at ``at`` seconds since the epoch (now by default). Readings
+        must be recorded in time order. """
+        if at is None:
+            at = time.time()
+        floats = [_to_float(value) for value in values]
+        self._tiers[RAW].append(at, floats)
+        for resolution, period in _PERIODS.items():
+            bucket = self._buckets[resolution]
+            key = int(at // period)
+            if key != bucket.key:
+                if bucket.key is not None:
+                    self._tiers[resolution].append(
+                        bucket.key * period, bucket.value())
+                bucket.reset(key)
+            bucket.add(floats)
+
+    def _pick_resolution(self, start: Optional[float]) -> str:
+        # the finest tier that reaches back to start, or the one that
+        # reaches back furthest
+        candidates = [resolution for resolution in RESOLUTIONS
+                      if len(self._tiers[resolution])]
+        if not candidates:
+            return RAW
+        if start is not None:
+            for resolution in candidates:
+                if self._tiers[resolution].time_at(0) <= start:
+                    return resolution
+        return min(candidates,
+                   key=lambda resolution: self._tiers[resolution].time_at(0))
+
+    def query(self, start: Optional[float] = None,
+              end: Optional[float] = None,
+              resolution: Optional[str] = None) -> Dict[str, Any]:
+        """ Fetch the readings between start and end (inclusive, in seconds
+        since the epoch, unbounded if None).
+
+        :param resolution: One of :py:data:`RESOLUTIONS`. By default, the
+                           finest resolution that still holds readings from
+                           ``start``.
+        :returns: A dict with the ``resolution`` used and one list per field
+                  plus ``time``, all of the same length, oldest first.
+                  Missing values are None. Downsampled rows are timestamped
+                  at the start of their second or minute, and the row still
+                  being accumulated is included.
+        """
+        if resolution is None:
+            resolution = self._pick_resolution(start)
+        elif resolution not in RESOLUTIONS:
+            raise ValueError(f'resolution must be one of {RESOLUTIONS}')
+        tier = self._tiers[resolution]
+        lo = tier.bisect(start) if start is not None else 0
+        hi = tier.bisect(end, after=True) if end is not None else len(tier)
+        rows = tier.rows(lo, hi)
+        bucket = self._buckets.get(resolution)
+        if bucket and bucket.key is not None:
+            at = bucket.key * _PERIODS[resolution]
+            if (start is None or at >= start) and (end is None or at <= end):
+                rows.append((at, bucket.value()))
+        result: Dict[str, Any] = {
+            'resolution': resolution,
+            'time': [round(at, 3) for at, _ in rows]}
+        for index, name in enumerate(self.fields):
+            result[name] = [_from_float(values[index]) for _, values in rows]
+        return result
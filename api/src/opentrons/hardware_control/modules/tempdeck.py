@@ -1,16 +1,17 @@
 import asyncio
 import logging
-from threading import Thread, Event
-from typing import Mapping, Union, Optional
+from typing import Any, Dict, Mapping, Union, Optional
 from opentrons.drivers.temp_deck import (
     SimulatingDriver, TempDeck as TempDeckDriver)
 from opentrons.drivers.temp_deck.driver import temp_locks
 from ..execution_manager import ExecutionManager
 from . import update, mod_abc, types
+from .polling import PollRate
+from .telemetry import TemperatureHistory
 
 log = logging.getLogger(__name__)
 
-TEMP_POLL_INTERVAL_SECS = 1
+TEMP_POLL_RATE = PollRate(active=0.5, idle=2)
 
 FIRST_GEN2_REVISION = 20
 
@@ -37,25 +38,12 @@ class MissingDevicePortError(Exception):
     pass
 
 
-class Poller(Thread):
-    def __init__(self, driver: Union[TempDeckDriver, SimulatingDriver]):
-        self._driver_ref = driver
-        self._stop_event = Event()
-        super().__init__(target=self._poll_temperature,
-                         name='Temperature poller for tempdeck')
-
-    def _poll_temperature(self):
-        while not self._stop_event.wait(TEMP_POLL_INTERVAL_SECS):
-            self._driver_ref.update_temperature()
-
-    def stop(self):
-        self._stop_event.set()
-
-
 class TempDeck(mod_abc.AbstractModule):
     """
     Under development. API subject to change without a version bump
     """
+    POLL_RATE = TEMP_POLL_RATE
+
     @classmethod
     async def build(cls,
                     port: str,
@@ -115,8 +103,7 @@ class TempDeck(mod_abc.AbstractModule):
         else:
             self._driver = self._build_driver(
                 simulating, sim_model)
-
-        self._poller: Optional[Poller] = None
+        self._history = TemperatureHistory(('temperature', 'target'))
 
     async def set_temperature(self, celsius: float):
         """
@@ -129,7 +116,9 @@ class TempDeck(mod_abc.AbstractModule):
         await self.wait_for_is_running()
         task = self._loop.create_task(self._driver.set_temperature(celsius))
         await self.make_cancellable(task)
-        return await task
+        result = await task
+        self._poll_soon()
+        return result
 
     async def start_set_temperature(self, celsius):
         """
@@ -140,7 +129,9 @@ class TempDeck(mod_abc.AbstractModule):
         to the nearest limit
         """
         await self.wait_for_is_running()
-        return self._driver.start_set_temperature(celsius)
+        ret = self._driver.start_set_temperature(celsius)
+        self._poll_soon()
+        return ret
 
     async def await_temperature(self, awaiting_temperature: float):
         """
@@ -154,12 +145,12 @@ class TempDeck(mod_abc.AbstractModule):
             status = self.status
 
             if status == 'heating':
-                while self.temperature < awaiting_temperature:
-                    await asyncio.sleep(0.2)
+                await self._wait_for_status(
+                    lambda: self.temperature >= awaiting_temperature)
 
             elif status == 'cooling':
-                while self.temperature > awaiting_temperature:
-                    await asyncio.sleep(0.2)
+                await self._wait_for_status(
+                    lambda: self.temperature <= awaiting_temperature)
 
         t = self._loop.create_task(_await_temperature(awaiting_temperature))
         await self.make_cancellable(t)
@@ -169,6 +160,23 @@ class TempDeck(mod_abc.AbstractModule):
         """ Stop heating/cooling and turn off the fan """
         await self.wait_for_is_running()
         self._driver.deactivate()
+        self._poll_soon()
+
+    async def _update_status(self) -> None:
+        await self._driver.poll_temperature()
+        self._history.record((self.temperature, self.target))
+
+    def temperature_history(
+            self, start: float = None, end: float = None,
+            resolution: str = None) -> Dict[str, Any]:
+        """ Polled temperatures and targets between start and end, in
+        seconds since the epoch. See :py:meth:`.TemperatureHistory.query`.
+        """
+        return self._history.query(start, end, resolution)
+
+    @property
+    def is_changing(self) -> bool:
+        return self.status in ('heating', 'cooling')
 
     @property
     def device_info(self) -> Mapping[str, str]:
@@ -221,18 +229,11 @@ class TempDeck(mod_abc.AbstractModule):
         Planned change- will connect to the correct port in case of multiple
         TempDecks
         """
-        if self._poller:
-            self._poller.stop()
-            self._poller.join()
+        self._stop_polling()
         if not self._driver.is_connected():
             self._driver.connect(self._port)
         self._device_info = self._driver.get_device_info()
-        self._poller = Poller(self._driver)
-        self._poller.start()
-
-    def __del__(self):
-        if hasattr(self, '_poller') and self._poller:
-            self._poller.stop()
+        self._start_polling()
 
     async def prep_for_update(self) -> str:
         model = self._device_info and self._device_info.get('model')
@@ -240,11 +241,7 @@ class TempDeck(mod_abc.AbstractModule):
             raise types.UpdateError("This Temperature Module can't be updated."
                                     "Please contact Opentrons Support.")
 
-        if self._poller:
-            self._poller.stop()
-            self._poller.join()
-        del self._poller
-        self._poller = None
+        self._stop_polling()
         self._driver.enter_programming_mode()
         new_port = await update.find_bootloader_port()
         return new_port or self.port
@@ -1,21 +1,30 @@
 import asyncio
 import logging
-from typing import Union, Optional, List, Callable
+from typing import Any, Dict, Union, Optional, List, Callable
 from ..execution_manager import ExecutionManager
 from . import types, update, mod_abc
+from .polling import PollRate
+from .telemetry import TemperatureHistory
 from opentrons.drivers.thermocycler.driver import (
     HOLD_TIME_FUZZY_SECONDS,
+    POLLING_FREQUENCY_MS,
     SimulatingDriver,
     Thermocycler as ThermocyclerDriver)
 
 
 MODULE_LOG = logging.getLogger(__name__)
 
+# the driver's hold time and block temperature stability checks expect a
+# poll every POLLING_FREQUENCY_MS while anything is changing
+TC_POLL_RATE = PollRate(active=POLLING_FREQUENCY_MS / 1000, idle=2)
+
 
 class Thermocycler(mod_abc.AbstractModule):
     """
     Under development. API subject to change without a version bump
     """
+    POLL_RATE = TC_POLL_RATE
+
     @classmethod
     async def build(cls,
                     port: str,
@@ -76,6 +85,8 @@ class Thermocycler(mod_abc.AbstractModule):
             sim_model,
             interrupt_callback)
 
+        self._history = TemperatureHistory(
+            ('temperature', 'target', 'lid_temp', 'lid_target'))
         self._total_cycle_count: Optional[int] = None
         self._current_cycle_index: Optional[int] = None
         self._total_step_count: Optional[int] = None
@@ -90,29 +101,39 @@ class Thermocycler(mod_abc.AbstractModule):
     async def deactivate_lid(self):
         """ Deactivate the lid heating pad"""
         await self.wait_for_is_running()
-        return await self._driver.deactivate_lid()
+        result = await self._driver.deactivate_lid()
+        self._poll_soon()
+        return result
 
     async def deactivate_block(self):
         """ Deactivate the block peltiers"""
         await self.wait_for_is_running()
         self._clear_cycle_counters()
-        return await self._driver.deactivate_block()
+        result = await self._driver.deactivate_block()
+        self._poll_soon()
+        return result
 
     async def deactivate(self):
         """ Deactivate the block peltiers and lid heating pad"""
         await self.wait_for_is_running()
         self._clear_cycle_counters()
-        return await self._driver.deactivate_all()
+        result = await self._driver.deactivate_all()
+        self._poll_soon()
+        return result
 
     async def open(self) -> str:
         """ Open the lid if it is closed"""
         await self.wait_for_is_running()
-        return await self._driver.open()
+        result = await self._driver.open()
+        self._poll_soon()
+        return result
 
     async def close(self) -> str:
         """ Close the lid if it is open"""
         await self.wait_for_is_running()
-        return await self._driver.close()
+        result = await self._driver.close()
+        self._poll_soon()
+        return result
 
     async def set_temperature(self, temperature,
                               hold_time_seconds: float = None,
@@ -128,6 +149,7 @@ class Thermocycler(mod_abc.AbstractModule):
                                            hold_time=hold_time,
                                            ramp_rate=ramp_rate,
                                            volume=volume)
+        self._poll_soon()
         if hold_time:
             task = self._loop.create_task(
                 self.wait_for_hold(hold_time))
@@ -182,6 +204,7 @@ class Thermocycler(mod_abc.AbstractModule):
         """ Set the lid temperature in deg Celsius """
         await self.wait_for_is_running()
         await self._driver.set_lid_temperature(temp=temperature)
+        self._poll_soon()
         task = self._loop.create_task(self.wait_for_lid_temp())
         await self.make_cancellable(task)
         await task
@@ -192,8 +215,8 @@ class Thermocycler(mod_abc.AbstractModule):
 
         Subject to change without a version bump.
         """
-        while self._driver.lid_temp_status != 'holding at target':
-            await asyncio.sleep(0.1)
+        await self._wait_for_status(
+            lambda: self._driver.lid_temp_status == 'holding at target')
 
     async def wait_for_temp(self):
         """
@@ -201,8 +224,8 @@ class Thermocycler(mod_abc.AbstractModule):
 
         Subject to change without a version bump.
         """
-        while self.status != 'holding at target':
-            await asyncio.sleep(0.1)
+        await self._wait_for_status(
+            lambda: self.status == 'holding at target')
 
     async def wait_for_hold(self, hold_time=0):
         """
@@ -217,8 +240,27 @@ class Thermocycler(mod_abc.AbstractModule):
         if 0 < hold_time <= HOLD_TIME_FUZZY_SECONDS:
             await asyncio.sleep(hold_time)
         else:
-            while self.hold_time != 0:
-                await asyncio.sleep(0.1)
+            await self._wait_for_status(lambda: self.hold_time == 0)
+
+    async def _update_status(self) -> None:
+        await self._driver.update_status()
+        self._history.record(
+            (self.temperature, self.target, self.lid_temp, self.lid_target))
+
+    def temperature_history(
+            self, start: float = None, end: float = None,
+            resolution: str = None) -> Dict[str, Any]:
+        """ Polled block and lid temperatures and targets between start and
+        end, in seconds since the epoch. See
+        :py:meth:`.TemperatureHistory.query`.
+        """
+        return self._history.query(start, end, resolution)
+
+    @property
+    def is_changing(self) -> bool:
+        return self.status in ('heating', 'cooling') \
+            or self.lid_temp_status == 'heating' \
+            or bool(self.hold_time)
 
     @property
     def lid_target(self):
@@ -303,7 +345,7 @@ class Thermocycler(mod_abc.AbstractModule):
     def interrupt_callback(self):
         """ Fetch the current interrupt callback
 
-        Exposes the interrupt callback used with the TCPoller, so it can be re-
+        Exposes the interrupt callback used with the driver, so it can be re-
         hooked in the new module instance after a firmware update.
         """
         return self._interrupt_cb
@@ -318,12 +360,14 @@ class Thermocycler(mod_abc.AbstractModule):
     async def _connect(self):
         await self._driver.connect(self._port)
         self._device_info = await self._driver.get_device_info()
+        self._start_polling()
 
     @property
     def port(self):
         return self._port
 
     async def prep_for_update(self):
+        self._stop_polling()
         await self._driver.enter_programming_mode()
 
         new_port = await update.find_bootloader_port()
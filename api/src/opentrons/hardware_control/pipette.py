@@ -2,6 +2,7 @@ from __future__ import annotations
 """ Classes and functions for pipette state tracking
 """
 from dataclasses import asdict, replace
+import itertools
 import logging
 from typing import Any, Dict, Optional, Set, Tuple, Union, TYPE_CHECKING
 
@@ -25,6 +26,9 @@ RECONFIG_KEYS = {'quirks'}
 
 mod_log = logging.getLogger(__name__)
 
+# Shared by all pipettes so that a version also identifies the pipette
+_state_versions = itertools.count(1)
+
 
 class Pipette:
     """ A class to gather and track pipette state and configs.
@@ -55,12 +59,12 @@ class Pipette:
         self._tip_overlap_map = self._config.tip_overlap
         self._has_tip = False
         self._pipette_id = pipette_id
+        self._state_version = next(_state_versions)
         self._log = mod_log.getChild(self._pipette_id
                                      if self._pipette_id else '<unknown>')
         self._log.info("loaded: {}, pipette offset: {}".format(
             config.model, self._pipette_offset.offset))
-        self.ready_to_aspirate = False
-        #: True if ready to aspirate
+        self._ready_to_aspirate = False
         self._aspirate_flow_rate\
             = self._config.default_aspirate_flow_rates['2.0']
         self._dispense_flow_rate\
@@ -91,10 +95,23 @@ class Pipette:
     def acting_as(self) -> PipetteName:
         return self._acting_as
 
+    @property
+    def state_version(self) -> int:
+        """ A number that changes whenever the state of this pipette changes.
+
+        Versions are never reused, even between pipettes, so two equal
+        versions always mean the same pipette in the same state.
+        """
+        return self._state_version
+
+    def _state_changed(self):
+        self._state_version = next(_state_versions)
+
     def update_pipette_offset(self, offset_cal: PipetteOffsetByPipetteMount):
         self._log.info("updating pipette offset to {}"
                        .format(offset_cal.offset))
         self._pipette_offset = offset_cal
+        self._state_changed()
 
     @property
     def config(self) -> pipette_config.PipetteConfig:
@@ -110,6 +127,7 @@ class Pipette:
                                **{elem_name: elem_val})
         # Update the cached dict representation
         self._config_as_dict = asdict(self._config)
+        self._state_changed()
 
     @property
     def name(self) -> PipetteName:
@@ -184,6 +202,7 @@ class Pipette:
     @current_tip_length.setter
     def current_tip_length(self, tip_length: float):
         self._current_tip_length = tip_length
+        self._state_changed()
 
     @property
     def current_tiprack_diameter(self) -> float:
@@ -193,6 +212,7 @@ class Pipette:
     @current_tiprack_diameter.setter
     def current_tiprack_diameter(self, diameter: float):
         self._current_tiprack_diameter = diameter
+        self._state_changed()
 
     @property
     def aspirate_flow_rate(self) -> float:
@@ -203,6 +223,7 @@ class Pipette:
     def aspirate_flow_rate(self, new_flow_rate: float):
         assert new_flow_rate > 0
         self._aspirate_flow_rate = new_flow_rate
+        self._state_changed()
 
     @property
     def dispense_flow_rate(self) -> float:
@@ -213,6 +234,7 @@ class Pipette:
     def dispense_flow_rate(self, new_flow_rate: float):
         assert new_flow_rate > 0
         self._dispense_flow_rate = new_flow_rate
+        self._state_changed()
 
     @property
     def blow_out_flow_rate(self) -> float:
@@ -223,6 +245,7 @@ class Pipette:
     def blow_out_flow_rate(self, new_flow_rate: float):
         assert new_flow_rate > 0
         self._blow_out_flow_rate = new_flow_rate
+        self._state_changed()
 
     @property
     def working_volume(self) -> float:
@@ -233,6 +256,7 @@ class Pipette:
     def working_volume(self, tip_volume: float):
         """ The working volume is the current tip max volume """
         self._working_volume = min(self.config.max_volume, tip_volume)
+        self._state_changed()
 
     @property
     def available_volume(self) -> float:
@@ -243,14 +267,17 @@ class Pipette:
         assert new_volume >= 0
         assert new_volume <= self.working_volume
         self._current_volume = new_volume
+        self._state_changed()
 
     def add_current_volume(self, volume_incr: float):
         assert self.ok_to_add_volume(volume_incr)
         self._current_volume += volume_incr
+        self._state_changed()
 
     def remove_current_volume(self, volume_incr: float):
         assert self._current_volume >= volume_incr
         self._current_volume -= volume_incr
+        self._state_changed()
 
     def ok_to_add_volume(self, volume_incr: float) -> bool:
         return self.current_volume + volume_incr <= self.working_volume
@@ -269,6 +296,7 @@ class Pipette:
         assert not self.has_tip
         self._has_tip = True
         self._current_tip_length = tip_length
+        self._state_changed()
 
     def remove_tip(self) -> None:
         """
@@ -278,11 +306,22 @@ class Pipette:
         assert self.has_tip
         self._has_tip = False
         self._current_tip_length = 0.0
+        self._state_changed()
 
     @property
     def has_tip(self) -> bool:
         return self._has_tip
 
+    @property
+    def ready_to_aspirate(self) -> bool:
+        """ True if ready to aspirate """
+        return self._ready_to_aspirate
+
+    @ready_to_aspirate.setter
+    def ready_to_aspirate(self, ready: bool):
+        self._ready_to_aspirate = ready
+        self._state_changed()
+
     def ul_per_mm(self, ul: float, action: UlPerMmAction) -> float:
         sequence = self._config.ul_per_mm[action]
         return pipette_config.piecewise_volume_conversion(ul, sequence)
@@ -4,8 +4,9 @@ import threading
 import logging
 import asyncio
 import functools
-from typing import Generic, TypeVar, Any, Optional
-from .adapters import SynchronousAdapter
+from typing import Generic, TypeVar, Any, Callable, Dict, Optional, Tuple
+from .adapters import (
+    SynchronousAdapter, is_coroutine_method, set_loop_thread)
 from .modules.mod_abc import AbstractModule
 
 MODULE_LOG = logging.getLogger(__name__)
@@ -18,6 +19,9 @@ class ThreadManagerException(Exception):
 async def call_coroutine_threadsafe(
         loop: asyncio.AbstractEventLoop,
         coro, *args, **kwargs) -> asyncio.Future:
+    if asyncio.get_running_loop() is loop:
+        # already on the managed loop, no need to hop threads
+        return await coro(*args, **kwargs)
     fut = asyncio.run_coroutine_threadsafe(coro(*args, **kwargs), loop)
     wrapped = asyncio.wrap_future(fut)
     return await wrapped
@@ -33,6 +37,8 @@ class CallBridger(Generic[WrappedObj]):
             loop: asyncio.AbstractEventLoop) -> None:
         self.wrapped_obj = wrapped_obj
         self._loop = loop
+        # attribute name -> (function, instance, bridged wrapper)
+        self._dispatch: Dict[str, Tuple[Callable, Any, Callable]] = {}
 
     def __getattribute__(self, attr_name: str) -> Any:
         # Almost every attribute retrieved from us will be for people actually
@@ -45,16 +51,26 @@ class CallBridger(Generic[WrappedObj]):
             # Maybe this actually was for us? Let’s find it
             return object.__getattribute__(self, attr_name)
 
+        func = getattr(attr, '__func__', None)
+        if func is not None:
+            # A bound method. Reuse the wrapper we built for it last time
+            # unless the method has been replaced since.
+            dispatch = object.__getattribute__(self, '_dispatch')
+            bound_to = attr.__self__
+            cached = dispatch.get(attr_name)
+            if cached and cached[0] is func and cached[1] is bound_to:
+                return cached[2]
+            if is_coroutine_method(func):
+                wrapper = _bridge(loop, attr)
+            else:
+                wrapper = attr
+            dispatch[attr_name] = (func, bound_to, wrapper)
+            return wrapper
+
         if asyncio.iscoroutinefunction(attr):
             # Return coroutine result of async function
             # executed in managed thread to calling thread
-
-            @functools.wraps(attr)
-            async def wrapper(*args, **kwargs):
-                return await call_coroutine_threadsafe(
-                    loop, attr, *args, **kwargs)
-
-            return wrapper
+            return _bridge(loop, attr)
 
         elif asyncio.iscoroutine(attr):
             # Return awaitable coroutine properties run in managed thread/loop
@@ -65,6 +81,15 @@ class CallBridger(Generic[WrappedObj]):
         return attr
 
 
+def _bridge(loop: asyncio.AbstractEventLoop, attr: Callable) -> Callable:
+    @functools.wraps(attr)
+    async def wrapper(*args, **kwargs):
+        return await call_coroutine_threadsafe(
+            loop, attr, *args, **kwargs)
+
+    return wrapper
+
+
 # TODO: BC 2020-02-25 instead of overwriting __get_attribute__ in this class
 # use inspect.getmembers to iterate over appropriate members of adapted
 # instance and setattr on the outer instance with the proper threadsafe
@@ -143,6 +168,7 @@ class ThreadManager:
     def _build_and_start_loop(self, builder, *args, **kwargs):
         loop = asyncio.new_event_loop()
         asyncio.set_event_loop(loop)
+        set_loop_thread(loop)
         self._loop = loop
         try:
             managed_obj = loop.run_until_complete(builder(*args,
@@ -991,6 +991,13 @@ class InstrumentContext(CommandPublisher):
               gradient is linear (lambda x: x), however a method can be passed
               with the `gradient` keyword argument to create a custom curve.
 
+            * *optimize_travel* (``boolean``) --
+              (:py:meth:`distribute` and :py:meth:`consolidate` only)
+              If `True`, the wells visited with each tip full of liquid are
+              visited in the order that travels least, rather than in the
+              order given. If `False` (default), wells are visited in the
+              order given.
+
         :returns: This instance
         """
         self._log.debug("Transfer {} from {} to {}".format(
@@ -1064,7 +1071,9 @@ class InstrumentContext(CommandPublisher):
             blow_out_strategy=blow_out_strategy or
             default_args.blow_out_strategy,
             touch_tip_strategy=(touch_tip or
-                                default_args.touch_tip_strategy)
+                                default_args.touch_tip_strategy),
+            optimize_travel=bool(kwargs.get('optimize_travel',
+                                            default_args.optimize_travel))
         )
         transfer_options = transfers.TransferOptions(transfer=transfer_args,
                                                      mix=mix_opts)
@@ -1075,8 +1084,11 @@ class InstrumentContext(CommandPublisher):
         return self
 
     def _execute_transfer(self, plan: transfers.TransferPlan):
-        for cmd in plan:
-            getattr(self, cmd['method'])(*cmd['args'], **cmd['kwargs'])
+        for step in plan:
+            getattr(self, step.method)(*step.args, **step.kwargs)
+        if plan.travel_saved:
+            self._log.info(
+                f"Reordering wells saved {plan.travel_saved:.0f} mm of travel")
 
     @requires_version(2, 0)
     def delay(self):
@@ -11,8 +11,9 @@ import logging
 
 from pathlib import Path
 from itertools import dropwhile
+from types import MappingProxyType
 from typing import (
-    Any, AnyStr, List, Dict,
+    Any, AnyStr, List, Dict, Mapping, Sequence,
     Optional, Union, Tuple,
     TYPE_CHECKING)
 
@@ -28,7 +29,7 @@ from opentrons.types import Location, Point, LocationLabware
 from opentrons.protocols.api_support.types import APIVersion
 from opentrons.protocols.api_support.definitions import (
     MAX_SUPPORTED_VERSION)
-from opentrons.protocols.geometry.deck_item import DeckItem
+from opentrons.protocols.geometry.deck_item import DeckItem, HeightListener
 if TYPE_CHECKING:
     from opentrons.protocols.geometry.module_geometry import ModuleGeometry  # noqa: F401, E501
     from opentrons_shared_data.labware.dev_types import (
@@ -199,17 +200,58 @@ class Well:
     def __repr__(self):
         return self._impl.get_display_name()
 
+    def _key(self) -> Tuple[int, str]:
+        # The top point moves when the labware is recalibrated, so wells are
+        # identified by their labware and name, which stay the same
+        return id(self._geometry.parent), self._impl.get_name()
+
     def __eq__(self, other: object) -> bool:
         """
-        Assuming that equality of wells in this system is having the same
-        absolute coordinates for the top.
+        Wells are equal if they are the same well of the same labware.
         """
         if not isinstance(other, Well):
             return NotImplemented
-        return self.top().point == other.top().point
+        return self._key() == other._key()
 
     def __hash__(self):
-        return hash(self.top().point)
+        return hash(self._key())
+
+
+class _WellViews:
+    """ The wells of a labware, wrapped once and arranged in every order the
+    accessors of :py:class:`Labware` return them in """
+
+    def __init__(self,
+                 implementation: LabwareInterface,
+                 api_level: APIVersion) -> None:
+        self.source = implementation.get_wells()
+        self.grid = implementation.get_well_grid()
+        self.by_impl: Dict[int, Well] = {
+            id(impl): Well(well_implementation=impl, api_level=api_level)
+            for impl in self.source}
+        self.wells: Sequence[Well] = tuple(
+            self.by_impl[id(impl)] for impl in self.source)
+        self.by_name: Mapping[str, Well] = MappingProxyType({
+            name: self.by_impl[id(impl)]
+            for name, impl in implementation.get_wells_by_name().items()})
+        self.rows_by_name = self._wrap(self.grid.get_row_dict())
+        self.rows = tuple(self.rows_by_name[header]
+                          for header in self.grid.row_headers())
+        self.columns_by_name = self._wrap(self.grid.get_column_dict())
+        self.columns = tuple(self.columns_by_name[header]
+                             for header in self.grid.column_headers())
+
+    def _wrap(self, by_header: Mapping[str, Sequence[WellImplementation]]) \
+            -> Mapping[str, Sequence[Well]]:
+        return MappingProxyType({
+            header: tuple(self.by_impl[id(impl)] for impl in impls)
+            for header, impls in by_header.items()})
+
+    def is_current(self, implementation: LabwareInterface) -> bool:
+        # Wells follow calibration, but an implementation may still replace
+        # them
+        return self.source is implementation.get_wells() \
+            and self.grid is implementation.get_well_grid()
 
 
 class Labware(DeckItem):
@@ -261,6 +303,7 @@ class Labware(DeckItem):
                 f'version or update your robot.')
         self._api_version = api_level
         self._implementation = implementation
+        self._views: Optional[_WellViews] = None
 
     @property
     def separate_calibration(self) -> bool:
@@ -272,7 +315,7 @@ class Labware(DeckItem):
         return self._api_version
 
     def __getitem__(self, key: str) -> Well:
-        return self.wells_by_name()[key]
+        return self._well_views().by_name[key]
 
     @property  # type: ignore
     @requires_version(2, 0)
@@ -343,13 +386,13 @@ class Labware(DeckItem):
     @requires_version(2, 0)
     def well(self, idx) -> Well:
         """Deprecated---use result of `wells` or `wells_by_name`"""
+        views = self._well_views()
         if isinstance(idx, int):
-            res = self._implementation.get_wells()[idx]
+            return views.wells[idx]
         elif isinstance(idx, str):
-            res = self._implementation.get_wells_by_name()[idx]
+            return views.by_name[idx]
         else:
-            res = NotImplemented
-        return self._well_from_impl(res)
+            return self._well_from_impl(NotImplemented)
 
     @requires_version(2, 0)
     def wells(self, *args) -> List[Well]:
@@ -369,16 +412,15 @@ class Labware(DeckItem):
 
         :return: Ordered list of all wells in a labware
         """
+        views = self._well_views()
         if not args:
-            res = self._implementation.get_wells()
+            return list(views.wells)
         elif isinstance(args[0], int):
-            res = [self._implementation.get_wells()[idx] for idx in args]
+            return [views.wells[idx] for idx in args]
         elif isinstance(args[0], str):
-            by_name = self._implementation.get_wells_by_name()
-            res = [by_name[idx] for idx in args]
+            return [views.by_name[idx] for idx in args]
         else:
             raise TypeError
-        return [self._well_from_impl(w) for w in res]
 
     @requires_version(2, 0)
     def wells_by_name(self) -> Dict[str, Well]:
@@ -391,11 +433,7 @@ class Labware(DeckItem):
 
         :return: Dictionary of well objects keyed by well name
         """
-        wells = self._implementation.get_wells_by_name()
-        return {
-            k: self._well_from_impl(v)
-            for k, v in wells.items()
-        }
+        return dict(self._well_views().by_name)
 
     @requires_version(2, 0)
     def wells_by_index(self) -> Dict[str, Well]:
@@ -421,16 +459,8 @@ class Labware(DeckItem):
 
         :return: A list of row lists
         """
-        grid = self._implementation.get_well_grid()
-        if not args:
-            res = grid.get_rows()
-        elif isinstance(args[0], int):
-            res = [grid.get_rows()[idx] for idx in args]
-        elif isinstance(args[0], str):
-            res = [grid.get_row(idx) for idx in args]
-        else:
-            raise TypeError
-        return [[self._well_from_impl(w) for w in row] for row in res]
+        views = self._well_views()
+        return self._select(views.rows, views.rows_by_name, args)
 
     @requires_version(2, 0)
     def rows_by_name(self) -> Dict[str, List[Well]]:
@@ -443,12 +473,8 @@ class Labware(DeckItem):
 
         :return: Dictionary of Well lists keyed by row name
         """
-        row_dict = self._implementation.get_well_grid().get_row_dict()
         return {
-            k: [
-                self._well_from_impl(w) for w in v
-            ] for k, v in row_dict.items()
-        }
+            k: list(v) for k, v in self._well_views().rows_by_name.items()}
 
     @requires_version(2, 0)
     def rows_by_index(self) -> Dict[str, List[Well]]:
@@ -475,16 +501,8 @@ class Labware(DeckItem):
 
         :return: A list of column lists
         """
-        grid = self._implementation.get_well_grid()
-        if not args:
-            res = grid.get_columns()
-        elif isinstance(args[0], int):
-            res = [grid.get_columns()[idx] for idx in args]
-        elif isinstance(args[0], str):
-            res = [grid.get_column(idx) for idx in args]
-        else:
-            raise TypeError
-        return [[self._well_from_impl(w) for w in col] for col in res]
+        views = self._well_views()
+        return self._select(views.columns, views.columns_by_name, args)
 
     @requires_version(2, 0)
     def columns_by_name(self) -> Dict[str, List[Well]]:
@@ -498,12 +516,8 @@ class Labware(DeckItem):
 
         :return: Dictionary of Well lists keyed by column name
         """
-        column_dict = self._implementation.get_well_grid().get_column_dict()
         return {
-            k: [
-                self._well_from_impl(w) for w in v
-            ] for k, v in column_dict.items()
-        }
+            k: list(v) for k, v in self._well_views().columns_by_name.items()}
 
     @requires_version(2, 0)
     def columns_by_index(self) -> Dict[str, List[Well]]:
@@ -523,6 +537,9 @@ class Labware(DeckItem):
         """
         return self._implementation.highest_z
 
+    def add_height_listener(self, listener: HeightListener) -> None:
+        self._implementation.add_height_listener(lambda _: listener(self))
+
     @property
     def _is_tiprack(self) -> bool:
         """ as is_tiprack but not subject to version checking for speed """
@@ -664,9 +681,30 @@ class Labware(DeckItem):
         if self._is_tiprack:
             self._implementation.reset_tips()
 
+    def _well_views(self) -> _WellViews:
+        if not self._views or not self._views.is_current(
+                self._implementation):
+            self._views = _WellViews(self._implementation, self._api_version)
+        return self._views
+
+    @staticmethod
+    def _select(ordered: Sequence[Sequence[Well]],
+                by_header: Mapping[str, Sequence[Well]],
+                args: Tuple[Any, ...]) -> List[List[Well]]:
+        # The rows or columns named or indexed by args, in order
+        if not args:
+            return [list(wells) for wells in ordered]
+        elif isinstance(args[0], int):
+            return [list(ordered[idx]) for idx in args]
+        elif isinstance(args[0], str):
+            return [list(by_header.get(idx, ())) for idx in args]
+        else:
+            raise TypeError
+
     def _well_from_impl(self, well: WellImplementation) -> Well:
-        return Well(well_implementation=well,
-                    api_level=self._api_version)
+        cached = self._well_views().by_impl.get(id(well))
+        return cached or Well(well_implementation=well,
+                              api_level=self._api_version)
 
 
 def save_definition(
@@ -78,9 +78,7 @@ class ModuleContext(CommandPublisher, Generic[GeometryType]):  # noqa: E302
                         :py:meth:`load_labware`.
         :returns: The properly-linked labware object
         """
-        mod_labware = self._geometry.add_labware(labware)
-        self._ctx._implementation.get_deck().recalculate_high_z()
-        return mod_labware
+        return self._geometry.add_labware(labware)
 
     @requires_version(2, 0)
     def load_labware(
@@ -1,7 +1,10 @@
 import enum
+import itertools
+import math
+from types import MappingProxyType
 from typing import (Any, Dict, List, Optional, Union, NamedTuple,
-                    Callable, Generator, Iterator, Tuple,
-                    TYPE_CHECKING, TypeVar)
+                    Callable, Generator, Iterable, Iterator, Mapping,
+                    Sequence, Tuple, TYPE_CHECKING, TypeVar, cast)
 from opentrons.protocol_api.labware import Well
 from opentrons import types
 from opentrons.protocols.api_support.types import APIVersion
@@ -9,6 +12,8 @@ from opentrons.protocols.api_support.types import APIVersion
 if TYPE_CHECKING:
     from opentrons.protocol_api.contexts import InstrumentContext  # noqa: F501
     from opentrons.protocols.execution.dev_types import Dictable  # noqa: F501
+    from opentrons.protocols.geometry.well_geometry import \
+        WellGeometryTable
 
 
 class MixStrategy(enum.Enum):
@@ -57,6 +62,7 @@ class Transfer(NamedTuple):
     drop_tip_strategy: DropTipStrategy = DropTipStrategy.TRASH
     blow_out_strategy: BlowOutStrategy = BlowOutStrategy.NONE
     touch_tip_strategy: TouchTipStrategy = TouchTipStrategy.NEVER
+    optimize_travel: bool = False
 
 
 Transfer.new_tip.__doc__ = """
@@ -186,6 +192,19 @@ Transfer.touch_tip_strategy.__doc__ = """
     :py:attr:`.TransferOptions.touch_tip`.
     """
 
+Transfer.optimize_travel.__doc__ = """
+    Controls whether to reorder the wells visited with each tip full of
+    liquid to shorten the distance travelled.
+
+    In a distribute, the destinations dispensed to from one aspirate are
+    visited in the shortest order found rather than the order given, and
+    in a consolidate so are the sources aspirated from before one dispense.
+    Each well still gets its own volume, and the wells that share a tip
+    full are the same as without reordering. The order is found with a
+    nearest neighbour tour improved by 2-opt, and never travels further
+    than the order given. See :py:attr:`.TransferPlan.travel_saved`.
+    """
+
 
 class PickUpTipOpts(NamedTuple):
     """
@@ -351,6 +370,117 @@ TransferOptions.dispense.__doc__ = """
     """
 
 
+_NO_KWARGS: Mapping[str, Any] = MappingProxyType({})
+
+
+class TransferStep(NamedTuple):
+    """ One call to make on the instrument to carry out a transfer.
+
+    For compatibility, a step can be indexed by the keys of, and compares
+    equal to, the equivalent
+    ``{'method': ..., 'args': [...], 'kwargs': {...}}`` dict.
+    """
+    method: str
+    args: Tuple = ()
+    kwargs: Mapping[str, Any] = _NO_KWARGS
+
+    def __getitem__(self, key):
+        if isinstance(key, str) and key in self._fields:
+            return getattr(self, key)
+        return tuple.__getitem__(self, key)
+
+    def _as_dict(self) -> Dict[str, Any]:
+        return {'method': self.method,
+                'args': list(self.args),
+                'kwargs': dict(self.kwargs)}
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Mapping):
+            return self._as_dict() == other
+        return tuple.__eq__(self, other)
+
+    def __ne__(self, other: object) -> bool:
+        return not self == other
+
+
+T = TypeVar('T')
+XY = Tuple[float, float]
+
+
+def _repeat_each(items: Iterable[T], times: int) -> Iterator[T]:
+    return itertools.chain.from_iterable(
+        itertools.repeat(item, times) for item in items)
+
+
+def _xys(targets: Sequence[Union[Well, types.Location]]) -> List[XY]:
+    """ The XY positions of targets. The tops of wells are read from their
+    labware's geometry table, one labware at a time. """
+    xys: List[XY] = [(0.0, 0.0)] * len(targets)
+    by_table: Dict[int, Tuple['WellGeometryTable', List[int]]] = {}
+    for position, target in enumerate(targets):
+        if isinstance(target, types.Location):
+            xys[position] = target.point.x, target.point.y
+        else:
+            table = target.geometry.table
+            by_table.setdefault(id(table), (table, []))[1].append(position)
+    for table, positions in by_table.values():
+        names = [cast(Well, targets[position]).geometry.name
+                 for position in positions]
+        tops = table.tops(names=names)[:, :2].tolist()
+        for position, (x, y) in zip(positions, tops):
+            xys[position] = x, y
+    return xys
+
+
+def _distance(a: XY, b: XY) -> float:
+    return math.hypot(b[0] - a[0], b[1] - a[1])
+
+
+def _tour_length(start: XY, stops: List[XY]) -> float:
+    """ The length of going from start through stops and back """
+    route = [start, *stops, start]
+    return sum(_distance(a, b) for a, b in zip(route, route[1:]))
+
+
+def _nearest_neighbour_order(start: XY, stops: List[XY]) -> List[int]:
+    order: List[int] = []
+    left = list(range(len(stops)))
+    here = start
+    while left:
+        nearest = min(left, key=lambda i: _distance(here, stops[i]))
+        left.remove(nearest)
+        order.append(nearest)
+        here = stops[nearest]
+    return order
+
+
+def _two_opt(start: XY, stops: List[XY], order: List[int]) -> List[int]:
+    """ Shorten the tour from start through stops in order and back by
+    reversing parts of it until no reversal makes it shorter """
+    order = list(order)
+
+    def at(position: int) -> XY:
+        # positions 0 and len(order) + 1 are the start
+        if 0 < position <= len(order):
+            return stops[order[position - 1]]
+        return start
+
+    improved = True
+    while improved:
+        improved = False
+        for first in range(1, len(order)):
+            for last in range(first + 1, len(order) + 1):
+                before, after = at(first - 1), at(last + 1)
+                change = (_distance(before, at(last))
+                          + _distance(at(first), after)
+                          - _distance(before, at(first))
+                          - _distance(at(last), after))
+                if change < -1e-9:
+                    order[first - 1:last] = reversed(order[first - 1:last])
+                    improved = True
+    return order
+
+
 class TransferPlan:
     """ Calculate and carry state for an arbitrary transfer
 
@@ -358,7 +488,9 @@ class TransferPlan:
 
     It handles calculations based on pipette channels, tip management, and all
     the various little commands that can be involved in a transfer. It can be
-    iterated to resolve methods to call to execute the plan.
+    iterated to resolve methods to call to execute the plan. The steps are
+    worked out as they are iterated, so a transfer can start moving before
+    the rest of it is planned, and a large transfer is never held in memory.
     """
     def __init__(self,
                  volume,
@@ -402,17 +534,20 @@ class TransferPlan:
 
         total_xfers = max(len(sources), len(dests))
 
-        self._volumes = self._create_volume_list(volume, total_xfers)
+        self._check_volumes(volume, total_xfers)
+        self._volume = volume
+        self._total_xfers = total_xfers
         self._sources = sources
         self._dests = dests
         self._options = options or TransferOptions()
         self._strategy = self._options.transfer
-        self._tip_opts = self._options.pick_up_tip
-        self._blow_opts = self._options.blow_out
-        self._touch_tip_opts = self._options.touch_tip
+        self._tip_opts = self._params(self._options.pick_up_tip)
+        self._blow_opts = self._params(self._options.blow_out)
+        self._touch_tip_opts = self._params(self._options.touch_tip)
         self._mix_before_opts = self._options.mix.mix_before
         self._mix_after_opts = self._options.mix.mix_after
         self._max_volume = max_volume
+        self._travel_saved = 0.0
 
         if not mode:
             if len(sources) < len(dests):
@@ -424,17 +559,26 @@ class TransferPlan:
         else:
             self._mode = TransferMode[mode.upper()]
 
-    def __iter__(self):
+    @property
+    def travel_saved(self) -> float:
+        """ How much shorter, in mm, reordering wells has made the xy travel
+        in the steps planned so far. Always 0 unless
+        :py:attr:`.Transfer.optimize_travel` is set. The distances are
+        straight lines between wells, ignoring arcs up and down. """
+        return self._travel_saved
+
+    def __iter__(self) -> Iterator[TransferStep]:
+        self._travel_saved = 0.0
         if self._strategy.new_tip == types.TransferTipPolicy.ONCE:
-            yield self._format_dict('pick_up_tip', kwargs=self._tip_opts)
+            yield self._step('pick_up_tip', kwargs=self._tip_opts)
         yield from {TransferMode.CONSOLIDATE: self._plan_consolidate,
                     TransferMode.DISTRIBUTE: self._plan_distribute,
                     TransferMode.TRANSFER: self._plan_transfer}[self._mode]()
         if self._strategy.new_tip == types.TransferTipPolicy.ONCE:
             if self._strategy.drop_tip_strategy == DropTipStrategy.RETURN:
-                yield self._format_dict('return_tip')
+                yield self._step('return_tip')
             else:
-                yield self._format_dict('drop_tip')
+                yield self._step('drop_tip')
 
     def _plan_transfer(self):
         """
@@ -471,13 +615,13 @@ class TransferPlan:
         sources, dests = self._extend_source_target_lists(
             self._sources, self._dests)
         plan_iter = self._expand_for_volume_constraints(
-            self._volumes, zip(sources, dests),
+            self._volumes(), zip(sources, dests),
             self._instr.max_volume
             - self._strategy.disposal_volume
             - self._strategy.air_gap)
         for step_vol, (src, dest) in plan_iter:
             if self._strategy.new_tip == types.TransferTipPolicy.ALWAYS:
-                yield self._format_dict('pick_up_tip', kwargs=self._tip_opts)
+                yield self._step('pick_up_tip', kwargs=self._tip_opts)
             max_vol = self._max_volume - \
                 self._strategy.disposal_volume - self._strategy.air_gap
             xferred_vol = 0.0
@@ -493,21 +637,24 @@ class TransferPlan:
     @staticmethod
     def _extend_source_target_lists(
             sources: List[Union[Well, types.Location]],
-            targets: List[Union[Well, types.Location]]):
-        """Extend source or target list to match the length of the other
+            targets: List[Union[Well, types.Location]]
+    ) -> Tuple[Iterable[Union[Well, types.Location]],
+               Iterable[Union[Well, types.Location]]]:
+        """Extend source or target list to match the length of the other,
+        by repeating each of its items as they are iterated
         """
         if len(sources) < len(targets):
             if len(targets) % len(sources) != 0:
                 raise ValueError(
                     'Source and destination lists must be divisible')
-            sources = [source for source in sources
-                       for i in range(int(len(targets)/len(sources)))]
+            return _repeat_each(sources, len(targets) // len(sources)), \
+                targets
         elif len(sources) > len(targets):
             if len(sources) % len(targets) != 0:
                 raise ValueError(
                     'Source and destination lists must be divisible')
-            targets = [target for target in targets
-                       for i in range(int(len(sources)/len(targets)))]
+            return sources, \
+                _repeat_each(targets, len(sources) // len(targets))
         return sources, targets
 
     def _plan_distribute(self):
@@ -553,7 +700,7 @@ class TransferPlan:
         # First method keeps distribute consistent with current behavior while
         # the other maintains consistency in default behaviors of all functions
         plan_iter = self._expand_for_volume_constraints(
-            self._volumes, self._dests,
+            self._volumes(), self._dests,
             self._instr.max_volume
             - self._strategy.disposal_volume
             - self._strategy.air_gap)
@@ -561,11 +708,12 @@ class TransferPlan:
         done = False
         current_xfer = next(plan_iter)
         if self._strategy.new_tip == types.TransferTipPolicy.ALWAYS:
-            yield self._format_dict('pick_up_tip', kwargs=self._tip_opts)
+            yield self._step('pick_up_tip', kwargs=self._tip_opts)
         while not done:
             asp_grouped: List[Tuple[float, Well]] = []
+            grouped_volume: float = 0
             try:
-                while (sum(a[0] for a in asp_grouped) +
+                while (grouped_volume +
                        self._strategy.disposal_volume +
                        self._strategy.air_gap +
                        current_xfer[0]) <= self._max_volume:
@@ -573,13 +721,15 @@ class TransferPlan:
                         self._api_version, current_xfer[0])
                     if append_xfer:
                         asp_grouped.append(current_xfer)
+                        grouped_volume += current_xfer[0]
                     current_xfer = next(plan_iter)
             except StopIteration:
                 done = True
             if not asp_grouped:
                 break
+            asp_grouped = self._order_visits(self._sources[0], asp_grouped)
 
-            yield from self._aspirate_actions(sum(a[0] for a in asp_grouped) +
+            yield from self._aspirate_actions(grouped_volume +
                                               self._strategy.disposal_volume,
                                               self._sources[0])
             for step in asp_grouped:
@@ -593,8 +743,8 @@ class TransferPlan:
     Target = TypeVar('Target')
     @staticmethod  # noqa: E301
     def _expand_for_volume_constraints(
-            volumes: Iterator[float],
-            targets: Iterator[Target],
+            volumes: Iterable[float],
+            targets: Iterable[Target],
             max_volume: float)\
             -> Generator[Tuple[float, 'Target'], None, None]:
         """ Split a sequence of proposed transfers if necessary to keep each
@@ -648,15 +798,16 @@ class TransferPlan:
                .. Aspirate -> .....*
         """
         plan_iter = self._expand_for_volume_constraints(
-            self._volumes, self._sources, self._instr.max_volume)
+            self._volumes(), self._sources, self._instr.max_volume)
         current_xfer = next(plan_iter)
         if self._strategy.new_tip == types.TransferTipPolicy.ALWAYS:
-            yield self._format_dict('pick_up_tip', kwargs=self._tip_opts)
+            yield self._step('pick_up_tip', kwargs=self._tip_opts)
         done = False
         while not done:
             asp_grouped: List[Tuple[float, Well]] = []
+            grouped_volume: float = 0
             try:
-                while (sum([a[0] for a in asp_grouped]) +
+                while (grouped_volume +
                        self._strategy.disposal_volume +
                        self._strategy.air_gap * len(asp_grouped) +
                        current_xfer[0]) <= self._max_volume:
@@ -664,14 +815,16 @@ class TransferPlan:
                         self._api_version, current_xfer[0])
                     if append_xfer:
                         asp_grouped.append(current_xfer)
+                        grouped_volume += current_xfer[0]
                     current_xfer = next(plan_iter)
             except StopIteration:
                 done = True
             if not asp_grouped:
                 break
+            asp_grouped = self._order_visits(self._dests[0], asp_grouped)
             # Q: What accounts as disposal volume in a consolidate action?
-            # yield self._format_dict('aspirate',
-            #                         self._strategy.disposal_volume, loc)
+            # yield self._step('aspirate',
+            #                  self._strategy.disposal_volume, loc)
             for step in asp_grouped:
                 yield from self._aspirate_actions(step[0], step[1])
             yield from self._dispense_actions(
@@ -681,17 +834,31 @@ class TransferPlan:
                 dest=self._dests[0])
         yield from self._new_tip_action()
 
+    def _order_visits(
+            self, anchor: Union[Well, types.Location],
+            visits: List[Tuple[float, Well]]) -> List[Tuple[float, Well]]:
+        """ Reorder the visits made with one tip full, going out from and
+        back to anchor, to travel less if travel should be optimized """
+        if not self._strategy.optimize_travel or len(visits) < 3:
+            return visits
+        start, *stops = _xys([anchor] + [target for _, target in visits])
+        order = _two_opt(start, stops, _nearest_neighbour_order(start, stops))
+        given = _tour_length(start, stops)
+        shortest = _tour_length(start, [stops[i] for i in order])
+        if shortest >= given:
+            return visits
+        self._travel_saved += given - shortest
+        return [visits[i] for i in order]
+
     def _aspirate_actions(self, vol, loc):
         yield from self._before_aspirate(loc)
-        yield self._format_dict('aspirate',
-                                [vol, loc, self._options.aspirate.rate])
+        yield self._step('aspirate', vol, loc, self._options.aspirate.rate)
         yield from self._after_aspirate()
 
     def _dispense_actions(self, vol, dest, src=None, is_disp_next=False):
         if self._strategy.air_gap:
             vol += self._strategy.air_gap
-        yield self._format_dict('dispense',
-                                [vol, dest, self._options.dispense.rate])
+        yield self._step('dispense', vol, dest, self._options.dispense.rate)
         yield from self._after_dispense(
             dest=dest, src=src, is_disp_next=is_disp_next)
 
@@ -701,14 +868,13 @@ class TransferPlan:
             if self._instr.current_volume == 0:
                 mix_before_opts = self._mix_before_opts._asdict()
                 mix_before_opts['location'] = loc
-                yield self._format_dict(
-                    'mix', kwargs=mix_before_opts)
+                yield self._step('mix', kwargs=self._params(mix_before_opts))
 
     def _after_aspirate(self):
         if self._strategy.air_gap:
-            yield self._format_dict('air_gap', [self._strategy.air_gap])
+            yield self._step('air_gap', self._strategy.air_gap)
         if self._strategy.touch_tip_strategy == TouchTipStrategy.ALWAYS:
-            yield self._format_dict('touch_tip', kwargs=self._touch_tip_opts)
+            yield self._step('touch_tip', kwargs=self._touch_tip_opts)
 
     def _after_dispense(self, dest, src, is_disp_next=False):  # noqa: C901
         # This sequence of actions is subject to change
@@ -721,69 +887,74 @@ class TransferPlan:
                         self._strategy.mix_strategy == MixStrategy.BOTH:
                     mix_after_opts = self._mix_after_opts._asdict()
                     mix_after_opts['location'] = dest
-                    yield self._format_dict('mix', kwargs=mix_after_opts)
+                    yield self._step(
+                        'mix', kwargs=self._params(mix_after_opts))
             if self._strategy.touch_tip_strategy == TouchTipStrategy.ALWAYS:
-                yield self._format_dict('touch_tip',
-                                        kwargs=self._touch_tip_opts)
+                yield self._step('touch_tip', kwargs=self._touch_tip_opts)
 
             if self._strategy.blow_out_strategy == \
                     BlowOutStrategy.SOURCE:
-                yield self._format_dict('blow_out', [src])
+                yield self._step('blow_out', src)
             elif self._strategy.blow_out_strategy \
                     == BlowOutStrategy.DEST:
-                yield self._format_dict('blow_out', [dest])
+                yield self._step('blow_out', dest)
             elif self._strategy.blow_out_strategy == \
                     BlowOutStrategy.CUSTOM_LOCATION:
-                yield self._format_dict('blow_out', kwargs=self._blow_opts)
+                yield self._step('blow_out', kwargs=self._blow_opts)
             elif self._strategy.blow_out_strategy == BlowOutStrategy.TRASH or \
                     self._strategy.disposal_volume:
-                yield self._format_dict('blow_out', [
-                    self._instr.trash_container.wells()[0]])
+                yield self._step(
+                    'blow_out', self._instr.trash_container.wells()[0])
         else:
             # Used by distribute
             if self._strategy.air_gap:
-                yield self._format_dict('air_gap', [self._strategy.air_gap])
+                yield self._step('air_gap', self._strategy.air_gap)
             if self._strategy.touch_tip_strategy == TouchTipStrategy.ALWAYS:
-                yield self._format_dict('touch_tip',
-                                        kwargs=self._touch_tip_opts)
+                yield self._step('touch_tip', kwargs=self._touch_tip_opts)
 
     def _new_tip_action(self):
         if self._strategy.new_tip == types.TransferTipPolicy.ALWAYS:
             if self._strategy.drop_tip_strategy == DropTipStrategy.RETURN:
-                yield self._format_dict('return_tip')
+                yield self._step('return_tip')
             else:
-                yield self._format_dict('drop_tip')
-
-    def _format_dict(self, method: str,
-                     args: List = None,
-                     kwargs: Union['Dictable', Dict[str, Any]] = None):
-        if kwargs:
-            if isinstance(kwargs, Dict):
-                params = {key: val for key, val in kwargs.items() if val}
-            else:
-                params = {key: val
-                          for key, val in kwargs._asdict().items() if val}
+                yield self._step('drop_tip')
+
+    @staticmethod
+    def _step(method: str, *args: Any,
+              kwargs: Mapping[str, Any] = _NO_KWARGS) -> TransferStep:
+        return TransferStep(method, args, kwargs)
+
+    @staticmethod
+    def _params(
+            kwargs: Union['Dictable', Dict[str, Any]]) -> Mapping[str, Any]:
+        """ The options that are set, to pass on as keyword arguments """
+        if isinstance(kwargs, Dict):
+            items = kwargs.items()
         else:
-            params = {}
-        if not args:
-            args = []
-        return {'method': method, 'args': args, 'kwargs': params}
-
-    def _create_volume_list(self, volume, total_xfers):
-        if isinstance(volume, (float, int)):
-            return [volume] * total_xfers
-        elif isinstance(volume, tuple):
+            items = kwargs._asdict().items()
+        return {key: val for key, val in items if val} or _NO_KWARGS
+
+    @staticmethod
+    def _check_volumes(volume, total_xfers):
+        if isinstance(volume, (float, int, tuple)):
+            return
+        if not isinstance(volume, List):
+            raise TypeError("Volume expected as a number or List or"
+                            " tuple but got {}".format(volume))
+        elif not len(volume) == total_xfers:
+            raise RuntimeError("List of volumes should be equal to number "
+                               "of transfers")
+
+    def _volumes(self) -> Iterable[float]:
+        """ The volume of each transfer, worked out as it is needed """
+        if isinstance(self._volume, (float, int)):
+            return itertools.repeat(self._volume, self._total_xfers)
+        elif isinstance(self._volume, tuple):
             return self._create_volume_gradient(
-                volume[0], volume[-1], total_xfers,
+                self._volume[0], self._volume[-1], self._total_xfers,
                 self._strategy.gradient_function)
         else:
-            if not isinstance(volume, List):
-                raise TypeError("Volume expected as a number or List or"
-                                " tuple but got {}".format(volume))
-            elif not len(volume) == total_xfers:
-                raise RuntimeError("List of volumes should be equal to number "
-                                   "of transfers")
-            return volume
+            return self._volume
 
     def _create_volume_gradient(self, min_v, max_v, total, gradient=None):
 
@@ -795,7 +966,7 @@ class TransferPlan:
             rel_y = gradient(rel_x) if gradient else rel_x
             return (rel_y * diff_vol) + min_v
 
-        return [_map_volume(i) for i in range(total)]
+        return map(_map_volume, range(total))
 
     def _check_valid_well_list(self, well_list, id, old_well_list):
         if self._api_version >= APIVersion(2, 2) and len(well_list) < 1:
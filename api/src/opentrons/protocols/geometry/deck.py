@@ -1,7 +1,8 @@
+import itertools
 import logging
 from collections import UserDict
 from dataclasses import dataclass
-from typing import Optional, List, Dict, TYPE_CHECKING
+from typing import Optional, List, Dict, Set, Tuple, TYPE_CHECKING
 
 from opentrons import types
 from opentrons.protocol_api.labware import load as load_lw, Labware
@@ -24,6 +25,9 @@ MODULE_LOG = logging.getLogger(__name__)
 ROW_LENGTH = 3
 FIXED_TRASH_ID = 'fixedTrash'
 
+# Shared by all decks so that a version also tells decks apart
+_versions = itertools.count()
+
 
 @dataclass
 class CalibrationPosition:
@@ -37,6 +41,49 @@ class CalibrationPosition:
     displayName: str
 
 
+@dataclass(frozen=True)
+class SlotHeight:
+    """ The tallest item over a slot, and the corners of the slot """
+    slot: int
+    low: types.Point
+    high: types.Point
+    height: float
+    item: DeckItem
+
+
+@dataclass(frozen=True)
+class _SlotGeometry:
+    definition: 'SlotDefV2'
+    center: types.Point
+    low: types.Point
+    high: types.Point
+
+    @classmethod
+    def build(cls, definition: 'SlotDefV2') -> '_SlotGeometry':
+        position = definition['position']
+        box = definition['boundingBox']
+        low = types.Point(*position)
+        return cls(
+            definition=definition,
+            center=low + types.Point(box['xDimension']/2,
+                                     box['yDimension']/2,
+                                     box['zDimension']/2),
+            low=low,
+            high=low + types.Point(box['xDimension'],
+                                   box['yDimension'],
+                                   box['zDimension']))
+
+
+def _covered_slots(slot_key: types.DeckLocation,
+                   item: Optional[DeckItem]) -> Set[types.DeckLocation]:
+    if isinstance(item, ThermocyclerGeometry):
+        return item.covered_slots
+    elif item is not None:
+        return {slot_key}
+    else:
+        return set()
+
+
 class Deck(UserDict):
     def __init__(self, load_name=STANDARD_DECK):
         super().__init__()
@@ -48,8 +95,20 @@ class Deck(UserDict):
                                                 idx // 3 * row_offset,
                                                 0)
                            for idx in range(12)}
+        # The highest_z of the item in each occupied slot, kept up to date
+        # as items are recalibrated, and the slot of the tallest
+        self._heights: Dict[int, float] = {}
+        self._tallest: Optional[int] = None
         self._highest_z = 0.0
+        # The slots of the items covering each slot
+        self._covering: Dict[types.DeckLocation, Set[int]] = {}
+        self._thermocycler_slots: Set[int] = set()
+        # Built from the heights and coverings when first asked for
+        self._height_map: Optional[List[SlotHeight]] = None
+        self._version = next(_versions)
         self._definition = load_deck(load_name, 2)
+        self._slot_geometry = {
+            slot['id']: _SlotGeometry.build(slot) for slot in self.slots}
         self._load_fixtures()
 
     def _load_fixtures(self):
@@ -89,7 +148,7 @@ class Deck(UserDict):
         old = self.data[checked_key]
         self.data[checked_key] = None
         if old:
-            self.recalculate_high_z()
+            self._forget_item(checked_key, old)
 
     def __setitem__(self, key: types.DeckLocation, val: DeckItem) -> None:
         slot_key_int = self._check_name(key)
@@ -113,8 +172,48 @@ class Deck(UserDict):
             raise ValueError(f'Could not load {val} as deck location {key} '
                              'is obscured by '
                              f'{", ".join(flattened_overlappers)}')
+        if item is not None:
+            self._forget_item(slot_key_int, item)
         self.data[slot_key_int] = val
-        self._highest_z = max(val.highest_z, self._highest_z)
+        for covered in _covered_slots(slot_key_int, val):
+            self._covering.setdefault(covered, set()).add(slot_key_int)
+        if isinstance(val, ThermocyclerGeometry):
+            self._thermocycler_slots.add(slot_key_int)
+        val.add_height_listener(
+            lambda changed: self._item_height_changed(slot_key_int, changed))
+        self._set_height(slot_key_int, val.highest_z)
+
+    def _forget_item(self, slot: int, item: DeckItem) -> None:
+        for covered in _covered_slots(slot, item):
+            self._covering.get(covered, set()).discard(slot)
+        self._thermocycler_slots.discard(slot)
+        self._set_height(slot, None)
+
+    def _item_height_changed(self, slot: int, item: DeckItem) -> None:
+        # items keep the listeners of decks and slots they have left
+        if self.data.get(slot) is item:
+            self._set_height(slot, item.highest_z)
+
+    def _set_height(self, slot: int, height: Optional[float]) -> None:
+        self._height_map = None
+        self._version = next(_versions)
+        if height is None:
+            self._heights.pop(slot, None)
+        else:
+            self._heights[slot] = height
+        if height is not None and height >= self._highest_z:
+            self._tallest = slot
+            self._highest_z = height
+        elif slot == self._tallest:
+            # the tallest item went down or away, so look for the next
+            # tallest in the per-slot heights
+            if self._heights:
+                self._tallest = max(
+                    self._heights, key=self._heights.__getitem__)
+                self._highest_z = max(self._heights[self._tallest], 0.0)
+            else:
+                self._tallest = None
+                self._highest_z = 0.0
 
     def __contains__(self, key: object) -> bool:
         try:
@@ -164,26 +263,50 @@ class Deck(UserDict):
         return types.Location(self._positions[key_int], str(key))
 
     def recalculate_high_z(self):
+        """ Read the height of every item on the deck again. Items report
+        changes in their height themselves, so this is only needed if one
+        was changed behind their backs. """
+        self._heights.clear()
+        self._height_map = None
+        self._version = next(_versions)
+        self._tallest = None
         self._highest_z = 0.0
-        for item in [lw for lw in self.data.values() if lw]:
-            self._highest_z = max(item.highest_z, self._highest_z)
+        for slot, item in self.data.items():
+            if item:
+                self._set_height(slot, item.highest_z)
 
-    def get_slot_definition(self, slot_name) -> 'SlotDefV2':
-        slots = self._definition['locations']['orderedSlots']
-        slot_def = next(
-            (slot for slot in slots if slot['id'] == slot_name), None)
-        if not slot_def:
-            slot_ids = [slot['id'] for slot in slots]
+    def _get_slot_geometry(self, slot_name) -> _SlotGeometry:
+        try:
+            return self._slot_geometry[slot_name]
+        except (KeyError, TypeError):
             raise ValueError(f'slot {slot_name} could not be found,'
-                             f'valid deck slots are: {slot_ids}')
-        return slot_def
+                             f'valid deck slots are: '
+                             f'{list(self._slot_geometry)}')
+
+    def get_slot_definition(self, slot_name) -> 'SlotDefV2':
+        return self._get_slot_geometry(slot_name).definition
 
     def get_slot_center(self, slot_name) -> types.Point:
-        defn = self.get_slot_definition(slot_name)
-        return types.Point(
-            defn['position'][0] + defn['boundingBox']['xDimension']/2,
-            defn['position'][1] + defn['boundingBox']['yDimension']/2,
-            defn['position'][2] + defn['boundingBox']['zDimension']/2)
+        return self._get_slot_geometry(slot_name).center
+
+    def _footprint(
+            self, slots: Set[types.DeckLocation]
+    ) -> Tuple[types.Point, types.Point]:
+        corners = [self._get_slot_geometry(str(slot)) for slot in slots]
+        return (types.Point(min(c.low.x for c in corners),
+                            min(c.low.y for c in corners),
+                            min(c.low.z for c in corners)),
+                types.Point(max(c.high.x for c in corners),
+                            max(c.high.y for c in corners),
+                            max(c.high.z for c in corners)))
+
+    def _slot_height(self, slot: types.DeckLocation,
+                     occupants: Set[int]) -> SlotHeight:
+        tallest = max(occupants, key=self._heights.__getitem__)
+        low, high = self._footprint({slot})
+        return SlotHeight(slot=self._check_name(slot), low=low, high=high,
+                          height=self._heights[tallest],
+                          item=self.data[tallest])
 
     def resolve_module_location(
             self, module_type: ModuleType,
@@ -221,6 +344,41 @@ class Deck(UserDict):
         """ Return the tallest known point on the deck. """
         return self._highest_z
 
+    @property
+    def version(self) -> int:
+        """ A number that changes whenever an item is added to, removed
+        from or changes height on this deck, and that no other deck has. """
+        return self._version
+
+    @property
+    def tallest_item(self) -> Optional[DeckItem]:
+        """ The item whose highest_z is :py:attr:`highest_z`, if any """
+        if self._tallest is None:
+            return None
+        return self.data[self._tallest]
+
+    @property
+    def has_thermocycler(self) -> bool:
+        return bool(self._thermocycler_slots)
+
+    @property
+    def thermocycler_footprints(
+            self) -> List[Tuple[types.Point, types.Point]]:
+        """ The corners of the area each loaded thermocycler covers """
+        return [self._footprint(_covered_slots(slot, self.data[slot]))
+                for slot in sorted(self._thermocycler_slots)]
+
+    @property
+    def height_map(self) -> List[SlotHeight]:
+        """ The tallest item over each slot that has anything over it.
+        Built once and kept until something on the deck changes. """
+        if self._height_map is None:
+            self._height_map = [
+                self._slot_height(slot, occupants)
+                for slot, occupants in sorted(self._covering.items())
+                if occupants]
+        return self._height_map
+
     @property
     def slots(self) -> List['SlotDefV2']:
         """ Return the definition of the loaded robot deck. """
@@ -263,19 +421,17 @@ class Deck(UserDict):
         """ Return the loaded deck items that collide
             with the given item.
         """
-        def get_item_covered_slot_keys(sk, i):
-            if isinstance(i, ThermocyclerGeometry):
-                return i.covered_slots
-            elif i is not None:
-                return set([sk])
-            else:
-                return set([])
-
-        item_slot_keys = get_item_covered_slot_keys(slot_key, item)
+        item_slot_keys = _covered_slots(slot_key, item)
+        if not item_slot_keys:
+            # covering nothing is contained in every slot
+            return {sk: [i] for sk, i in self.data.items()}
 
+        # anything colliding must cover each of the item's slots, so only
+        # the items covering one of them need checking
         colliding_items: Dict[types.DeckLocation, List[DeckItem]] = {}
-        for sk, i in self.data.items():
-            covered_sks = get_item_covered_slot_keys(sk, i)
-            if item_slot_keys.issubset(covered_sks):
+        some_slot = next(iter(item_slot_keys))
+        for sk in sorted(self._covering.get(some_slot, ())):
+            i = self.data[sk]
+            if item_slot_keys.issubset(_covered_slots(sk, i)):
                 colliding_items.setdefault(sk, []).append(i)
         return colliding_items
@@ -1,4 +1,7 @@
 import abc
+from typing import Callable
+
+HeightListener = Callable[['DeckItem'], None]
 
 
 class DeckItem(abc.ABC):
@@ -22,3 +25,9 @@ class DeckItem(abc.ABC):
     @abc.abstractmethod
     def load_name(self) -> str:
         pass
+
+    @abc.abstractmethod
+    def add_height_listener(self, listener: HeightListener) -> None:
+        """ Call listener with this item whenever its highest_z may have
+        changed, for instance because it was recalibrated """
+        pass
@@ -11,7 +11,7 @@ from enum import Enum, auto
 import functools
 import logging
 import re
-from typing import (Mapping, Optional,
+from typing import (List, Mapping, Optional,
                     Type, TypeVar, Union, TYPE_CHECKING)
 
 import numpy as np  # type: ignore
@@ -23,7 +23,7 @@ from opentrons.types import Location, Point, LocationLabware
 from opentrons.protocols.api_support.types import APIVersion
 from opentrons.protocols.api_support.definitions import (
     MAX_SUPPORTED_VERSION, V2_MODULE_DEF_VERSION)
-from opentrons.protocols.geometry.deck_item import DeckItem
+from opentrons.protocols.geometry.deck_item import DeckItem, HeightListener
 from opentrons.protocol_api.labware import Labware
 
 if TYPE_CHECKING:
@@ -183,6 +183,7 @@ class ModuleGeometry(DeckItem):
         self._location = Location(
             point=self._offset + self._parent.point,
             labware=self)
+        self._height_listeners: List[HeightListener] = []
 
     @property
     def api_version(self) -> APIVersion:
@@ -191,11 +192,28 @@ class ModuleGeometry(DeckItem):
     def add_labware(self, labware: Labware) -> Labware:
         assert not self._labware,\
             '{} is already on this module'.format(self._labware)
+        return self._set_labware(labware)
+
+    def _set_labware(self, labware: Labware) -> Labware:
         self._labware = labware
-        return self._labware
+        labware.add_height_listener(self._labware_height_changed)
+        self._height_changed()
+        return labware
 
     def reset_labware(self):
         self._labware = None
+        self._height_changed()
+
+    def add_height_listener(self, listener: HeightListener) -> None:
+        self._height_listeners.append(listener)
+
+    def _labware_height_changed(self, labware: DeckItem) -> None:
+        if labware is self._labware:
+            self._height_changed()
+
+    def _height_changed(self) -> None:
+        for listener in self._height_listeners:
+            listener(self)
 
     @property
     def model(self) -> ModuleModel:
@@ -348,10 +366,9 @@ class ThermocyclerGeometry(ModuleGeometry):
         assert self.lid_status != 'closed', \
             'Cannot place labware in closed module'
         if self.is_semi_configuration:
-            self._labware = self.labware_accessor(labware)
+            return self._set_labware(self.labware_accessor(labware))
         else:
-            self._labware = labware
-        return self._labware
+            return self._set_labware(labware)
 
 
 def _load_from_v1(definition: 'ModuleDefinitionV1',
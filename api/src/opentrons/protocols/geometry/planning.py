@@ -1,7 +1,7 @@
 import functools
 import logging
 from dataclasses import dataclass
-from typing import List, Optional, Tuple
+from typing import Any, List, Optional, Sequence, Tuple
 
 from opentrons import types
 from opentrons.hardware_control.types import CriticalPoint
@@ -17,8 +17,9 @@ from opentrons.motion_planning import (
 
 from opentrons.protocols.api_support.labware_like import LabwareLike
 from opentrons.protocols.geometry.deck import Deck
-from opentrons.protocols.geometry.module_geometry import (
-    ThermocyclerGeometry, ModuleGeometry)
+from opentrons.protocols.geometry.deck_item import DeckItem
+from opentrons.protocols.geometry.module_geometry import ModuleGeometry
+from opentrons.util.caching import CacheInfo, LRUCache
 
 
 MODULE_LOG = logging.getLogger(__name__)
@@ -28,6 +29,43 @@ class LabwareHeightError(Exception):
     pass
 
 
+XY = Tuple[float, float]
+
+#: How far the pipette may reach past its critical point when it crosses
+#: the deck, in mm. The nozzles of a multichannel stretch 63 mm along y to
+#: either side of the critical point depending on which one is used.
+CORRIDOR_MARGIN = types.Point(10.0, 73.0, 0.0)
+
+#: How far to stay clear of the sides of a thermocycler when going around it
+THERMOCYCLER_DODGE_MARGIN = 10.0
+
+#: How many planned moves to remember
+PLAN_CACHE_SIZE = 1024
+
+Moves = List[Tuple[types.Point, Optional[CriticalPoint]]]
+
+
+PlanCacheInfo = CacheInfo
+
+
+# Planned moves, keyed by everything plan_moves looks at. The labware and
+# wells of the locations are keyed by identity and kept alive by the entry,
+# and the deck by its version, which changes whenever anything on it is
+# loaded, unloaded or recalibrated.
+_plans: 'LRUCache[Tuple, Tuple[Any, Any, Moves]]' = \
+    LRUCache(PLAN_CACHE_SIZE)
+
+
+def plan_cache_info() -> PlanCacheInfo:
+    """ How often :py:func:`plan_moves` found a move it had planned """
+    return _plans.info()
+
+
+def clear_plan_cache() -> None:
+    """ Forget all planned moves and reset the counts """
+    _plans.clear()
+
+
 def max_many(*args):
     return functools.reduce(max, args[1:], args[0])
 
@@ -58,7 +96,7 @@ def should_dodge_thermocycler(
 
     Returns True if we need to dodge, False otherwise
     """
-    if any([isinstance(item, ThermocyclerGeometry) for item in deck.values()]):
+    if deck.has_thermocycler:
         transit = (from_loc.labware.first_parent(),
                    to_loc.labware.first_parent())
         # mypy doesn't like this because transit could be none, but it's
@@ -68,6 +106,66 @@ def should_dodge_thermocycler(
     return False
 
 
+def _crosses(start: XY, end: XY,
+             low: types.Point, high: types.Point) -> bool:
+    """ Whether the segment from start to end passes through the inside of
+    the rectangle between low and high """
+    enter, leave = 0.0, 1.0
+    for axis in (0, 1):
+        delta = end[axis] - start[axis]
+        if not delta:
+            if not low[axis] < start[axis] < high[axis]:
+                return False
+            continue
+        near = (low[axis] - start[axis]) / delta
+        far = (high[axis] - start[axis]) / delta
+        enter = max(enter, min(near, far))
+        leave = min(leave, max(near, far))
+        if enter >= leave:
+            return False
+    return True
+
+
+def thermocycler_dodge(deck: Deck,
+                       from_point: types.Point,
+                       to_point: types.Point) -> List[XY]:
+    """
+    The waypoints needed to go around any thermocycler the straight path
+    between two points would cross. This is the geometric version of
+    :py:func:`should_dodge_thermocycler`: a path crossing a thermocycler
+    goes around its front right corner instead.
+    """
+    start, end = (from_point.x, from_point.y), (to_point.x, to_point.y)
+    margin = types.Point(
+        THERMOCYCLER_DODGE_MARGIN, THERMOCYCLER_DODGE_MARGIN, 0)
+    for low, high in deck.thermocycler_footprints:
+        if _crosses(start, start, low, high)\
+                or _crosses(end, end, low, high):
+            # moving to or from the thermocycler itself
+            continue
+        if _crosses(start, end, low - margin, high + margin):
+            return [(high.x + margin.x, low.y - margin.y)]
+    return []
+
+
+def corridor_height(
+        deck: Deck, path: Sequence[XY]) -> Tuple[float, Optional[DeckItem]]:
+    """
+    The height and item of the tallest thing in the slots that a pipette
+    moving through the xy points of path would pass over, allowing for
+    :py:attr:`CORRIDOR_MARGIN`, or 0 and None if it passes over nothing.
+    """
+    height, tallest = 0.0, None
+    segments = list(zip(path, path[1:])) or [(path[0], path[0])]
+    for slot in deck.height_map:
+        if slot.height <= height:
+            continue
+        low, high = slot.low - CORRIDOR_MARGIN, slot.high + CORRIDOR_MARGIN
+        if any(_crosses(start, end, low, high) for start, end in segments):
+            height, tallest = slot.height, slot.item
+    return height, tallest
+
+
 @dataclass
 class MoveConstraints:
     instr_max_height: float
@@ -138,7 +236,8 @@ def safe_height(
 def _build_safe_height(from_loc: types.Location,
                        to_loc: types.Location,
                        deck: Deck,
-                       constraints: MoveConstraints) -> float:
+                       constraints: MoveConstraints,
+                       corridor: Sequence[XY] = None) -> float:
     to_point = to_loc.point
     to_lw, to_well = to_loc.labware.get_parent_labware_and_well()
     from_point = from_loc.point
@@ -162,22 +261,24 @@ def _build_safe_height(from_loc: types.Location,
             from_safety = 0.0  # (ignore since it's in a max())
     else:
         # One of our labwares is invalid so we have to just go above
-        # deck.highest_z since we don’t know where we are
-        to_safety = deck.highest_z + constraints.lw_z_margin
+        # deck.highest_z since we don’t know where we are, or above the
+        # tallest thing along the corridor if we were given one
+        if corridor is None:
+            clear_z, tallest_lw = deck.highest_z, deck.tallest_item
+        else:
+            clear_z, tallest_lw = corridor_height(deck, corridor)
+        to_safety = clear_z + constraints.lw_z_margin
 
         if to_safety > constraints.instr_max_height:
             if constraints.instr_max_height\
-               >= (deck.highest_z + constraints.minimum_lw_z_margin):
+               >= (clear_z + constraints.minimum_lw_z_margin):
                 to_safety = constraints.instr_max_height
             else:
-                tallest_lw = list(filter(
-                    lambda lw: lw.highest_z == deck.highest_z,
-                    [lw for lw in deck.data.values() if lw]))[0]
                 if isinstance(tallest_lw, ModuleGeometry) and\
                         tallest_lw.labware:
                     tallest_lw = tallest_lw.labware
                 raise LabwareHeightError(
-                    f"The {tallest_lw} has a total height of {deck.highest_z}"
+                    f"The {tallest_lw} has a total height of {clear_z}"
                     " mm, which is too tall for your current pipette "
                     "configurations. The longest pipette on your robot can "
                     f"only be raised to {constraints.instr_max_height} mm "
@@ -208,7 +309,8 @@ def plan_moves(
     minimum_lw_z_margin: float = None,
     minimum_z_height: float = None,
     use_experimental_waypoint_planning: bool = False,
-) -> List[Tuple[types.Point, Optional[CriticalPoint]]]:
+    use_corridor_planning: bool = False,
+) -> Moves:
     """ Plan moves between one :py:class:`.Location` and another.
 
     Each :py:class:`.Location` instance might or might not have a specific
@@ -221,12 +323,52 @@ def plan_moves(
     :param force_direct: If True, ignore any Z margins force a direct move
     :param use_experimental_waypoint_planning: If True, use waypoint logic
                                                from opentrons.motion_planning
+    :param use_corridor_planning: If True, arcs between labware only clear
+                                  the slots they pass over (see
+                                  :py:func:`corridor_height`) and go around
+                                  thermocyclers they would cross (see
+                                  :py:func:`thermocycler_dodge`)
 
     The other parameters are as :py:meth:`safe_height`.
 
     :returns: A list of tuples of :py:class:`.Point` and critical point
               overrides to move through.
+
+    Plans are remembered, so planning the same move again on an unchanged
+    deck does not plan it again; see :py:func:`plan_cache_info`.
     """
+    from_object, to_object = from_loc.labware.object, to_loc.labware.object
+    key = (tuple(from_loc.point), tuple(to_loc.point),
+           id(from_object), id(to_object), deck.version, instr_max_height,
+           well_z_margin, lw_z_margin, force_direct, minimum_lw_z_margin,
+           minimum_z_height, use_experimental_waypoint_planning,
+           use_corridor_planning)
+    cached = _plans.get(key)
+    if cached is not None:
+        return list(cached[2])
+
+    moves = _plan_moves(
+        from_loc, to_loc, deck, instr_max_height, well_z_margin, lw_z_margin,
+        force_direct, minimum_lw_z_margin, minimum_z_height,
+        use_experimental_waypoint_planning, use_corridor_planning)
+
+    _plans.put(key, (from_object, to_object, moves))
+    return list(moves)
+
+
+def _plan_moves(
+    from_loc: types.Location,
+    to_loc: types.Location,
+    deck: Deck,
+    instr_max_height: float,
+    well_z_margin: Optional[float],
+    lw_z_margin: Optional[float],
+    force_direct: bool,
+    minimum_lw_z_margin: Optional[float],
+    minimum_z_height: Optional[float],
+    use_experimental_waypoint_planning: bool,
+    use_corridor_planning: bool,
+) -> Moves:
     constraints = MoveConstraints.build(
         instr_max_height=instr_max_height,
         well_z_margin=well_z_margin,
@@ -245,7 +387,9 @@ def plan_moves(
     origin_cp_override = CriticalPoint.XY_CENTER if from_center else None
     extra_waypoints = []
 
-    if should_dodge_thermocycler(deck, from_loc, to_loc):
+    if use_corridor_planning:
+        extra_waypoints = thermocycler_dodge(deck, from_point, to_point)
+    elif should_dodge_thermocycler(deck, from_loc, to_loc):
         sc = deck.get_slot_center('5')
         extra_waypoints = [(sc.x, sc.y)]
 
@@ -280,7 +424,12 @@ def plan_moves(
         return [(to_point, dest_cp_override)]
 
     # Find the safe z heights based on the destination and origin labware/well
-    safe = _build_safe_height(from_loc, to_loc, deck, constraints)
+    corridor = None
+    if use_corridor_planning:
+        corridor = [(from_point.x, from_point.y),
+                    *extra_waypoints,
+                    (to_point.x, to_point.y)]
+    safe = _build_safe_height(from_loc, to_loc, deck, constraints, corridor)
 
     return plan_arc(from_point, to_point, safe,
                     origin_cp_override, dest_cp_override,
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
-from typing import Optional, cast, TYPE_CHECKING
+from typing import (
+    Dict, List, Mapping, Optional, Sequence, Tuple, cast, TYPE_CHECKING)
 
+import numpy as np  # type: ignore
 
 from opentrons.types import Point
 from opentrons_shared_data.labware.dev_types import (
@@ -12,66 +14,272 @@ if TYPE_CHECKING:
         LabwareInterface
 
 
+Sizes = Tuple[Optional[float], Optional[float], Optional[float]]
+
+
+def _well_sizes(well_props: WellDefinition) -> Sizes:
+    """ The length, width and diameter of a well, whichever apply """
+    shape = well_props['shape']
+    if shape == 'rectangular':
+        rect_props = cast(RectangularWellDefinition, well_props)
+        return rect_props['xDimension'], rect_props['yDimension'], None
+    elif shape == 'circular':
+        circular_props = cast(CircularWellDefinition, well_props)
+        return None, None, circular_props['diameter']
+    else:
+        raise ValueError(
+            f'Shape "{shape}" is not a supported well shape')
+
+
+def _frozen(array: np.ndarray) -> np.ndarray:
+    array.setflags(write=False)
+    return array
+
+
+class WellGeometryTable:
+    """ The geometry of all the wells of a labware, as arrays.
+
+    Well positions are stored relative to the labware origin, one row per
+    well, so questions about many wells at once (where are the tops of a
+    column, which well holds a point) are answered with array operations
+    rather than a loop over :py:class:`WellGeometry` objects. Each well's
+    :py:class:`WellGeometry` is a view of its row and reads everything it
+    knows from the table.
+    """
+
+    def __init__(self,
+                 wells: Mapping[str, WellDefinition],
+                 parent_object: LabwareInterface,
+                 parent_point: Optional[Point] = None):
+        """
+        :param wells: Properties from the labware definition by well name, in
+                      the order of the rows of the table
+        :param parent_object: The parent labware
+        :param parent_point: The coordinate of the parent labware. If None,
+                             the parent's calibrated offset is used, so the
+                             wells follow the labware when it is
+                             recalibrated.
+        """
+        if not parent_object:
+            raise ValueError("Wells must have a parent")
+        self._parent = parent_object
+        self._parent_point = parent_point
+        self._names = tuple(wells.keys())
+        self._definitions = tuple(wells.values())
+        self._indices: Dict[str, int] = {
+            name: index for index, name in enumerate(self._names)}
+
+        self._sizes: List[Sizes] = [
+            _well_sizes(props) for props in self._definitions]
+        self._relative_tops = _frozen(np.array(
+            [(props['x'], props['y'], props['z'] + props['depth'])
+             for props in self._definitions], dtype=float).reshape(-1, 3))
+        self._depths = _frozen(np.array(
+            [props['depth'] for props in self._definitions], dtype=float))
+        self._circular = _frozen(np.array(
+            [diameter is not None for _, _, diameter in self._sizes],
+            dtype=bool))
+        self._x_sizes = _frozen(np.array(
+            [diameter if length is None else length
+             for length, _, diameter in self._sizes], dtype=float))
+        self._y_sizes = _frozen(np.array(
+            [diameter if width is None else width
+             for _, width, diameter in self._sizes], dtype=float))
+        # The rows as plain Python numbers, so looking at one well at a time
+        # does not pay for numpy scalars
+        self._relative_top_points = [
+            Point(*row) for row in self._relative_tops.tolist()]
+        self._depth_values: List[float] = self._depths.tolist()
+
+    @property
+    def parent(self) -> LabwareInterface:
+        return self._parent
+
+    @property
+    def names(self) -> Sequence[str]:
+        """ The names of the wells, in row order """
+        return self._names
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def index(self, name: str) -> int:
+        return self._indices[name]
+
+    def definition(self, index: int) -> WellDefinition:
+        return self._definitions[index]
+
+    def origin(self) -> Point:
+        """ The point the well positions are relative to """
+        if self._parent_point is None:
+            return self._parent.get_calibrated_offset()
+        return self._parent_point
+
+    def geometry(self, index: int) -> WellGeometry:
+        """ The :py:class:`WellGeometry` of one row """
+        return WellGeometry.in_table(self, index)
+
+    def relative_top(self, index: int) -> Point:
+        """ The top center of one well, relative to the labware origin """
+        return self._relative_top_points[index]
+
+    def depth(self, index: int) -> float:
+        return self._depth_values[index]
+
+    def sizes(self, index: int) -> Sizes:
+        """ The length, width and diameter of one well, whichever apply """
+        return self._sizes[index]
+
+    def x_size(self, index: int) -> float:
+        length, _, diameter = self._sizes[index]
+        return cast(float, diameter or length)
+
+    def y_size(self, index: int) -> float:
+        _, width, diameter = self._sizes[index]
+        return cast(float, diameter or width)
+
+    def max_volume(self, index: int) -> float:
+        return self._definitions[index]['totalLiquidVolume']
+
+    def _select(self, names: Optional[Sequence[str]]) -> Sequence[int]:
+        if names is None:
+            return range(len(self._names))
+        return [self._indices[name] for name in names]
+
+    def tops(self, z: float = 0.0,
+             names: Optional[Sequence[str]] = None) -> np.ndarray:
+        """ The top centers of the named wells (all by default) as an
+        (n, 3) array in deck coordinates, raised by z """
+        rows = self._select(names)
+        return self._relative_tops[rows] + np.array(self.origin()) \
+            + (0.0, 0.0, z)
+
+    def bottoms(self, z: float = 0.0,
+                names: Optional[Sequence[str]] = None) -> np.ndarray:
+        """ The bottom centers of the named wells, raised by z """
+        rows = self._select(names)
+        bottoms = self.tops(z, names)
+        bottoms[:, 2] -= self._depths[rows]
+        return bottoms
+
+    def centers(self, names: Optional[Sequence[str]] = None) -> np.ndarray:
+        """ The centers of the named wells """
+        rows = self._select(names)
+        centers = self.tops(0.0, names)
+        centers[:, 2] -= self._depths[rows] / 2.0
+        return centers
+
+    def _extents(self) -> Tuple[np.ndarray, np.ndarray]:
+        # The low and high corners of the box around each well
+        tops = self.tops()
+        half = np.stack(
+            [self._x_sizes / 2.0, self._y_sizes / 2.0,
+             np.zeros(len(self._names))], axis=1)
+        low = tops - half
+        low[:, 2] -= self._depths
+        return low, tops + half
+
+    def wells_containing(self, point: Point) -> List[str]:
+        """ The names of the wells whose volume contains point """
+        offsets = np.array(point) - self.tops()
+        in_depth = (offsets[:, 2] <= 0) & (offsets[:, 2] >= -self._depths)
+        in_circle = np.hypot(offsets[:, 0], offsets[:, 1]) \
+            <= self._x_sizes / 2.0
+        in_rectangle = (np.abs(offsets[:, 0]) <= self._x_sizes / 2.0) \
+            & (np.abs(offsets[:, 1]) <= self._y_sizes / 2.0)
+        inside = in_depth & np.where(self._circular, in_circle, in_rectangle)
+        return [self._names[index] for index in np.flatnonzero(inside)]
+
+    def wells_in_box(self, corner: Point, opposite: Point) -> List[str]:
+        """ The names of the wells whose bounding boxes intersect the box
+        between two opposite corners """
+        low = np.minimum(corner, opposite)
+        high = np.maximum(corner, opposite)
+        well_low, well_high = self._extents()
+        overlaps = np.all((well_low <= high) & (well_high >= low), axis=1)
+        return [self._names[index] for index in np.flatnonzero(overlaps)]
+
+    def bounding_box(self) -> Tuple[Point, Point]:
+        """ The low and high corners of the box around all the wells """
+        if not len(self._names):
+            origin = self.origin()
+            return origin, origin
+        low, high = self._extents()
+        return Point(*low.min(axis=0).tolist()), \
+            Point(*high.max(axis=0).tolist())
+
+
 class WellGeometry:
 
     def __init__(self,
                  well_props: WellDefinition,
-                 parent_point: Point,
+                 parent_point: Optional[Point],
                  parent_object: LabwareInterface):
         """
         Construct a well geometry object.
 
         :param well_props: Properties from the labware definition
-        :param parent_point: The coordinate of parent labware
+        :param parent_point: The coordinate of parent labware. If None, the
+                             parent's calibrated offset is used, so the well
+                             follows the labware when it is recalibrated.
         :param parent_object: The parent labware
         """
+        self._bind(
+            WellGeometryTable({'': well_props}, parent_object, parent_point),
+            0)
 
-        self._position\
-            = Point(well_props['x'],
-                    well_props['y'],
-                    well_props['z'] + well_props['depth']) + parent_point
+    @classmethod
+    def in_table(cls, table: WellGeometryTable, index: int) -> WellGeometry:
+        """ The geometry of one well of a :py:class:`WellGeometryTable` """
+        geometry = cls.__new__(cls)
+        geometry._bind(table, index)
+        return geometry
 
-        if not parent_object:
-            raise ValueError("Wells must have a parent")
-
-        self._parent = parent_object
+    def _bind(self, table: WellGeometryTable, index: int) -> None:
+        self._table = table
+        self._index = index
+        self._position_offset: Optional[Point] = None
+        self._position = self.position
 
-        self._length: Optional[float] = None
-        self._width: Optional[float] = None
-        self._diameter: Optional[float] = None
-
-        shape = well_props['shape']
-        if shape == 'rectangular':
-            rect_props = cast(RectangularWellDefinition, well_props)
-            self._length = rect_props['xDimension']
-            self._width = rect_props['yDimension']
-            self._x_size = self._length
-            self._y_size = self._width
-        elif shape == 'circular':
-            circular_props = cast(CircularWellDefinition, well_props)
-            self._diameter = circular_props['diameter']
-            self._x_size = self._y_size = self._diameter
-        else:
-            raise ValueError(
-                f'Shape "{shape}" is not a supported well shape')
-
-        self._max_volume = well_props['totalLiquidVolume']
-        self._depth = well_props['depth']
+    @property
+    def table(self) -> WellGeometryTable:
+        return self._table
 
     @property
     def parent(self) -> LabwareInterface:
-        return self._parent
+        return self._table.parent
+
+    @property
+    def name(self) -> str:
+        """ The name of this well's row in :py:attr:`table` """
+        return self._table.names[self._index]
 
     @property
     def position(self) -> Point:
+        offset = self._table.origin()
+        if offset is not self._position_offset:
+            self._position = self._table.relative_top(self._index) + offset
+            self._position_offset = offset
         return self._position
 
     @property
     def diameter(self) -> Optional[float]:
-        return self._diameter
+        return self._table.sizes(self._index)[2]
+
+    @property
+    def _length(self) -> Optional[float]:
+        return self._table.sizes(self._index)[0]
+
+    @property
+    def _width(self) -> Optional[float]:
+        return self._table.sizes(self._index)[1]
+
+    @property
+    def _depth(self) -> float:
+        return self._table.depth(self._index)
 
     def top(self, z: float = 0.0) -> Point:
-        return self._position + Point(0, 0, z)
+        return self.position + Point(0, 0, z)
 
     def bottom(self, z: float = 0.0) -> Point:
         top = self.top()
@@ -85,7 +293,7 @@ class WellGeometry:
 
     @property
     def max_volume(self) -> float:
-        return self._max_volume
+        return self._table.max_volume(self._index)
 
     def from_center_cartesian(
             self, x: float, y: float, z: float) -> Point:
@@ -109,8 +317,8 @@ class WellGeometry:
         coordinates
         """
         center = self.center()
-        x_size = self._x_size
-        y_size = self._y_size
+        x_size = self._table.x_size(self._index)
+        y_size = self._table.y_size(self._index)
         z_size = self._depth
 
         return Point(
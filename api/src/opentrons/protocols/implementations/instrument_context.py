@@ -1,6 +1,7 @@
 from typing import Optional
 
 from opentrons import types
+from opentrons.config import feature_flags as ff
 from opentrons.protocols.api_support.types import APIVersion
 from opentrons.hardware_control import CriticalPoint
 from opentrons.hardware_control.dev_types import PipetteDict
@@ -183,13 +184,14 @@ class InstrumentContextImplementation(InstrumentContextInterface):
                                     self._protocol_interface.get_deck(),
                                     instr_max_height,
                                     force_direct=force_direct,
-                                    minimum_z_height=minimum_z_height)
+                                    minimum_z_height=minimum_z_height,
+                                    use_corridor_planning=(
+                                        ff.enable_corridor_arc_planning()))
 
         try:
-            for move in moves:
-                hardware.move_to(
-                    self._mount, move[0], critical_point=move[1], speed=speed,
-                    max_speeds=self._protocol_interface.get_max_speeds().data)
+            hardware.move_through(
+                self._mount, moves, speed=speed,
+                max_speeds=self._protocol_interface.get_max_speeds().data)
         except Exception:
             self._protocol_interface.set_last_location(None)
             raise
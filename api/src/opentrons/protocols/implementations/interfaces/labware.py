@@ -3,6 +3,7 @@ from typing import List, Dict
 
 from opentrons.protocols.geometry.deck_item import DeckItem
 from opentrons.protocols.geometry.labware_geometry import LabwareGeometry
+from opentrons.protocols.geometry.well_geometry import WellGeometryTable
 from opentrons.protocols.implementations.tip_tracker import TipTracker
 from opentrons.protocols.implementations.well import WellImplementation
 from opentrons.protocols.implementations.well_grid import WellGrid
@@ -78,6 +79,10 @@ class LabwareInterface(DeckItem):
     def get_wells(self) -> List[WellImplementation]:
         ...
 
+    @abstractmethod
+    def get_well_table(self) -> WellGeometryTable:
+        ...
+
     @abstractmethod
     def get_wells_by_name(self) -> Dict[str, WellImplementation]:
         ...
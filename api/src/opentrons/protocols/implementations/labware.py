@@ -1,8 +1,9 @@
 from typing import List, Dict, Optional
 
 from opentrons.calibration_storage import helpers
+from opentrons.protocols.geometry.deck_item import HeightListener
 from opentrons.protocols.geometry.labware_geometry import LabwareGeometry
-from opentrons.protocols.geometry.well_geometry import WellGeometry
+from opentrons.protocols.geometry.well_geometry import WellGeometryTable
 from opentrons.protocols.implementations.interfaces.labware import \
     LabwareInterface
 from opentrons.protocols.implementations.tip_tracker import TipTracker
@@ -54,15 +55,20 @@ class LabwareImplementation(LabwareInterface):
         self._ordering = [
             well for col in definition['ordering'] for well in col
         ]
-        self._wells: List[WellImplementation] = []
+        self._calibrated_offset = self._geometry.offset
+        # Wells are positioned relative to the calibrated offset, so they
+        # are built once and follow any later calibration
+        self._well_table = WellGeometryTable(
+            wells={well: self._well_definition[well]
+                   for well in self._ordering},
+            parent_object=self)
+        self._wells = self._build_wells()
+        self._wells_by_name = {well.get_name(): well for well in self._wells}
         self._well_name_grid = WellGrid(wells=self._wells)
         self._tip_tracker = TipTracker(
             columns=self._well_name_grid.get_columns()
         )
-
-        self._calibrated_offset = Point(0, 0, 0)
-        # Will cause building of the wells
-        self.set_calibration(self._calibrated_offset)
+        self._height_listeners: List[HeightListener] = []
 
     def get_uri(self) -> str:
         return helpers.uri_from_definition(self._definition)
@@ -91,12 +97,11 @@ class LabwareImplementation(LabwareInterface):
             y=self._geometry.offset.y + delta.y,
             z=self._geometry.offset.z + delta.z
         )
-        # The wells must be rebuilt
-        self._wells = self._build_wells()
-        self._well_name_grid = WellGrid(wells=self._wells)
-        self._tip_tracker = TipTracker(
-            columns=self._well_name_grid.get_columns()
-        )
+        for listener in self._height_listeners:
+            listener(self)
+
+    def add_height_listener(self, listener: HeightListener) -> None:
+        self._height_listeners.append(listener)
 
     def get_calibrated_offset(self) -> Point:
         return self._calibrated_offset
@@ -124,10 +129,11 @@ class LabwareImplementation(LabwareInterface):
     def get_wells(self) -> List[WellImplementation]:
         return self._wells
 
+    def get_well_table(self) -> WellGeometryTable:
+        return self._well_table
+
     def get_wells_by_name(self) -> Dict[str, WellImplementation]:
-        return {
-            well.get_name(): well for well in self._wells
-        }
+        return self._wells_by_name
 
     def get_geometry(self) -> LabwareGeometry:
         return self._geometry
@@ -147,14 +153,10 @@ class LabwareImplementation(LabwareInterface):
     def _build_wells(self) -> List[WellImplementation]:
         return [
             WellImplementation(
-                well_geometry=WellGeometry(
-                    well_props=self._well_definition[well],
-                    parent_point=self._calibrated_offset,
-                    parent_object=self
-                ),
+                well_geometry=self._well_table.geometry(index),
                 display_name="{} of {}".format(well, self._display_name),
                 has_tip=self.is_tiprack(),
                 name=well
             )
-            for well in self._ordering
+            for index, well in enumerate(self._ordering)
         ]
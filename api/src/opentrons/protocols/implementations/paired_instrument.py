@@ -5,6 +5,7 @@ from functools import partial
 from typing import TYPE_CHECKING, Union, Optional, Callable, Tuple
 
 from opentrons import types
+from opentrons.config import feature_flags as ff
 from opentrons.hardware_control.types import CriticalPoint
 from opentrons.protocol_api.module_contexts import ThermocyclerContext
 from opentrons.protocol_api.labware import (
@@ -96,16 +97,16 @@ class PairedInstrument:
                                     self._ctx._implementation.get_deck(),
                                     min(primary_height, secondary_height),
                                     force_direct=force_direct,
-                                    minimum_z_height=minimum_z_height
+                                    minimum_z_height=minimum_z_height,
+                                    use_corridor_planning=(
+                                        ff.enable_corridor_arc_planning())
                                     )
         self._log.debug("move_to: {}->{} via:\n\t{}"
                         .format(from_loc, location, moves))
         try:
-            for move in moves:
-                self._hw_manager.hardware.move_to(
-                    self._pair_policy, move[0], critical_point=move[1],
-                    speed=speed,
-                    max_speeds=self._ctx._implementation.get_max_speeds().data)
+            self._hw_manager.hardware.move_through(
+                self._pair_policy, moves, speed=speed,
+                max_speeds=self._ctx._implementation.get_max_speeds().data)
         except Exception:
             self._ctx.location_cache = None
             raise
@@ -1,6 +1,7 @@
 import typing
 
 from opentrons import types
+from opentrons.config import feature_flags as ff
 from opentrons.hardware_control.dev_types import PipetteDict
 from opentrons.protocols.api_support.labware_like import LabwareLike
 from opentrons.protocols.api_support.util import FlowRates, PlungerSpeeds, \
@@ -88,7 +89,9 @@ class InstrumentContextSimulation(InstrumentContextInterface):
                             self._protocol_interface.get_deck(),
                             self._instrument_max_height,
                             force_direct=force_direct,
-                            minimum_z_height=minimum_z_height)
+                            minimum_z_height=minimum_z_height,
+                            use_corridor_planning=(
+                                ff.enable_corridor_arc_planning()))
 
         self._protocol_interface.set_last_location(location)
 
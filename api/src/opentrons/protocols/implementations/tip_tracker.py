@@ -1,5 +1,4 @@
-from itertools import dropwhile, takewhile
-from typing import Optional, Sequence
+from typing import Dict, List, Optional, Sequence, Tuple
 
 from opentrons.protocols.implementations.well import WellImplementation
 
@@ -8,9 +7,64 @@ Wells = Sequence[WellImplementation]
 WellColumns = Sequence[Wells]
 
 
+def _first_run(mask: int) -> Tuple[Optional[int], int]:
+    """The index of the lowest set bit in mask and the number of set bits
+    contiguous with it, or (None, 0) if no bits are set"""
+    if not mask:
+        return None, 0
+    first = (mask & -mask).bit_length() - 1
+    shifted = mask >> first
+    return first, (shifted ^ (shifted + 1)).bit_length() - 1
+
+
 class TipTracker:
+    """Tracks which wells of a tiprack hold tips.
+
+    The state of each column is kept as an integer bitmask (bit n set if the
+    nth well from the top has a tip), kept in sync with the wells' own
+    :py:meth:`.WellImplementation.has_tip`, so searching for a run of tips
+    takes a few bit operations per column.
+    """
+
     def __init__(self, columns: WellColumns):
         self._columns = columns
+        self._masks: List[int] = []
+        self._positions: Dict[str, Tuple[int, int]] = {}
+        for col_idx, column in enumerate(columns):
+            mask = 0
+            for row_idx, well in enumerate(column):
+                self._positions[well.get_name()] = (col_idx, row_idx)
+                if well.has_tip():
+                    mask |= 1 << row_idx
+                well.add_tip_listener(self._tip_set)
+            self._masks.append(mask)
+
+    def _tip_set(self, well: WellImplementation) -> None:
+        col_idx, row_idx = self._positions[well.get_name()]
+        if well.has_tip():
+            self._masks[col_idx] |= 1 << row_idx
+        else:
+            self._masks[col_idx] &= ~(1 << row_idx)
+
+    def _position(self, well: WellImplementation) -> Tuple[int, int]:
+        try:
+            return self._positions[well.get_name()]
+        except KeyError:
+            raise IndexError(f'{repr(well)} is not in this tiprack')
+
+    def _full_mask(self, col_idx: int) -> int:
+        return (1 << len(self._columns[col_idx])) - 1
+
+    def _find_run(self, masks: Sequence[int], num_tips: int,
+                  first_col: int = 0) -> Optional[WellImplementation]:
+        # Like the search this replaces, only the first run of set bits in
+        # each column is considered
+        for col_idx in range(first_col, len(masks)):
+            first, length = _first_run(masks[col_idx])
+            if length >= num_tips:
+                return None if first is None \
+                    else self._columns[col_idx][first]
+        return None
 
     def next_tip(self,
                  num_tips: int = 1,
@@ -30,33 +84,19 @@ class TipTracker:
         :type starting_tip: :py:class:`.Well`
         :return: the :py:class:`.Well` meeting the target criteria, or None
         """
-        columns: WellColumns = self._columns
+        masks = self._masks
+        first_col = 0
         if starting_tip:
-            # Remove columns preceding the one with the pipette's starting tip
-            drop_undefined_columns = list(
-                dropwhile(lambda x: starting_tip not in x, columns))
-            # Remove tips preceding the starting tip in the first column
-            drop_undefined_columns[0] = list(
-                dropwhile(lambda w: starting_tip is not w,
-                          drop_undefined_columns[0]))
-            columns = drop_undefined_columns
-
-        drop_leading_empties = [
-            list(dropwhile(lambda x: not x.has_tip(), column))
-            for column in columns]
-        drop_at_first_gap = [
-            list(takewhile(lambda x: x.has_tip(), column))
-            for column in drop_leading_empties]
-        long_enough = [
-            column for column in drop_at_first_gap if len(column) >= num_tips]
-
-        try:
-            first_long_enough = long_enough[0]
-            result: Optional[WellImplementation] = first_long_enough[0]
-        except IndexError:
-            result = None
-
-        return result
+            first_col, row_idx = self._position(starting_tip)
+            masks = list(masks)
+            if self._columns[first_col][row_idx] is starting_tip:
+                # Ignore tips preceding the starting tip in its column
+                masks[first_col] &= ~((1 << row_idx) - 1)
+            else:
+                # A well of the same name from another tiprack: like the
+                # search this replaces, skip the column it names
+                masks[first_col] = 0
+        return self._find_run(masks, num_tips, first_col)
 
     def use_tips(self,
                  start_well: WellImplementation,
@@ -82,10 +122,8 @@ class TipTracker:
         :type num_channels: int
         :param fail_if_full: for backwards compatibility
         """
-        # Select the column of the labware that contains the target well
-        target_column = [col for col in self._columns if start_well in col][0]
-
-        well_idx = target_column.index(start_well)
+        col_idx, well_idx = self._position(start_well)
+        target_column = self._columns[col_idx]
         # Number of tips to pick up is the lesser of (1) the number of tips
         # from the starting well to the end of the column, and (2) the number
         # of channels of the pipette (so a 4-channel pipette would pick up a
@@ -93,6 +131,7 @@ class TipTracker:
         # column would get a maximum of 2 tips)
         num_tips = min(len(target_column) - well_idx, num_channels)
         target_wells = target_column[well_idx: well_idx + num_tips]
+        target_mask = ((1 << num_tips) - 1) << well_idx
 
         # In API version 2.2, we no longer reset the tip tracker when a tip
         # is dropped back into a tiprack well. This fixes a behavior where
@@ -103,7 +142,7 @@ class TipTracker:
         # dirty tips and non-present tips; but until then, we can avoid the
         # exception.
         if fail_if_full:
-            assert all(well.has_tip() for well in target_wells),\
+            assert self._masks[col_idx] & target_mask == target_mask,\
                 '{} is out of tips'.format(str(self))
 
         for well in target_wells:
@@ -121,19 +160,9 @@ class TipTracker:
         :type num_tips: int
         :return: The :py:class:`.Well` meeting the target criteria, or ``None``
         """
-        columns = self._columns
-        drop_leading_filled = [
-            list(dropwhile(lambda x: x.has_tip(), column))
-            for column in columns]
-        drop_at_first_gap = [
-            list(takewhile(lambda x: not x.has_tip(), column))
-            for column in drop_leading_filled]
-        long_enough = [
-            column for column in drop_at_first_gap if len(column) >= num_tips]
-        try:
-            return long_enough[0][0]
-        except IndexError:
-            return None
+        empty = [~mask & self._full_mask(col_idx)
+                 for col_idx, mask in enumerate(self._masks)]
+        return self._find_run(empty, num_tips)
 
     def return_tips(self,
                     start_well: WellImplementation,
@@ -158,13 +187,13 @@ class TipTracker:
         :param num_channels: The number of channels for the current pipette
         :type num_channels: int
         """
-        # Select the column that contains the target_well
-        target_column = [col for col in self._columns if start_well in col][0]
-        well_idx = target_column.index(start_well)
+        col_idx, well_idx = self._position(start_well)
+        target_column = self._columns[col_idx]
         end_idx = min(well_idx + num_channels, len(target_column))
         drop_targets = target_column[well_idx:end_idx]
-        for well in drop_targets:
-            if well.has_tip():
-                raise AssertionError(f'Well {repr(well)} has a tip')
+        filled = self._masks[col_idx] >> well_idx
+        if filled & ((1 << len(drop_targets)) - 1):
+            well = drop_targets[_first_run(filled)[0] or 0]
+            raise AssertionError(f'Well {repr(well)} has a tip')
         for well in drop_targets:
             well.set_has_tip(True)
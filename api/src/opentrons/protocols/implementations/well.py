@@ -1,11 +1,15 @@
 from __future__ import annotations
 
 import re
+from typing import Callable, List
 
 from opentrons.protocols.geometry.well_geometry import WellGeometry
 from opentrons_shared_data.labware.constants import WELL_NAME_PATTERN
 
 
+TipListener = Callable[['WellImplementation'], None]
+
+
 class WellImplementation:
 
     pattern = re.compile(WELL_NAME_PATTERN, re.X)
@@ -30,6 +34,7 @@ class WellImplementation:
         """
         self._display_name = display_name
         self._has_tip = has_tip
+        self._tip_listeners: List[TipListener] = []
         self._name = name
 
         match = WellImplementation.pattern.match(name)
@@ -44,6 +49,12 @@ class WellImplementation:
 
     def set_has_tip(self, value: bool) -> None:
         self._has_tip = value
+        for listener in self._tip_listeners:
+            listener(self)
+
+    def add_tip_listener(self, listener: TipListener) -> None:
+        """Call listener with this well whenever its tip state is set"""
+        self._tip_listeners.append(listener)
 
     def get_display_name(self) -> str:
         return self._display_name
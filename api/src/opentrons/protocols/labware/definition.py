@@ -6,16 +6,16 @@ from dataclasses import dataclass
 
 from pathlib import Path
 from typing import (
-    Any, AnyStr, List, Dict, Union)
-
-import jsonschema  # type: ignore
+    Any, AnyStr, List, Dict, Tuple, Union)
 
+from opentrons.protocols import schemas
 from opentrons.protocols.api_support.util import ModifiedList
 from opentrons.calibration_storage import helpers, modify
 from opentrons.protocols.implementations.interfaces.labware import \
     LabwareInterface
 from opentrons.types import Point
-from opentrons_shared_data import load_shared_data, get_shared_data_root
+from opentrons.util.caching import Stamp, file_stamp
+from opentrons_shared_data import get_shared_data_root
 from opentrons.protocols.geometry.deck_item import DeckItem
 from opentrons.protocols.api_support.constants import (
     OPENTRONS_NAMESPACE, CUSTOM_NAMESPACE, STANDARD_DEFS_PATH, USER_DEFS_PATH)
@@ -71,18 +71,14 @@ def get_all_labware_definitions() -> List[str]:
     """
     labware_list = ModifiedList()
 
-    def _check_for_subdirectories(path):
-        with os.scandir(path) as top_path:
-            for sub_dir in top_path:
-                if sub_dir.is_dir():
-                    labware_list.append(sub_dir.name)
-
     # check for standard labware
-    _check_for_subdirectories(get_shared_data_root() / STANDARD_DEFS_PATH)
+    labware_list.extend(_list_directory(
+        get_shared_data_root() / STANDARD_DEFS_PATH, watch=False).subdirs)
 
     # check for custom labware
-    for namespace in os.scandir(USER_DEFS_PATH):
-        _check_for_subdirectories(namespace)
+    for namespace in _list_directory(USER_DEFS_PATH).subdirs:
+        labware_list.extend(
+            _list_directory(USER_DEFS_PATH / namespace).subdirs)
 
     return labware_list
 
@@ -140,14 +136,11 @@ def verify_definition(contents: Union[
     :raises jsonschema.ValidationError: If the definition is not valid.
     :returns: The parsed definition
     """
-    schema_body = load_shared_data('labware/schemas/2.json').decode('utf-8')
-    labware_schema_v2 = json.loads(schema_body)
-
     if isinstance(contents, dict):
         to_return = contents
     else:
         to_return = json.loads(contents)
-    jsonschema.validate(to_return, labware_schema_v2)
+    schemas.validate_labware(to_return, schemas.content_digest(contents))
     # we can type ignore this because if it passes the jsonschema it has
     # the correct structure
     return to_return  # type: ignore
@@ -217,6 +210,76 @@ def _get_labware_definition_from_bundle(
             f'namespace {namespace}, and version {version}.')
 
 
+@dataclass(frozen=True)
+class _DirectoryListing:
+    stamp: Stamp
+    subdirs: Tuple[str, ...]
+    files: frozenset
+
+
+@dataclass(frozen=True)
+class _CachedDefinition:
+    stamp: Stamp
+    text: str
+
+
+# The index of labware on disk is built lazily from these listings, and
+# definitions are kept as their JSON text: an immutable string that parses
+# into a fresh definition faster than a parsed one can be deep copied.
+# Both are keyed by path and checked against the modification time and size
+# of that path, except in shared data, which does not change while we run.
+_directory_listings: Dict[Path, _DirectoryListing] = {}
+_definitions: Dict[Path, _CachedDefinition] = {}
+
+
+def _list_directory(path: Path, watch: bool = True) -> _DirectoryListing:
+    """ The subdirectories and files in a directory, from the cache if it
+    has not changed since it was listed.
+
+    :raises FileNotFoundError: If the directory does not exist
+    """
+    cached = _directory_listings.get(path)
+    if cached and not watch:
+        return cached
+    stamp = file_stamp(path)
+    if cached and cached.stamp == stamp:
+        return cached
+    subdirs = []
+    files = set()
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir():
+                subdirs.append(entry.name)
+            else:
+                files.add(entry.name)
+    listing = _DirectoryListing(
+        stamp=stamp, subdirs=tuple(subdirs), files=frozenset(files))
+    _directory_listings[path] = listing
+    return listing
+
+
+def _labware_exists(
+        load_name: str, namespace: str, version: int) -> bool:
+    def_path = _get_path_to_labware(load_name, namespace, version)
+    try:
+        listing = _list_directory(
+            def_path.parent, watch=namespace != OPENTRONS_NAMESPACE)
+    except (FileNotFoundError, NotADirectoryError):
+        return False
+    return def_path.name in listing.files
+
+
+def _read_definition(def_path: Path, watch: bool) -> LabwareDefinition:
+    cached = _definitions.get(def_path)
+    stamp = file_stamp(def_path) if watch or not cached else cached.stamp
+    if not cached or cached.stamp != stamp:
+        with open(def_path, 'rb') as f:
+            cached = _CachedDefinition(
+                stamp=stamp, text=f.read().decode('utf-8'))
+        _definitions[def_path] = cached
+    return json.loads(cached.text)
+
+
 def _get_standard_labware_definition(
         load_name: str,
         namespace: str = None,
@@ -241,11 +304,9 @@ def _get_standard_labware_definition(
 
     if namespace is None:
         for fallback_namespace in [OPENTRONS_NAMESPACE, CUSTOM_NAMESPACE]:
-            try:
+            if _labware_exists(load_name, fallback_namespace, checked_version):
                 return _get_standard_labware_definition(
                     load_name, fallback_namespace, checked_version)
-            except FileNotFoundError:
-                pass
 
         raise FileNotFoundError(error_msg_string.format(
                 load_name, checked_version, OPENTRONS_NAMESPACE))
@@ -254,16 +315,14 @@ def _get_standard_labware_definition(
     def_path = _get_path_to_labware(load_name, namespace, checked_version)
 
     try:
-        with open(def_path, 'rb') as f:
-            labware_def = json.loads(f.read().decode('utf-8'))
+        return _read_definition(
+            def_path, watch=namespace != OPENTRONS_NAMESPACE)
     except FileNotFoundError:
         raise FileNotFoundError(
             f'Labware "{load_name}" not found with version {checked_version} '
             f'in namespace "{namespace}".'
         )
 
-    return labware_def
-
 
 def _get_parent_identifier(labware: LabwareInterface) -> str:
     """
@@ -15,12 +15,13 @@ from typing import Any, Dict, Optional, Union, Tuple, TYPE_CHECKING
 import jsonschema  # type: ignore
 
 from opentrons.config import feature_flags as ff
-from opentrons_shared_data import load_shared_data, protocol
+from opentrons_shared_data import protocol
 from .api_support.types import APIVersion
 from .types import (Protocol, PythonProtocol, JsonProtocol,
                     Metadata, MalformedProtocolError,
                     ApiDeprecationError)
 from .bundle import extract_bundle
+from . import schemas
 
 if TYPE_CHECKING:
     from opentrons_shared_data.labware.dev_types import LabwareDefinition
@@ -329,24 +330,21 @@ def _get_schema_for_protocol(version_num: int) -> protocol.Schema:
             f'JSON Protocol version {version_num} is not yet ' +
             'supported in this version of the API')
     try:
-        schema = load_shared_data(
-            f'protocol/schemas/{version_num}.json')
+        schema = schemas.load_schema(f'protocol/schemas/{version_num}.json')
     except FileNotFoundError:
         schema = None  # type: ignore
     if not schema:
         raise RuntimeError('JSON Protocol schema "{}" does not exist'
                            .format(version_num))
-    return json.loads(schema.decode('utf-8'))
+    return schema  # type: ignore
 
 
 def validate_json(
         protocol_json: Dict[Any, Any]) -> Tuple[int, 'JsonProtocolDef']:
     """ Validates a json protocol and returns its schema version """
     # Check if this is actually a labware
-    labware_schema_v2 = json.loads(load_shared_data(
-        'labware/schemas/2.json').decode('utf-8'))
     try:
-        jsonschema.validate(protocol_json, labware_schema_v2)
+        schemas.validate(schemas.labware_validator(), protocol_json)
     except jsonschema.ValidationError:
         pass
     else:
@@ -372,19 +370,13 @@ def validate_json(
             'version. Please update your OT-2 App and robot server to the '
             'latest version and try again.'
         )
-    protocol_schema = _get_schema_for_protocol(version_num)
-
-    # instruct schema how to resolve all $ref's used in protocol schemas
-    resolver = jsonschema.RefResolver(
-        protocol_schema.get('$id', ''),
-        protocol_schema,
-        store={
-            "opentronsLabwareSchemaV2": labware_schema_v2
-        })
+    # check the schema exists
+    _get_schema_for_protocol(version_num)
 
     # do the validation
     try:
-        jsonschema.validate(protocol_json, protocol_schema, resolver=resolver)
+        schemas.validate(
+            schemas.protocol_validator(version_num), protocol_json)
     except jsonschema.ValidationError:
         MODULE_LOG.exception("JSON protocol validation failed")
         raise RuntimeError(
@@ -0,0 +1,103 @@
+""" opentrons.protocols.schemas: compiled validators for the labware and
+protocol JSON schemas in shared data.
+
+Each schema is loaded, checked and compiled into a validator once per
+process, and labware definitions that have passed validation are remembered
+by a digest of their contents so they are not validated again.
+"""
+import functools
+import hashlib
+import json
+from typing import Any, Dict
+
+import jsonschema  # type: ignore
+from jsonschema.exceptions import best_match  # type: ignore
+
+from opentrons_shared_data import load_shared_data
+
+from opentrons.util.caching import LRUCache
+
+LABWARE_SCHEMA_V2 = 'labware/schemas/2.json'
+
+#: How many validated labware definitions to remember
+VALIDATED_CACHE_SIZE = 256
+
+_validated: 'LRUCache[str, bool]' = LRUCache(VALIDATED_CACHE_SIZE)
+
+
+@functools.lru_cache(maxsize=None)
+def load_schema(path: str) -> Dict[str, Any]:
+    """ Load a schema from shared data. The result is shared, so it must not
+    be modified.
+
+    :raises FileNotFoundError: If there is no such schema
+    """
+    return json.loads(load_shared_data(path).decode('utf-8'))
+
+
+def _build_validator(
+        schema: Dict[str, Any],
+        store: Dict[str, Dict[str, Any]] = None) -> Any:
+    cls = jsonschema.validators.validator_for(schema)
+    cls.check_schema(schema)
+    resolver = jsonschema.RefResolver(
+        schema.get('$id', ''), schema, store=store or {})
+    return cls(schema, resolver=resolver)
+
+
+@functools.lru_cache(maxsize=None)
+def labware_validator() -> Any:
+    """ The validator for the version 2 labware schema """
+    return _build_validator(load_schema(LABWARE_SCHEMA_V2))
+
+
+@functools.lru_cache(maxsize=None)
+def protocol_validator(version_num: int) -> Any:
+    """ The validator for a JSON protocol schema version, which resolves
+    references to the labware schema
+
+    :raises FileNotFoundError: If there is no schema for the version
+    """
+    return _build_validator(
+        load_schema(f'protocol/schemas/{version_num}.json'),
+        store={'opentronsLabwareSchemaV2': load_schema(LABWARE_SCHEMA_V2)})
+
+
+def validate(validator: Any, instance: Any) -> None:
+    """ Validate instance, raising the same error
+    :py:func:`jsonschema.validate` would
+
+    :raises jsonschema.ValidationError: If instance is not valid
+    """
+    error = best_match(validator.iter_errors(instance))
+    if error is not None:
+        raise error
+
+
+def content_digest(contents: Any) -> str:
+    """ A digest of a definition's contents, either its serialized form or
+    the parsed object """
+    if isinstance(contents, str):
+        contents = contents.encode('utf-8')
+    elif not isinstance(contents, bytes):
+        contents = json.dumps(
+            contents, sort_keys=True, separators=(',', ':')).encode('utf-8')
+    return hashlib.sha256(contents).hexdigest()
+
+
+def validate_labware(definition: Any, digest: str) -> None:
+    """ Validate a parsed labware definition whose contents have the given
+    :py:func:`content_digest`, unless contents with the same digest have
+    already been validated
+
+    :raises jsonschema.ValidationError: If the definition is not valid
+    """
+    if _validated.get(digest):
+        return
+    validate(labware_validator(), definition)
+    _validated.put(digest, True)
+
+
+def clear_validated() -> None:
+    """ Forget which labware definitions have been validated """
+    _validated.clear()
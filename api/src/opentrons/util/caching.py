@@ -0,0 +1,83 @@
+""" opentrons.util.caching: building blocks for the in-process caches of
+derived data kept throughout the api
+"""
+import os
+import threading
+from collections import OrderedDict
+from typing import Generic, NamedTuple, Optional, Tuple, TypeVar, Union
+
+#: The modification time in ns and size of a file, see :py:func:`file_stamp`
+Stamp = Tuple[int, int]
+
+KeyT = TypeVar('KeyT')
+ValueT = TypeVar('ValueT')
+
+
+def file_stamp(path: Union[str, 'os.PathLike[str]']) -> Stamp:
+    """ The modification time and size of a file or directory, to check
+    whether something read from it is still current
+
+    :raises FileNotFoundError: If there is nothing at path
+    """
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class LRUCache(Generic[KeyT, ValueT]):
+    """ A mapping that keeps only its ``maxsize`` most recently used
+    entries, for values that are not worth an
+    :py:func:`functools.lru_cache` on the function computing them (because
+    they are keyed by something other than its arguments, or are only
+    sometimes cached). It may be shared between threads.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self._entries: 'OrderedDict[KeyT, ValueT]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, key: KeyT) -> Optional[ValueT]:
+        """ The value for key, marking it as most recently used, or None if
+        there is none """
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def put(self, key: KeyT, value: ValueT) -> None:
+        """ Remember a value, which must not be None, forgetting the least
+        recently used ones beyond ``maxsize`` """
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """ Forget every value and reset the counts """
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._misses = 0
+
+    def info(self) -> CacheInfo:
+        """ How often :py:meth:`get` found a value, like
+        :py:func:`functools.lru_cache`'s ``cache_info`` """
+        with self._lock:
+            return CacheInfo(
+                self._hits, self._misses, self.maxsize, len(self._entries))
+
+    def __len__(self) -> int:
+        return len(self._entries)
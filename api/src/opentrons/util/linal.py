@@ -2,7 +2,7 @@ import logging
 import numpy as np  # type: ignore
 from numpy import insert, dot  # type: ignore
 from numpy.linalg import inv  # type: ignore
-from typing import List, Tuple, Union
+from typing import List, Optional, Tuple, Union
 
 from opentrons.calibration_storage.types import AttitudeMatrix
 
@@ -190,3 +190,45 @@ def apply_reverse(
     """ Like apply_transform but inverts the transform first
     """
     return apply_transform(inv(t), pos)
+
+
+def _apply_rows(
+        rows: Tuple[Tuple[float, ...], ...],
+        pos: AxisPosition) -> Tuple[float, float, float]:
+    x, y, z = pos  # type: ignore
+    (a, b, c), (d, e, f), (g, h, i) = rows
+    return (a * x + b * y + c * z,
+            d * x + e * y + f * z,
+            g * x + h * y + i * z)
+
+
+class DeckTransform:
+    """ A 3x3 deck calibration transform together with its inverse.
+
+    The inverse is computed once, the first time it is needed, rather than on
+    every conversion. Points are transformed in plain python, which for one
+    3-vector is much cheaper than going through numpy.
+    """
+
+    def __init__(self, t: Union[List[List[float]], np.ndarray]) -> None:
+        self._forward = np.array(t, dtype=float)
+        self._forward_rows = tuple(
+            tuple(row) for row in self._forward.tolist())
+        self._inverse: Optional[np.ndarray] = None
+        self._inverse_rows: Tuple[Tuple[float, ...], ...] = ()
+
+    def _invert(self) -> np.ndarray:
+        if self._inverse is None:
+            self._inverse = inv(self._forward)
+            self._inverse_rows = tuple(
+                tuple(row) for row in self._inverse.tolist())
+        return self._inverse
+
+    def apply(self, pos: AxisPosition) -> Tuple[float, float, float]:
+        """ Like :py:func:`apply_transform` """
+        return _apply_rows(self._forward_rows, pos)
+
+    def apply_reverse(self, pos: AxisPosition) -> Tuple[float, float, float]:
+        """ Like :py:func:`apply_reverse` """
+        self._invert()
+        return _apply_rows(self._inverse_rows, pos)
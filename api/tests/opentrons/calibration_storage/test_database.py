@@ -0,0 +1,137 @@
+import pytest
+
+from opentrons import config
+from opentrons.calibration_storage import (
+    database, delete, get, helpers, modify, file_operators as io)
+from opentrons.protocol_api import labware
+from opentrons.types import Mount, Point
+
+
+@pytest.fixture
+def use_database(ot_config_tempdir, monkeypatch):
+    def enable():
+        monkeypatch.setenv('OT_API_FF_enableCalibrationDatabase', '1')
+    yield enable
+    database.close()
+    io.clear_cache()
+
+
+@pytest.fixture
+def tiprack():
+    return labware.get_labware_definition('opentrons_96_tiprack_10ul')
+
+
+@pytest.fixture
+def plate():
+    return labware.get_labware_definition(
+        'corning_96_wellplate_360ul_flat')
+
+
+def _offset_id(definition, parent=''):
+    return helpers.hash_labware_def(definition) + parent
+
+
+def _save_everything(plate, tiprack):
+    modify.save_labware_calibration(
+        f'{_offset_id(plate, "magdeck")}.json', plate, Point(1, 2, 3),
+        parent='magdeck')
+    modify.save_tip_length_calibration(
+        'pip1', modify.create_tip_length_data(tiprack, '', 30.5))
+    modify.save_pipette_calibration(
+        Point(4, 5, 6), 'pip1', Mount.LEFT, 'hash', 'uri')
+    modify.save_robot_deck_attitude(
+        [[1, 0, 0], [0, 1, 0], [0, 0, 1]], 'pip1', 'hash')
+
+
+def _everything():
+    return (get.get_all_calibrations(),
+            get.get_all_tip_length_calibrations(),
+            get.get_all_pipette_offset_calibrations(),
+            get.get_pipette_offset('pip1', Mount.LEFT),
+            get.get_robot_deck_attitude())
+
+
+def test_imports_files(use_database, plate, tiprack):
+    _save_everything(plate, tiprack)
+    from_files = _everything()
+    use_database()
+    assert from_files[0]
+    assert _everything() == from_files
+    assert database.get_labware_offset(_offset_id(plate, 'magdeck'))
+
+
+def test_saves_to_database(use_database, plate, tiprack):
+    use_database()
+    _save_everything(plate, tiprack)
+    assert not list(config.get_opentrons_path(
+        'labware_calibration_offsets_dir_v2').glob('*.json'))
+    assert get.get_labware_calibration(
+        f'{_offset_id(plate, "magdeck")}.json', plate) == Point(1, 2, 3)
+    assert get.get_all_calibrations()[0].parent.module == 'magdeck'
+    tip_length = get.load_tip_length_calibration('pip1', tiprack, '')
+    assert tip_length.tip_length == 30.5
+    assert get.get_pipette_offset('pip1', Mount.LEFT).offset == [4, 5, 6]
+    assert get.get_pipette_offset('pip1', Mount.RIGHT) is None
+    assert get.get_robot_deck_attitude().pipette_calibrated_with == 'pip1'
+
+    modify.save_labware_calibration(
+        f'{_offset_id(plate)}.json', plate, Point(7, 8, 9))
+    assert get.get_labware_calibration(
+        f'{_offset_id(plate)}.json', plate) == Point(7, 8, 9)
+    assert len(get.get_all_calibrations()) == 2
+
+
+def test_deletes(use_database, plate, tiprack):
+    use_database()
+    _save_everything(plate, tiprack)
+    delete.delete_offset_file(_offset_id(plate, 'magdeck'))
+    with pytest.raises(KeyError):
+        delete.delete_offset_file(_offset_id(plate, 'magdeck'))
+    delete.delete_tip_length_calibration(_offset_id(tiprack), 'pip1')
+    with pytest.raises(FileNotFoundError):
+        delete.delete_tip_length_calibration(_offset_id(tiprack), 'pip1')
+    delete.delete_pipette_offset_file('pip1', Mount.LEFT)
+    delete.delete_robot_deck_attitude()
+    assert _everything() == ([], [], [], None, None)
+
+
+def test_clears(use_database, plate, tiprack):
+    use_database()
+    _save_everything(plate, tiprack)
+    delete.clear_calibrations()
+    delete.clear_tip_length_calibration()
+    delete.clear_pipette_offset_calibrations()
+    assert _everything()[:3] == ([], [], [])
+
+
+def test_failed_save_rolls_back(use_database):
+    use_database()
+
+    def fail(current):
+        raise RuntimeError()
+
+    with pytest.raises(RuntimeError):
+        database.save_labware_offset('lw', 'uri', '', '', fail)
+    assert get.get_all_calibrations() == []
+    with database._transaction() as conn:
+        assert conn.execute(
+            'SELECT COUNT(*) FROM labware_offset').fetchone()[0] == 0
+
+
+def test_imports_files_changed_while_off(
+        use_database, monkeypatch, plate, tiprack):
+    _save_everything(plate, tiprack)
+    use_database()
+    modify.save_pipette_calibration(
+        Point(7, 8, 9), 'pip1', Mount.LEFT, 'hash', 'uri')
+    database.close()
+
+    monkeypatch.delenv('OT_API_FF_enableCalibrationDatabase')
+    modify.save_tip_length_calibration(
+        'pip1', modify.create_tip_length_data(tiprack, '', 40.5))
+    use_database()
+    tip_length = get.load_tip_length_calibration('pip1', tiprack, '')
+    assert tip_length.tip_length == 40.5
+    # the pipette offset file was not changed, so what was saved to the
+    # database is kept
+    assert get.get_pipette_offset('pip1', Mount.LEFT).offset == [7, 8, 9]
@@ -0,0 +1,103 @@
+import json
+import os
+from unittest import mock
+
+import pytest
+
+from opentrons.calibration_storage import file_operators as io
+
+
+@pytest.fixture
+def cal_file(tmpdir):
+    io.clear_cache()
+    path = tmpdir / 'cal.json'
+    path.write(json.dumps({'offset': [1, 2, 3]}))
+    yield path
+    io.clear_cache()
+
+
+def test_cached_read_does_not_reopen(cal_file):
+    first = io.read_cached_cal_file(cal_file)
+    with mock.patch('builtins.open', side_effect=AssertionError):
+        assert io.read_cached_cal_file(cal_file) is first
+
+
+def test_external_change_invalidates(cal_file):
+    assert io.read_cal_file(cal_file) == {'offset': [1, 2, 3]}
+    cal_file.write(json.dumps({'offset': [4, 5, 6, 7]}))
+    stat = os.stat(cal_file)
+    os.utime(cal_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000))
+    assert io.read_cal_file(cal_file) == {'offset': [4, 5, 6, 7]}
+
+
+def test_save_writes_through(cal_file):
+    io.read_cal_file(cal_file)
+    io.save_to_file(cal_file, {'offset': [0, 0, 0]})
+    with mock.patch('builtins.open', side_effect=AssertionError):
+        assert io.read_cal_file(cal_file) == {'offset': [0, 0, 0]}
+    io.clear_cache()
+    assert io.read_cal_file(cal_file) == {'offset': [0, 0, 0]}
+
+
+def test_deleted_file(cal_file):
+    io.read_cal_file(cal_file)
+    os.remove(cal_file)
+    with pytest.raises(FileNotFoundError):
+        io.read_cal_file(cal_file)
+
+
+def test_read_returns_copy(cal_file):
+    data = io.read_cal_file(cal_file)
+    data['offset'].append(4)
+    assert io.read_cal_file(cal_file) == {'offset': [1, 2, 3]}
+
+
+@pytest.fixture
+def cal_dir(tmpdir):
+    io.clear_cache()
+    (tmpdir / 'a.json').write(json.dumps({'offset': [1, 2, 3]}))
+    yield tmpdir
+    io.clear_cache()
+
+
+def _touch(path):
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000))
+
+
+def test_settled_directory_is_listed_once(cal_dir, monkeypatch):
+    # treat the directory as settled although it was just written
+    monkeypatch.setattr(io, 'RACY_INTERVAL_NS', -10**12)
+    directory = io.read_cal_directory(cal_dir)
+    assert set(directory.names()) == {'a'}
+    assert directory.get('a') == {'offset': [1, 2, 3]}
+    assert directory.get('b') is None
+
+    with mock.patch('builtins.open', side_effect=AssertionError), \
+            mock.patch.object(os, 'scandir', side_effect=AssertionError):
+        assert io.read_cal_directory(cal_dir).get('a') == {'offset': [1, 2, 3]}
+        assert io.read_cal_directory(cal_dir).get('b') is None
+
+    io.save_to_file(cal_dir / 'a.json', {'offset': [4, 5, 6]})
+    with mock.patch('builtins.open', side_effect=AssertionError):
+        assert io.read_cal_directory(cal_dir).get('a') == {'offset': [4, 5, 6]}
+
+    # rewritten in place by another process, which leaves the directory be
+    (cal_dir / 'a.json').write(json.dumps({'offset': [0, 0, 0, 0]}))
+    _touch(cal_dir / 'a.json')
+    assert io.read_cal_directory(cal_dir).get('a') == {'offset': [0, 0, 0, 0]}
+
+    (cal_dir / 'b.json').write(json.dumps({'offset': [7, 8, 9]}))
+    _touch(cal_dir)
+    assert io.read_cal_directory(cal_dir).get('b') == {'offset': [7, 8, 9]}
+    os.remove(cal_dir / 'a.json')
+    _touch(cal_dir)
+    assert io.read_cal_directory(cal_dir).get('a') is None
+
+
+def test_recent_directory_checks_files(cal_dir):
+    assert io.read_cal_directory(cal_dir).get('a') == {'offset': [1, 2, 3]}
+    (cal_dir / 'a.json').write(json.dumps({'offset': [4, 5, 6]}))
+    _touch(cal_dir / 'a.json')
+    assert io.read_cal_directory(cal_dir).get('a') == {'offset': [4, 5, 6]}
+    assert io.read_cal_directory(cal_dir / 'missing').get('a') is None
@@ -7,7 +7,7 @@ from opentrons.config.advanced_settings import _migrate, _ensure
 
 @pytest.fixture
 def migrated_file_version() -> int:
-    return 9
+    return 12
 
 
 @pytest.fixture
@@ -27,6 +27,9 @@ def default_file_settings() -> Dict[str, Optional[bool]]:
         'enableHttpProtocolSessions': None,
         'enableFastProtocolUpload': None,
         'enableProtocolEngine': None,
+        'enableCalibrationDatabase': None,
+        'enableCorridorArcPlanning': None,
+        'enableSmoothieStreaming': None,
     }
 
 
@@ -139,6 +142,36 @@ def v9_config(v8_config):
     return r
 
 
+@pytest.fixture
+def v10_config(v9_config):
+    r = v9_config
+    r.update({
+        '_version': 10,
+        'enableCalibrationDatabase': True,
+    })
+    return r
+
+
+@pytest.fixture
+def v11_config(v10_config):
+    r = v10_config
+    r.update({
+        '_version': 11,
+        'enableCorridorArcPlanning': True,
+    })
+    return r
+
+
+@pytest.fixture
+def v12_config(v11_config):
+    r = v11_config
+    r.update({
+        '_version': 12,
+        'enableSmoothieStreaming': True,
+    })
+    return r
+
+
 @pytest.fixture(
     scope="session",
     params=[
@@ -153,6 +186,9 @@ def v9_config(v8_config):
         lazy_fixture("v7_config"),
         lazy_fixture("v8_config"),
         lazy_fixture("v9_config"),
+        lazy_fixture("v10_config"),
+        lazy_fixture("v11_config"),
+        lazy_fixture("v12_config"),
     ]
 )
 def old_settings(request):
@@ -222,4 +258,7 @@ def test_ensures_config(default_file_settings):
         'enableHttpProtocolSessions': None,
         'enableFastProtocolUpload': None,
         'enableProtocolEngine': None,
+        'enableCalibrationDatabase': None,
+        'enableCorridorArcPlanning': None,
+        'enableSmoothieStreaming': None,
     }
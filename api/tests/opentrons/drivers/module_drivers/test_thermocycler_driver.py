@@ -8,6 +8,9 @@
 # If you send a commmand to the serial comm module and it never sees the
 # expected ACK, then it'll eventually time out and return an error
 
+import asyncio
+import os
+import tty
 import types
 from unittest.mock import patch
 import pytest
@@ -192,3 +195,76 @@ def test_holding_at_target(patch_poller_wait):
     # not enough history
     tc._block_temp_buffer = [29.8, 30, 30, 30.1]
     assert not tc._is_holding_at_target()
+
+
+@pytest.fixture
+def tc_device(loop):
+    """ A pty that answers thermocycler status queries """
+    device, port = os.openpty()
+    tty.setraw(port)
+    responses = {'M119': 'Lid:closed',
+                 'M105': 'T:95.0 C:77.4 H:600',
+                 'M141': 'T:105.0 C:100.2',
+                 'M115': 'serial:abc model:def version:ghi',
+                 'M104': ''}
+    received = []
+
+    def respond():
+        for line in os.read(device, 1000).decode().split('\r\n'):
+            if line.strip():
+                received.append(line.strip())
+                os.write(device, (responses[line.split()[0]]
+                                  + '\r\n' + driver.TC_ACK).encode())
+
+    loop.add_reader(device, respond)
+    yield device, os.ttyname(port), received
+    loop.remove_reader(device)
+    os.close(device)
+    os.close(port)
+
+
+async def test_status_over_serial(loop, tc_device):
+    device, port, received = tc_device
+    interrupts = []
+    tc = await Thermocycler(interrupts.append).connect(port)
+    try:
+        assert tc.is_connected()
+        assert tc.port == port
+        assert tc.lid_status == 'closed'
+        assert await tc.get_device_info() == {
+            'serial': 'abc', 'model': 'def', 'version': 'ghi'}
+
+        await tc.update_status()
+        assert received[-3:] == ['M105', 'M119', 'M141']
+        assert (tc.temperature, tc.target, tc.hold_time) == (77.4, 95.0, 600)
+        assert (tc.lid_temp, tc.lid_target) == (100.2, 105.0)
+
+        # unsolicited messages between commands are lid interrupts
+        os.write(device, b'Lid:open\r\n')
+        await asyncio.sleep(0.05)
+        assert interrupts == [b'Lid:open\r\n']
+
+        # and are only reported once they are complete
+        os.write(device, b'Lid:clo')
+        await asyncio.sleep(0.05)
+        assert interrupts == [b'Lid:open\r\n']
+        os.write(device, b'sed\r\nLid:open\r\n')
+        await asyncio.sleep(0.05)
+        assert interrupts == [
+            b'Lid:open\r\n', b'Lid:closed\r\n', b'Lid:open\r\n']
+    finally:
+        tc.disconnect()
+    assert not tc.is_connected()
+
+
+async def test_set_temperature_reads_status(loop, tc_device):
+    device, port, received = tc_device
+    tc = await Thermocycler(lambda x: None).connect(port)
+    try:
+        # the status is read right after the write, rather than waiting
+        # for the poller to confirm the new target
+        await asyncio.wait_for(tc.set_temperature(95, hold_time=600), 0.5)
+        assert received[-4:] == ['M104 S95 H600', 'M105', 'M119', 'M141']
+        assert not tc._status_waiters._waiters
+    finally:
+        tc.disconnect()
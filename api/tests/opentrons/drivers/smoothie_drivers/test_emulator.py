@@ -0,0 +1,82 @@
+import pytest
+
+from opentrons.config import robot_configs
+from opentrons.drivers.smoothie_drivers.driver_3_0 import (
+    SmoothieDriver_3_0_0, SmoothieError)
+from opentrons.drivers.smoothie_drivers.emulator import SmoothieEmulator
+
+
+@pytest.fixture
+def emulator():
+    with SmoothieEmulator(
+            time_scale=0,
+            pipettes={'L': {'id': 'P3HSV2020', 'model': 'p300_single_v2.0'}}
+    ) as emulator:
+        yield emulator
+
+
+@pytest.fixture
+def emulated_smoothie(emulator, monkeypatch):
+    monkeypatch.setenv('ENABLE_VIRTUAL_SMOOTHIE', 'false')
+    driver = SmoothieDriver_3_0_0(robot_configs.load())
+    driver.connect(emulator.port)
+    yield driver
+    driver.disconnect()
+
+
+def test_connect(emulated_smoothie, emulator):
+    assert not emulated_smoothie.simulating
+    assert emulated_smoothie.get_fw_version() == emulator.firmware_version
+    assert emulator.steps_per_mm['B'] == \
+        robot_configs.DEFAULT_PIPETTE_CONFIGS['stepsPerMM']
+
+
+def test_home_and_move(emulated_smoothie, emulator):
+    emulated_smoothie.home()
+    assert all(emulated_smoothie.homed_flags.values())
+    assert emulator.position['X'] == emulated_smoothie.position['X']
+
+    emulated_smoothie.move({'X': 10, 'Y': 20, 'Z': 30})
+    assert emulator.position['X'] == 10
+    assert emulator.current['X'] == \
+        robot_configs.HIGH_CURRENT['default']['X']
+    emulated_smoothie.update_position()
+    assert emulated_smoothie.position['Z'] == 30
+    assert not any(emulated_smoothie.switch_state.values())
+
+
+def test_pipette_memory(emulated_smoothie):
+    assert emulated_smoothie.read_pipette_id('left') == 'P3HSV2020'
+    assert emulated_smoothie.read_pipette_model('left') == 'p300_single_v2.0'
+    assert emulated_smoothie.read_pipette_model('right') is None
+    emulated_smoothie.write_pipette_id('left', 'P3HSV2021')
+    assert emulated_smoothie.read_pipette_id('left') == 'P3HSV2021'
+    with pytest.raises(SmoothieError):
+        emulated_smoothie.write_pipette_id('right', 'P3HSV2021')
+
+
+def test_motion_timing(emulator):
+    emulator.time_scale = 1
+    emulator.position.update({'X': 0})
+    duration = emulator._move_duration({'X': 100}, 600 * 60)
+    # 100mm at up to 600mm/s with 3000mm/s^2 never reaches full speed
+    assert duration == pytest.approx(2 * (100 / 3000) ** 0.5)
+    duration = emulator._move_duration({'X': 100, 'Y': 100}, 100 * 60)
+    assert duration > 1
+
+
+def test_latency_once_per_command(emulated_smoothie, emulator, monkeypatch):
+    waits = []
+    stop_wait = emulator._stop.wait
+
+    def recording_wait(timeout=None):
+        waits.append(timeout)
+        return stop_wait(timeout)
+
+    monkeypatch.setattr(emulator._stop, 'wait', recording_wait)
+    emulator.command_latency = 0.0123
+    before = emulator.command_count
+    emulated_smoothie.get_fw_version()
+    commands = emulator.command_count - before
+    assert commands
+    assert waits.count(0.0123) == commands
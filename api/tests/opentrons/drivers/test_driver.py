@@ -256,8 +256,7 @@ def test_plunger_commands(smoothie, monkeypatch):
     expected = [
         ['M907 A0.1 B0.05 C0.05 X0.3 Y0.3 Z0.1 G4P0.005 G0B2'],
         ['M400'],
-        ['M907 A0.1 B0.05 C0.05 X0.3 Y0.3 Z0.1 G4P0.005'],
-        ['M400'],
+        # the plunger's dwelling current is unchanged, so is not resent
     ]
     fuzzy_assert(result=command_log, expected=expected)
     command_log = []
@@ -273,9 +272,7 @@ def test_plunger_commands(smoothie, monkeypatch):
         # Set active axes high
         ['M907 A0.8 B0.05 C0.05 X1.25 Y1.25 Z0.8 G4P0.005 G0.+[BC].+'],
         ['M400'],
-        # Set plunger current low
-        ['M907 A0.8 B0.05 C0.05 X1.25 Y1.25 Z0.8 G4P0.005'],
-        ['M400'],
+        # plunger current is already low, so is not set again
     ]
     fuzzy_assert(result=command_log, expected=expected)
 
@@ -381,8 +378,7 @@ def test_set_acceleration(smoothie, monkeypatch):
     expected = [
         ['M204 S10000 A4 B5 C6 X1 Y2 Z3'],
         ['M400'],
-        ['M204 S10000 A4 B5 C6 X1 Y2 Z3'],
-        ['M400'],
+        # popping the acceleration it was already set to sends nothing
         ['M204 S10000 A40 B50 C60 X10 Y20 Z30'],
         ['M400'],
         ['M204 S10000 A4 B5 C6 X1 Y2 Z3'],
@@ -614,12 +610,210 @@ def test_clear_limit_switch(smoothie, monkeypatch):
         # set current for homing the failed axis (C)
         'M907 A0.1 B0.05 C0.05 X0.3 Y0.3 Z0.1 G4P0.005 G28.2C',
         'M400',
-        # set current back to idling after home
-        'M907 A0.1 B0.05 C0.05 X0.3 Y0.3 Z0.1 G4P0.005',
-        'M400',
+        # currents while idling after home are unchanged, so not resent
         # update position
         'M114.2',
         'M400',
-        'M907 A0.1 B0.05 C0.05 X0.3 Y0.3 Z0.1 G4P0.005',
-        'M400',
     ]
+
+
+def test_streaming_defers_wait(smoothie, monkeypatch):
+    command_log = []
+    smoothie._setup()
+    smoothie.home()
+    smoothie.simulating = False
+
+    def write_with_log(command, ack, connection, timeout, tag=None):
+        command_log.append(command.strip())
+        return driver_3_0.SMOOTHIE_ACK
+
+    def _parse_position_response(arg):
+        return smoothie.position
+
+    monkeypatch.setattr(serial_communication, 'write_and_return',
+                        write_with_log)
+    monkeypatch.setattr(
+        driver_3_0, '_parse_position_response', _parse_position_response)
+
+    with smoothie.streaming_moves():
+        smoothie._send_command('G0X1')
+        smoothie._send_command('G0X2')
+        smoothie.move({'X': 3})
+        smoothie._send_command('G0X4')
+        smoothie.update_position()
+        smoothie._send_command('G0X5')
+
+    expected = [
+        # pure planner commands are queued without waiting
+        ['G0X1'],
+        ['G0X2'],
+        # current changes wait for in-flight moves first
+        ['M400'],
+        ['M907 A0.1 B0.05 C0.05 X1.25 Y0.3 Z0.1 G4P0.005 G0X3'],
+        ['G0X4'],
+        # position reads need a settled machine
+        ['M400'],
+        ['M114.2'],
+        ['M400'],
+        ['G0X5'],
+        # leaving streaming mode syncs what is still in flight
+        ['M400'],
+    ]
+    fuzzy_assert(result=command_log, expected=expected)
+    assert not smoothie.streaming
+
+
+def test_streaming_queue_depth(smoothie, monkeypatch):
+    command_log = []
+    smoothie.simulating = False
+    smoothie._streaming_queue_depth = 2
+
+    def write_with_log(command, ack, connection, timeout, tag=None):
+        command_log.append(command.strip())
+        return driver_3_0.SMOOTHIE_ACK
+
+    monkeypatch.setattr(serial_communication, 'write_and_return',
+                        write_with_log)
+
+    smoothie.streaming = True
+    for x in range(5):
+        smoothie._send_command(f'G0X{x}')
+    smoothie.wait_for_moves()
+    smoothie.wait_for_moves()
+    assert command_log == [
+        'G0X0', 'G0X1', 'M400', 'G0X2', 'G0X3', 'M400', 'G0X4', 'M400']
+
+
+def test_streaming_error_homes(smoothie, monkeypatch):
+    driver = smoothie
+    driver.home('xyza')
+    cmd_list = []
+
+    def write_mock(command, ack, serial_connection, timeout, tag=None):
+        cmd_list.append(command.strip())
+        if command.strip() == 'M400' and 'G0C5' in cmd_list:
+            cmd_list.clear()
+            return "ALARM: Hard limit +C"
+        elif driver_3_0.GCODES['CURRENT_POSITION'] in command:
+            return 'ok M114.2 X:10 Y:20: Z:30 A:40 B:50 C:60'
+        else:
+            return "ok"
+
+    monkeypatch.setattr(serial_communication, 'write_and_return', write_mock)
+
+    driver.simulating = False
+    driver.streaming = True
+    driver._send_command('G0C5')
+    # the failure of the streamed move is reported by the next sync, and is
+    # attributed to the streamed move
+    with pytest.raises(driver_3_0.SmoothieError) as e:
+        driver.update_position()
+    assert e.value.command == 'G0C5'
+    assert cmd_list[0] == 'M999'
+    assert any('G28.2C' in cmd for cmd in cmd_list)
+
+
+def test_elide_redundant_state():
+    state = driver_3_0._BoardState()
+    cmd, state = driver_3_0._elide_redundant_state(
+        'G0F6000 M907 X1 Y0.5 G4P0.005 G0X10', state)
+    assert cmd == 'G0F6000 M907 X1 Y0.5 G4P0.005 G0X10'
+    cmd, state = driver_3_0._elide_redundant_state(
+        'G0F6000 M907 X1 Y0.5 G4P0.005 G0X20', state)
+    assert cmd == 'G0X20'
+    cmd, state = driver_3_0._elide_redundant_state(
+        'M907 X1 Y0.3 G4P0.005 G0X30 G0F3000', state)
+    assert cmd == 'M907 X1 Y0.3 G4P0.005 G0X30 G0F3000'
+    cmd, state = driver_3_0._elide_redundant_state(
+        'M203.1 X600 Y400', state)
+    assert cmd == 'M203.1 X600 Y400'
+    cmd, new_state = driver_3_0._elide_redundant_state(
+        'M203.1 Y400 G0F3000', state)
+    assert cmd == ''
+    assert new_state.max_speed == {'X': 600, 'Y': 400}
+    assert new_state.feedrate == 'G0F3000'
+    # unrecognized or unknown state is always sent
+    cmd, _ = driver_3_0._elide_redundant_state('M204 S10000 X3000', state)
+    assert cmd == 'M204 S10000 X3000'
+    cmd, _ = driver_3_0._elide_redundant_state('M114.2', state)
+    assert cmd == 'M114.2'
+
+
+def test_redundant_commands_not_sent(smoothie, monkeypatch):
+    command_log = []
+    smoothie._setup()
+    smoothie.home()
+    smoothie.simulating = False
+
+    def write_with_log(command, ack, connection, timeout, tag=None):
+        command_log.append(command.strip())
+        if 'G0Y' in command:
+            return 'ALARM: Hard limit +Y'
+        return driver_3_0.SMOOTHIE_ACK
+
+    monkeypatch.setattr(serial_communication, 'write_and_return',
+                        write_with_log)
+    monkeypatch.setattr(smoothie, 'home', lambda *args, **kwargs: None)
+
+    smoothie.move({'X': 1, 'Z': 1})
+    smoothie.move({'X': 2, 'Z': 2})
+    smoothie.set_speed(100)
+    smoothie.set_speed(100)
+    smoothie.set_axis_max_speed({'X': 100})
+    smoothie.set_axis_max_speed({'X': 100})
+    with pytest.raises(driver_3_0.SmoothieError):
+        smoothie.move({'Y': 2})
+    # nothing is known about smoothie's state after an error
+    smoothie.move({'X': 3, 'Z': 3})
+
+    expected = [
+        ['M907 A0.1 B0.05 C0.05 X1.25 Y0.3 Z0.8 G4P0.005 G0X1Z1'],
+        ['M400'],
+        ['G0X2Z2'],
+        ['M400'],
+        ['G0F6000'],
+        ['M400'],
+        ['M203.1 X100'],
+        ['M400'],
+        ['M907 A0.1 B0.05 C0.05 X0.3 Y1.25 Z0.1 G4P0.005 G0Y2'],
+        ['M999'],
+        ['M400'],
+        ['M907 A0.1 B0.05 C0.05 X1.25 Y0.3 Z0.8 G4P0.005 G0X3Z3'],
+        ['M400'],
+    ]
+    fuzzy_assert(result=command_log, expected=expected)
+
+
+def test_retry_resends_elided_state(smoothie, monkeypatch):
+    command_log = []
+    smoothie._setup()
+    smoothie.home()
+    smoothie.simulating = False
+    dropped = []
+
+    def write_with_log(command, ack, connection, timeout, tag=None):
+        command_log.append(command.strip())
+        if 'G0X2' in command and not dropped:
+            dropped.append(command)
+            raise serial_communication.SerialNoResponse()
+        return driver_3_0.SMOOTHIE_ACK
+
+    monkeypatch.setattr(serial_communication, 'write_and_return',
+                        write_with_log)
+    monkeypatch.setattr(driver_3_0, 'sleep', lambda _: None)
+
+    smoothie.move({'X': 1, 'Z': 1})
+    smoothie.move({'X': 2, 'Z': 2})
+    smoothie.move({'X': 3, 'Z': 3})
+
+    # the retry is sent in full, and what it set is known afterwards
+    expected = [
+        ['M907 A0.1 B0.05 C0.05 X1.25 Y0.3 Z0.8 G4P0.005 G0X1Z1'],
+        ['M400'],
+        ['G0X2Z2'],
+        ['M907 A0.1 B0.05 C0.05 X1.25 Y0.3 Z0.8 G4P0.005 G0X2Z2'],
+        ['M400'],
+        ['G0X3Z3'],
+        ['M400'],
+    ]
+    fuzzy_assert(result=command_log, expected=expected)
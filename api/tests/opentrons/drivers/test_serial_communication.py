@@ -0,0 +1,93 @@
+import asyncio
+import os
+import threading
+import tty
+
+import pytest
+
+from opentrons.drivers import serial_communication
+from opentrons.drivers.serial_communication import SerialNoResponse
+
+ACK = 'ok\r\nok\r\n'
+
+
+@pytest.fixture
+def pty_pair():
+    device, port = os.openpty()
+    tty.setraw(port)
+    connection = serial_communication.connect(
+        port=os.ttyname(port), baudrate=115200)
+    yield device, connection
+    connection.close()
+    os.close(device)
+    os.close(port)
+
+
+def answer_after(loop, device, delay, response):
+    loop.call_later(delay, os.write, device, response.encode())
+
+
+async def test_write_and_return_async(loop, pty_pair):
+    device, connection = pty_pair
+    ticks = 0
+
+    async def tick():
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.01)
+
+    ticker = loop.create_task(tick())
+    answer_after(loop, device, 0.05, 'T:none C:25\r\n')
+    answer_after(loop, device, 0.1, ACK)
+    res = await serial_communication.write_and_return_async(
+        'M105\r\n', ACK, connection, timeout=1)
+    ticker.cancel()
+    assert res == 'T:none C:25'
+    assert os.read(device, 100) == b'M105\r\n'
+    # the loop kept running while the device answered
+    assert ticks >= 5
+
+
+async def test_write_and_return_async_timeout(loop, pty_pair):
+    device, connection = pty_pair
+    with pytest.raises(SerialNoResponse):
+        await serial_communication.write_and_return_async(
+            'M105\r\n', ACK, connection, timeout=0.1)
+    assert not serial_communication._pending
+
+
+async def test_sync_write_finishes_async(loop, pty_pair):
+    device, connection = pty_pair
+    pending = loop.create_task(serial_communication.write_and_return_async(
+        'M105\r\n', ACK, connection, timeout=1))
+    await asyncio.sleep(0.01)
+    assert os.read(device, 100) == b'M105\r\n'
+    # a blocking command on the same connection waits for the outstanding
+    # response rather than reading it as its own
+    os.write(device, ('C:25\r\n' + ACK).encode())
+    threading.Timer(
+        0.1, os.write, (device, ('serial:abc\r\n' + ACK).encode())).start()
+    res = serial_communication.write_and_return(
+        'M115\r\n', ACK, connection, timeout=1)
+    assert res == 'serial:abc'
+    assert await pending == 'C:25'
+
+
+async def test_sync_write_from_thread_finishes_async(loop, pty_pair):
+    device, connection = pty_pair
+    pending = loop.create_task(serial_communication.write_and_return_async(
+        'M105\r\n', ACK, connection, timeout=1))
+    await asyncio.sleep(0.01)
+    assert os.read(device, 100) == b'M105\r\n'
+    # the outstanding response arrives in pieces while another thread
+    # takes the connection over
+    answer_after(loop, device, 0.02, 'C:2')
+    answer_after(loop, device, 0.05, '5\r\n' + ACK)
+    threading.Timer(
+        0.15, os.write, (device, ('serial:abc\r\n' + ACK).encode())).start()
+    res = await loop.run_in_executor(
+        None, serial_communication.write_and_return,
+        'M115\r\n', ACK, connection, 1)
+    assert res == 'serial:abc'
+    assert await pending == 'C:25'
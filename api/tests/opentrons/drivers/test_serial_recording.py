@@ -0,0 +1,68 @@
+import pytest
+
+from opentrons.config import robot_configs
+from opentrons.drivers import serial_communication
+from opentrons.drivers.serial_recording import (
+    SerialRecorder, SerialReplayer, SerialReplayError, read_exchanges)
+from opentrons.drivers.smoothie_drivers.driver_3_0 import SmoothieDriver_3_0_0
+from opentrons.drivers.smoothie_drivers.emulator import SmoothieEmulator
+
+
+def _run_session(port=None):
+    driver = SmoothieDriver_3_0_0(robot_configs.load())
+    driver.connect(port)
+    driver.home('Z')
+    driver.move({'Z': 100})
+    driver.update_position()
+    position = driver.position
+    driver.disconnect()
+    return position
+
+
+@pytest.fixture
+def recording(tmpdir, monkeypatch):
+    monkeypatch.setenv('ENABLE_VIRTUAL_SMOOTHIE', 'false')
+    path = str(tmpdir.join('session.log.gz'))
+    with SmoothieEmulator(time_scale=0) as emulator:
+        port = emulator.port
+        with SerialRecorder(path):
+            position = _run_session(port)
+    return path, port, position
+
+
+def test_record(recording):
+    path, port, _ = recording
+    exchanges = list(read_exchanges(path))
+    assert exchanges
+    assert all(ex.port == port for ex in exchanges)
+    assert any(ex.command.startswith('M114.2') and 'MCS' in ex.response
+               for ex in exchanges)
+    assert serial_communication._recorder is None
+
+
+def test_replay(recording, tmpdir):
+    path, port, position = recording
+    replay_path = str(tmpdir.join('replay.log'))
+    with SerialReplayer(path) as replayer, SerialRecorder(replay_path):
+        # with no port given, the recorded port is found by device name
+        assert _run_session() == position
+    assert replayer.remaining() == {}
+    assert not replayer.mismatches
+    assert [(ex.command, ex.response) for ex in read_exchanges(path)] == \
+        [(ex.command, ex.response) for ex in read_exchanges(replay_path)]
+    assert serial_communication._replayer is None
+
+
+def test_replay_mismatch(recording):
+    path, port, _ = recording
+    with SerialReplayer(path):
+        connection = serial_communication.connect(port=port)
+        with pytest.raises(SerialReplayError):
+            serial_communication.write_and_return(
+                'G0X1\r\n\r\n', 'ok\r\nok\r\n', connection)
+
+    with SerialReplayer(path, strict=False) as replayer:
+        connection = serial_communication.connect(port=port)
+        assert serial_communication.write_and_return(
+            'G0X1\r\n\r\n', 'ok\r\nok\r\n', connection) == ''
+    assert replayer.mismatches[0]['actual'] == 'G0X1\r\n\r\n'
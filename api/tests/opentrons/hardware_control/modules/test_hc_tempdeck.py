@@ -1,6 +1,6 @@
 import asyncio
 from opentrons.hardware_control import modules, ExecutionManager
-from opentrons.hardware_control.modules import tempdeck
+from opentrons.hardware_control.modules import polling, tempdeck
 
 
 async def test_sim_initialization(loop):
@@ -56,17 +56,23 @@ async def test_poller(monkeypatch, loop):
             execution_manager=ExecutionManager(loop=loop),
             simulating=True,
             loop=loop)
-    hit = False
+    hit = asyncio.Event(loop=loop)
 
-    def update_called():
-        nonlocal hit
-        hit = True
+    async def poll_called():
+        hit.set()
 
-    monkeypatch.setattr(temp._driver, 'update_temperature', update_called)
+    # simulated modules are not polled
     await temp._connect()
-    assert temp._poller.is_alive()
-    await asyncio.sleep(tempdeck.TEMP_POLL_INTERVAL_SECS * 1.1)
-    assert hit
+    assert not polling.get_service(loop).is_polling(temp)
+
+    monkeypatch.setattr(tempdeck.TempDeck, 'is_simulated', False)
+    monkeypatch.setattr(temp._driver, 'poll_temperature', poll_called)
+    await temp._connect()
+    try:
+        assert polling.get_service(loop).is_polling(temp)
+        await asyncio.wait_for(hit.wait(), 0.5)
+    finally:
+        temp._stop_polling()
 
 
 async def test_revision_model_parsing(loop):
@@ -1,5 +1,7 @@
 import asyncio
 from unittest import mock
+
+import pytest
 from opentrons.hardware_control import modules, ExecutionManager
 
 
@@ -158,3 +160,31 @@ async def test_set_temperature(monkeypatch, loop):
                                                  volume=None,
                                                  ramp_rate=None)
     set_temp_driver_mock.reset_mock()
+
+
+async def test_waits_wake_on_poll(loop):
+    therm = await modules.build(port='/dev/ot_module_sim_thermocycler0',
+                                which='thermocycler',
+                                simulating=True,
+                                interrupt_callback=lambda x: None,
+                                loop=loop,
+                                execution_manager=ExecutionManager(loop=loop))
+    wait = loop.create_task(therm.wait_for_temp())
+    await asyncio.sleep(0.05)
+    assert not wait.done()
+
+    # a status change is only noticed once the module is polled
+    therm._driver._active = True
+    await asyncio.sleep(0.05)
+    assert not wait.done()
+    await therm.poll()
+    await asyncio.wait_for(wait, 0.1)
+
+    # cancelling a wait leaves nothing behind
+    therm._driver._active = False
+    wait = loop.create_task(therm.wait_for_temp())
+    await asyncio.sleep(0.01)
+    wait.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await wait
+    assert not therm._status_waiters._waiters
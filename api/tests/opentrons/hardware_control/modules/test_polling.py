@@ -0,0 +1,97 @@
+import asyncio
+
+import pytest
+
+from opentrons.hardware_control.modules import polling
+from opentrons.hardware_control.modules.polling import PollRate
+
+
+class FakeModule:
+    def __init__(self):
+        self.polls = 0
+        self.is_changing = False
+        self.port = '/dev/fake'
+        self.fail = False
+
+    @classmethod
+    def name(cls):
+        return 'fake'
+
+    async def poll(self):
+        self.polls += 1
+        if self.fail:
+            raise RuntimeError('no answer')
+
+
+@pytest.fixture
+def service(loop):
+    return polling.ModulePollingService(loop)
+
+
+async def test_adaptive_rate(loop, service):
+    active, idle = FakeModule(), FakeModule()
+    active.is_changing = True
+    service.add(active, PollRate(active=0.02, idle=10))
+    service.add(idle, PollRate(active=0.02, idle=10))
+    await asyncio.sleep(0.15)
+    # both are polled right away, then only the changing one keeps going
+    assert idle.polls == 1
+    assert active.polls >= 4
+
+    # a command can ask for a poll without waiting for the idle interval
+    service.poll_soon(idle)
+    await asyncio.sleep(0.01)
+    assert idle.polls == 2
+
+    service.remove(active)
+    service.remove(idle)
+    await asyncio.sleep(0.01)
+    assert service._task.done()
+
+
+async def test_set_rate(loop, service):
+    module = FakeModule()
+    service.add(module, PollRate(active=10, idle=10))
+    await asyncio.sleep(0.01)
+    assert module.polls == 1
+    service.set_rate(module, PollRate(active=0.02, idle=0.02))
+    assert service.get_rate(module) == PollRate(active=0.02, idle=0.02)
+    await asyncio.sleep(0.1)
+    assert module.polls >= 3
+    service.remove(module)
+
+
+async def test_subscribers(loop, service):
+    module, failing = FakeModule(), FakeModule()
+    failing.fail = True
+    updates = []
+
+    def bad_subscriber(mod):
+        raise ValueError()
+
+    unsubscribe = service.subscribe(updates.append)
+    service.subscribe(bad_subscriber)
+    service.add(module, PollRate(active=10, idle=10))
+    service.add(failing, PollRate(active=10, idle=10))
+    await asyncio.sleep(0.01)
+    # neither a failed poll nor a failing subscriber stops the service
+    assert updates == [module, failing]
+
+    unsubscribe()
+    service.poll_soon(module)
+    await asyncio.sleep(0.01)
+    assert module.polls == 2
+    assert updates == [module, failing]
+    service.remove(module)
+    service.remove(failing)
+
+
+async def test_weak_references(loop, service):
+    module = FakeModule()
+    service.add(module, PollRate(active=10, idle=10))
+    await asyncio.sleep(0.01)
+    del module
+    assert not service._entries
+    await asyncio.sleep(0.01)
+    assert service._task.done()
+    assert polling.get_service(loop) is polling.get_service(loop)
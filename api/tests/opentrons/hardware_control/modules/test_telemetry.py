@@ -0,0 +1,93 @@
+import pytest
+
+from opentrons.hardware_control import modules, ExecutionManager
+from opentrons.hardware_control.modules import telemetry
+from opentrons.hardware_control.modules.telemetry import TemperatureHistory
+
+
+def test_raw_wraps_around():
+    history = TemperatureHistory(('temperature', 'target'), raw_capacity=3)
+    for second in range(5):
+        history.record((20 + second, None), at=100 + second)
+    res = history.query(resolution=telemetry.RAW)
+    assert res['resolution'] == telemetry.RAW
+    assert res['time'] == [102, 103, 104]
+    assert res['temperature'] == [22, 23, 24]
+    assert res['target'] == [None, None, None]
+
+
+def test_downsampling():
+    history = TemperatureHistory(('temperature', 'target'))
+    # four readings a second for two and a half minutes, ramping up to a
+    # target that changes halfway through each second
+    start = 6000
+    for tick in range(600):
+        at = start + tick / 4
+        target = 40 if tick % 4 < 2 else 50
+        history.record((tick, target), at=at)
+
+    seconds = history.query(resolution=telemetry.SECOND)
+    assert seconds['time'][:2] == [6000, 6001]
+    # temperatures average, targets keep their last value
+    assert seconds['temperature'][:2] == [1.5, 5.5]
+    assert seconds['target'][:2] == [50, 50]
+    # the second still accumulating is included
+    assert len(seconds['time']) == 150
+    assert seconds['time'][-1] == 6149
+
+    minutes = history.query(resolution=telemetry.MINUTE)
+    assert minutes['time'] == [6000, 6060, 6120]
+    assert minutes['temperature'] == [119.5, 359.5, 539.5]
+
+
+def test_missing_values_are_skipped_in_means():
+    history = TemperatureHistory(('temperature', 'target'))
+    history.record((None, None), at=10.0)
+    history.record((30, None), at=10.5)
+    history.record((None, None), at=11.0)
+    res = history.query(resolution=telemetry.SECOND)
+    assert res['temperature'] == [30, None]
+    assert res['target'] == [None, None]
+
+
+def test_time_range():
+    history = TemperatureHistory(('temperature', 'target'), raw_capacity=10)
+    for second in range(10):
+        history.record((second, 50), at=1000 + second)
+    res = history.query(start=1002, end=1004)
+    assert res['resolution'] == telemetry.RAW
+    assert res['time'] == [1002, 1003, 1004]
+    assert history.query(start=2000)['time'] == []
+
+
+def test_picks_resolution_by_age():
+    history = TemperatureHistory(('temperature', 'target'), raw_capacity=5)
+    for second in range(200):
+        history.record((second, 50), at=second)
+    # raw readings only reach back to 195, the per-second tier to 0
+    assert history.query(start=196)['resolution'] == telemetry.RAW
+    assert history.query(start=100)['resolution'] == telemetry.SECOND
+    assert history.query()['resolution'] == telemetry.SECOND
+    assert TemperatureHistory(('temperature',)).query() == {
+        'resolution': telemetry.RAW, 'time': [], 'temperature': []}
+
+
+def test_bad_resolution():
+    history = TemperatureHistory(('temperature', 'target'))
+    with pytest.raises(ValueError):
+        history.query(resolution='1h')
+
+
+async def test_polls_record_history(loop):
+    temp = await modules.build(
+        port='/dev/ot_module_sim_tempdeck0',
+        which='tempdeck',
+        simulating=True,
+        interrupt_callback=lambda x: None,
+        loop=loop,
+        execution_manager=ExecutionManager(loop=loop))
+    await temp.set_temperature(45)
+    await temp.poll()
+    res = temp.temperature_history(resolution=telemetry.RAW)
+    assert res['temperature'] == [45]
+    assert res['target'] == [45]
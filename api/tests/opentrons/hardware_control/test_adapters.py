@@ -1,5 +1,11 @@
+import asyncio
+
+import pytest
+
 from opentrons.types import Mount
 from opentrons.hardware_control import API, ThreadManager
+from opentrons.hardware_control.adapters import SynchronousAdapter
+from opentrons.hardware_control.thread_manager import CallBridger
 
 
 async def test_synch_adapter():
@@ -9,3 +15,62 @@ async def test_synch_adapter():
     assert synch.attached_instruments[Mount.LEFT]['name']\
                 .startswith('p10_single')
     thread_manager.clean_up()
+
+
+def test_synch_adapter_caches_dispatch(monkeypatch):
+    thread_manager = ThreadManager(API.build_hardware_simulator)
+    synch = thread_manager.sync
+    assert synch.home is synch.home
+    assert synch.get_instrument_max_height is \
+        synch.get_instrument_max_height
+
+    calls = []
+
+    async def fake_home(self, axes=None):
+        calls.append(axes)
+    monkeypatch.setattr(API, 'home', fake_home)
+    synch.home()
+    assert calls == [None]
+    thread_manager.clean_up()
+
+
+def test_synch_adapter_inline_on_idle_loop(loop):
+    api = loop.run_until_complete(API.build_hardware_simulator(loop=loop))
+    synch = SynchronousAdapter(api)
+    synch.home()
+    assert synch.gantry_position(Mount.LEFT) == loop.run_until_complete(
+        api.gantry_position(Mount.LEFT))
+
+
+async def test_synch_adapter_refuses_own_running_loop(loop, monkeypatch):
+    api = await API.build_hardware_simulator(loop=loop)
+    synch = SynchronousAdapter(api)
+    calls = []
+
+    async def fake_home(self, axes=None):
+        calls.append(axes)
+    monkeypatch.setattr(API, 'home', fake_home)
+    with pytest.raises(RuntimeError):
+        synch.home()
+    assert calls == []
+
+
+def test_synch_adapter_from_managed_thread():
+    thread_manager = ThreadManager(API.build_hardware_simulator)
+    synch = thread_manager.sync
+
+    async def home_synchronously():
+        synch.home()
+    with pytest.raises(RuntimeError):
+        asyncio.run_coroutine_threadsafe(
+            home_synchronously(), thread_manager._loop).result()
+    thread_manager.clean_up()
+
+
+async def test_call_bridger_inline(loop):
+    api = await API.build_hardware_simulator(loop=loop)
+    bridged = CallBridger(api, loop)
+    assert bridged.home is bridged.home
+    await bridged.home()
+    assert await bridged.gantry_position(Mount.LEFT)\
+        == await api.gantry_position(Mount.LEFT)
@@ -1,4 +1,6 @@
 import asyncio
+import copy
+import json
 from unittest import mock
 try:
     import aionotify
@@ -222,6 +224,51 @@ async def test_cache_instruments_sim(loop, dummy_instruments):
         await sim.cache_instruments({types.Mount.LEFT: 'p10_sing'})
 
 
+async def test_instrument_dict_cached(dummy_instruments, loop):
+    hw_api = await hc.API.build_hardware_simulator(
+        attached_instruments=dummy_instruments, loop=loop)
+    await hw_api.home()
+    await hw_api.cache_instruments()
+    mount = types.Mount.LEFT
+    assert hw_api.get_instrument_state_version(types.Mount.RIGHT) == 0
+
+    version = hw_api.get_instrument_state_version(mount)
+    assert version != 0
+    with mock.patch.object(
+            hw_api, '_build_instrument_dict',
+            wraps=hw_api._build_instrument_dict) as build:
+        first = hw_api.get_attached_instrument(mount)
+        assert hw_api.get_attached_instrument(mount) == first
+    assert build.call_count == 1
+    assert hw_api.get_instrument_state_version(mount) == version
+    # callers get their own copy, which is a plain dict
+    first['default_aspirate_speeds'].clear()
+    json.dumps(first)
+    copy.deepcopy(first)
+    assert hw_api.get_attached_instrument(mount)['default_aspirate_speeds']
+
+    await hw_api.pick_up_tip(mount, 20.0)
+    assert hw_api.get_instrument_state_version(mount) != version
+    with_tip = hw_api.get_attached_instrument(mount)
+    assert with_tip['has_tip'] and not first['has_tip']
+
+    await hw_api.add_tip(types.Mount.RIGHT, 20.0)
+    await hw_api.remove_tip(mount)
+    assert not hw_api.get_attached_instrument(mount)['has_tip']
+    await hw_api.add_tip(mount, 30.0)
+    assert hw_api.get_attached_instrument(mount)['has_tip']
+
+    version = hw_api.get_instrument_state_version(mount)
+    hw_api.set_flow_rate(mount, aspirate=1)
+    assert hw_api.get_instrument_state_version(mount) != version
+    assert hw_api.get_attached_instrument(mount)['aspirate_flow_rate'] == 1
+
+    await hw_api.prepare_for_aspirate(mount)
+    await hw_api.aspirate(mount, 1)
+    assert hw_api.get_attached_instrument(mount)['current_volume'] == 1
+    assert hw_api.get_attached_instrument(types.Mount.RIGHT) == {}
+
+
 async def test_prep_aspirate(dummy_instruments, loop):
     hw_api = await hc.API.build_hardware_simulator(
         attached_instruments=dummy_instruments, loop=loop)
@@ -97,6 +97,23 @@ async def test_move_extras_passed_through(hardware_api, monkeypatch):
     assert mock_be_move.call_args_list[0][1]['axis_max_speeds'] == {'Y': 20}
 
 
+async def test_move_through(hardware_api, monkeypatch):
+    await hardware_api.home()
+    mock_be_move = mock.Mock()
+    monkeypatch.setattr(hardware_api._backend, 'move', mock_be_move)
+    moves = [(types.Point(10, 10, 100), None),
+             (types.Point(30, 20, 100), CriticalPoint.XY_CENTER),
+             (types.Point(30, 20, 10), None)]
+    await hardware_api.move_through(
+        types.Mount.RIGHT, moves, speed=30, max_speeds={Axis.X: 10})
+    assert len(mock_be_move.call_args_list) == 3
+    for args, kwargs in mock_be_move.call_args_list:
+        assert kwargs['speed'] == 30
+        assert kwargs['axis_max_speeds'] == {'X': 10}
+    assert await hardware_api.gantry_position(types.Mount.RIGHT)\
+        == types.Point(30, 20, 10)
+
+
 async def test_mount_offset_applied(
         hardware_api, is_robot, toggle_new_calibration):
     await hardware_api.home()
@@ -87,28 +87,24 @@ async def test_motion(ctx, hardware):
 async def test_max_speeds(ctx, monkeypatch, hardware):
     ctx.connect(hardware)
     ctx.home()
-    mock_move = mock.Mock()
-    monkeypatch.setattr(
-        ctx._implementation.get_hardware().hardware, 'move_to', mock_move)
+    calls = []
+
+    async def fake_move_through(self, mount, moves, **kwargs):
+        calls.append(kwargs)
+    monkeypatch.setattr(API, 'move_through', fake_move_through)
     instr = ctx.load_instrument('p10_single', Mount.RIGHT)
     instr.move_to(Location(Point(0, 0, 0), None))
-    assert all(
-        kwargs['max_speeds'] == {}
-        for args, kwargs in mock_move.call_args_list)
+    assert [kwargs['max_speeds'] for kwargs in calls] == [{}]
 
-    mock_move.reset_mock()
+    calls.clear()
     ctx.max_speeds['x'] = 10
     instr.move_to(Location(Point(0, 0, 1), None))
-    assert all(
-        kwargs['max_speeds'] == {Axis.X: 10}
-        for args, kwargs in mock_move.call_args_list)
+    assert [kwargs['max_speeds'] for kwargs in calls] == [{Axis.X: 10}]
 
-    mock_move.reset_mock()
+    calls.clear()
     ctx.max_speeds['x'] = None
     instr.move_to(Location(Point(1, 0, 1), None))
-    assert all(
-        kwargs['max_speeds'] == {}
-        for args, kwargs in mock_move.call_args_list)
+    assert [kwargs['max_speeds'] for kwargs in calls] == [{}]
 
 
 async def test_location_cache(ctx, monkeypatch, get_labware_def, hardware):
@@ -124,7 +120,8 @@ async def test_location_cache(ctx, monkeypatch, get_labware_def, hardware):
                        well_z_margin=None,
                        lw_z_margin=None,
                        force_direct=False,
-                       minimum_z_height=None):
+                       minimum_z_height=None,
+                       use_corridor_planning=False):
         nonlocal test_args
         test_args = (from_loc, to_loc, deck, well_z_margin, lw_z_margin)
         return [(Point(0, 1, 10), None),
@@ -374,8 +371,11 @@ def test_aspirate(ctx, get_labware_def, monkeypatch):
 
     fake_hw_aspirate = mock.Mock()
     fake_move = mock.Mock()
+
+    async def async_fake_move(self, *args, **kwargs):
+        fake_move(*args, **kwargs)
     monkeypatch.setattr(API, 'aspirate', fake_hw_aspirate)
-    monkeypatch.setattr(API, 'move_to', fake_move)
+    monkeypatch.setattr(API, 'move_to', async_fake_move)
 
     instr.pick_up_tip()
     instr.aspirate(2.0, lw.wells()[0].bottom())
@@ -400,7 +400,7 @@ def test_aspirate(ctx, get_labware_def, monkeypatch):
     hardware = ctx._implementation.get_hardware().hardware
     hardware._obj_to_adapt._attached_instruments[
         Mount.RIGHT
-    ]._current_volume = 1
+    ].set_current_volume(1)
 
     instr.aspirate(2.0)
     fake_move.assert_not_called()
@@ -433,7 +433,7 @@ def test_dispense(ctx, get_labware_def, monkeypatch):
 
     move_called_with = None
 
-    def fake_move(self, mount, loc, **kwargs):
+    async def fake_move(self, mount, loc, **kwargs):
         nonlocal move_called_with
         move_called_with = (mount, loc, kwargs)
 
@@ -752,6 +752,9 @@ def test_transfer_options(ctx, monkeypatch):
         dispense=tf.DispenseOpts()
     )
     assert transfer_options == expected_xfer_options2
+    instr.consolidate(50, lw2.columns()[0], lw1.rows()[0][0],
+                      optimize_travel=True)
+    assert transfer_options.transfer.optimize_travel
     with pytest.raises(ValueError, match='air_gap.*'):
         instr.transfer(300, lw1['A1'], lw2['A1'], air_gap=300)
     with pytest.raises(ValueError, match='air_gap.*'):
@@ -283,6 +283,27 @@ def test_back_compat(corning_96_wellplate_360ul_flat):
     assert repr(w11[1][2]) == well_c3_name
 
 
+def test_well_accessors_reuse_wells(corning_96_wellplate_360ul_flat):
+    lw = corning_96_wellplate_360ul_flat
+    a1 = lw['A1']
+    assert lw.wells()[0] is a1
+    assert lw.wells_by_name()['A1'] is a1
+    assert lw.rows()[0][0] is a1
+    assert lw.columns_by_name()['1'][0] is a1
+    assert lw.rows_by_name()['B'][1] is lw.columns()[1][1]
+
+    # the lists handed out are the caller's to change
+    wells = lw.wells()
+    wells.reverse()
+    assert lw.wells()[0] is a1
+
+    # calibrating moves the same wells
+    top = a1.top().point
+    lw.set_calibration(Point(1, 2, 3))
+    assert lw['A1'] is a1
+    assert a1.top().point == top + Point(1, 2, 3)
+
+
 def test_well_parent(corning_96_wellplate_360ul_flat):
     lw = corning_96_wellplate_360ul_flat
     parent = Location(Point(7, 8, 9), lw)
@@ -720,3 +741,21 @@ def test_labware_hash_func_diff_implementation_same_version(
     l2 = labware.Labware(implementation=impl2, api_level=APIVersion(2, 3))
 
     assert len({l1, l2}) == 2
+
+
+def test_well_equality_matches_hash(corning_96_wellplate_360ul_flat_def):
+    location = Location(Point(0, 0, 0), 'Test Slot')
+    impl = LabwareImplementation(corning_96_wellplate_360ul_flat_def, location)
+    a = labware.Labware(implementation=impl)
+    b = labware.Labware(implementation=impl, api_level=APIVersion(2, 3))
+    assert a['A1'] == b['A1']
+    assert hash(a['A1']) == hash(b['A1'])
+    assert len({a['A1'], b['A1']}) == 1
+    assert a['A1'] != a['B1']
+
+    # the same well of another labware in the same place is another well
+    other = labware.Labware(implementation=LabwareImplementation(
+        corning_96_wellplate_360ul_flat_def, location))
+    assert other['A1'].top().point == a['A1'].top().point
+    assert other['A1'] != a['A1']
+    assert len({a['A1'], other['A1']}) == 2
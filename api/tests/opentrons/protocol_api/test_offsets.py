@@ -4,6 +4,7 @@ import os
 import pytest
 import datetime
 from opentrons import config
+from unittest import mock
 from unittest.mock import Mock
 from opentrons.calibration_storage import (
     modify,
@@ -357,7 +358,7 @@ def test_load_calibration(monkeypatch, clear_calibration):
     assert calibration_point == test_offset
 
 
-def test_wells_rebuilt_with_offset():
+def test_wells_follow_offset():
     test_labware = labware.Labware(
         implementation=LabwareImplementation(
             minimalLabwareDef,
@@ -365,13 +366,17 @@ def test_wells_rebuilt_with_offset():
         )
     )
     old_wells = test_labware.wells()
+    old_top = old_wells[0].top().point
+    visited = {old_wells[0]}
     assert test_labware._implementation.get_geometry().offset ==\
         Point(10, 10, 5)
     assert test_labware._implementation.get_calibrated_offset() ==\
         Point(10, 10, 5)
     labware.save_calibration(test_labware, Point(2, 2, 2))
     new_wells = test_labware.wells()
-    assert old_wells[0] != new_wells[0]
+    assert old_wells[0] is new_wells[0]
+    assert new_wells[0].top().point == old_top + Point(2, 2, 2)
+    assert new_wells[0] in visited
     assert test_labware._implementation.get_geometry().offset ==\
         Point(10, 10, 5)
     assert test_labware._implementation.get_calibrated_offset() ==\
@@ -412,3 +417,24 @@ def testhash_labware_def():
     assert helpers.hash_labware_def(def1a) == helpers.hash_labware_def(def1b)
     # different data should not match
     assert helpers.hash_labware_def(def1a) != helpers.hash_labware_def(def2)
+
+
+def test_hash_labware_def_cached():
+    helpers.clear_labware_hash_cache()
+    definition = {"metadata": {"a": 1}, "parameters": {"tipLength": 50}}
+    with mock.patch.object(
+            helpers, 'sha256', wraps=helpers.sha256) as sha:
+        first = helpers.hash_labware_def(definition)
+        assert helpers.hash_labware_def(definition) == first
+        assert helpers.hash_labware_def(
+            json.loads(json.dumps(definition))) == first
+        assert sha.call_count == 1
+
+        # changing the definition in place changes its hash
+        definition['parameters']['tipLength'] = 60
+        changed = helpers.hash_labware_def(definition)
+        assert changed != first
+        assert sha.call_count == 2
+        definition['parameters']['tipLength'] = 50
+        assert helpers.hash_labware_def(definition) == first
+        assert sha.call_count == 2
@@ -106,8 +106,11 @@ def test_aspirate(set_up_paired_instrument, monkeypatch, ctx):
 
     fake_hw_aspirate = mock.Mock()
     fake_move = mock.Mock()
+
+    async def async_fake_move(self, *args, **kwargs):
+        fake_move(*args, **kwargs)
     monkeypatch.setattr(API, 'aspirate', fake_hw_aspirate)
-    monkeypatch.setattr(API, 'move_to', fake_move)
+    monkeypatch.setattr(API, 'move_to', async_fake_move)
 
     paired.pick_up_tip()
     paired.aspirate(2.0, lw.wells()[0].bottom())
@@ -133,7 +136,7 @@ def test_aspirate(set_up_paired_instrument, monkeypatch, ctx):
     hardware = ctx._implementation.get_hardware().hardware
     hardware._obj_to_adapt._attached_instruments[
         Mount.RIGHT
-    ]._current_volume = 1
+    ].set_current_volume(1)
 
     paired.aspirate(2.0)
     fake_move.assert_not_called()
@@ -165,7 +168,7 @@ def test_dispense(set_up_paired_instrument, monkeypatch, ctx):
 
     move_called_with = None
 
-    def fake_move(self, mount, loc, **kwargs):
+    async def fake_move(self, mount, loc, **kwargs):
         nonlocal move_called_with
         move_called_with = (mount, loc, kwargs)
 
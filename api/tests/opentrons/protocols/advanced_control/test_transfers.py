@@ -1321,3 +1321,101 @@ def test_blowout_to_dest(_instr_labware):
         {'method': 'drop_tip', 'args': [], 'kwargs': {}}]
     for step, expected in zip(dist_plan, exp):
         assert step == expected
+
+
+def test_plan_is_streamed(_instr_labware):
+    _instr_labware['ctx'].home()
+    lw1 = _instr_labware['lw1']
+    lw2 = _instr_labware['lw2']
+
+    xfer_plan = tx.TransferPlan(
+        (20, 40), lw1.columns()[0][0], lw2.wells(),
+        _instr_labware['instr'],
+        max_volume=_instr_labware['instr'].hw_pipette['working_volume'],
+        api_version=_instr_labware['ctx'].api_version,
+        mode='transfer')
+    steps = iter(xfer_plan)
+    assert next(steps) == tx.TransferStep('pick_up_tip')
+    first = next(steps)
+    assert isinstance(first, tx.TransferStep)
+    assert first.method == first['method'] == 'aspirate'
+    assert first.args == (20, lw1['A1'], 1.0)
+    assert first == {'method': 'aspirate',
+                     'args': [20, lw1['A1'], 1.0], 'kwargs': {}}
+
+    # planning again starts from the beginning
+    plan_list = list(xfer_plan)
+    assert plan_list == list(xfer_plan)
+    aspirated = [step.args[0] for step in plan_list
+                 if step.method == 'aspirate']
+    assert len(aspirated) == 96
+    assert aspirated[0] == 20 and aspirated[-1] == 40
+    assert all(step.args[1] == lw1['A1'] for step in plan_list
+               if step.method == 'aspirate')
+
+
+def test_optimize_travel(_instr_labware):
+    _instr_labware['ctx'].home()
+    lw1 = _instr_labware['lw1']
+    lw2 = _instr_labware['lw2']
+    zig_zag = [lw2[name] for name in
+               ('A1', 'H12', 'B1', 'G12', 'C1', 'F12', 'D1', 'E12')]
+    volumes = [10, 20, 30, 40, 50, 60, 70, 80]
+
+    def plan(mode, sources, dests, optimize):
+        options = tx.TransferOptions()
+        options = options._replace(
+            transfer=options.transfer._replace(
+                optimize_travel=optimize))
+        return tx.TransferPlan(
+            volumes, sources, dests, _instr_labware['instr'],
+            max_volume=_instr_labware['instr'].hw_pipette['working_volume'],
+            api_version=_instr_labware['ctx'].api_version,
+            mode=mode, options=options)
+
+    def visits(steps, method):
+        return [tuple(step.args[:2]) for step in steps
+                if step.method == method]
+
+    # ========== Distribute ===========
+    given = plan('distribute', lw1['A1'], zig_zag, False)
+    given_steps = list(given)
+    assert given.travel_saved == 0
+    assert visits(given_steps, 'dispense') == list(zip(volumes, zig_zag))
+
+    # each tip full goes to the same wells with the same volumes, closer
+    # wells one after the other
+    optimized = plan('distribute', lw1['A1'], zig_zag, True)
+    steps = list(optimized)
+    assert optimized.travel_saved > 100
+    assert [step.method for step in steps] \
+        == [step.method for step in given_steps]
+    assert visits(steps, 'aspirate') == visits(given_steps, 'aspirate')
+    dispensed = visits(steps, 'dispense')
+    assert dispensed != visits(given_steps, 'dispense')
+    assert sorted(dispensed) == sorted(visits(given_steps, 'dispense'))
+    columns = [well.well_name[1:] for _, well in dispensed]
+    assert sum(a != b for a, b in zip(columns, columns[1:])) <= 3
+    assert list(optimized) == steps
+
+    # ========== Consolidate ===========
+    optimized = plan('consolidate', zig_zag, lw1['A1'], True)
+    steps = list(optimized)
+    assert optimized.travel_saved > 100
+    aspirated = visits(steps, 'aspirate')
+    assert sorted(aspirated) == sorted(zip(volumes, zig_zag))
+    dispensed = visits(steps, 'dispense')
+    assert sum(volume for volume, _ in dispensed) == sum(volumes)
+    assert all(well == lw1['A1'] for _, well in dispensed)
+
+    # a tip full of wells already in order stays in order
+    in_order = plan('distribute', lw1['A1'], lw2.columns()[0], True)
+    assert visits(list(in_order), 'dispense') \
+        == list(zip(volumes, lw2.columns()[0]))
+    assert in_order.travel_saved == 0
+
+    # well positions come from the labware geometry tables
+    wells = [lw2['H12'], lw1['A1'], lw1['B2'], lw2['A1']]
+    targets = [wells[0], wells[1].top(5), wells[2], wells[3]]
+    for (x, y), well in zip(tx._xys(targets), wells):
+        assert (x, y) == pytest.approx(tuple(well.top().point)[:2])
@@ -2,7 +2,8 @@ import pytest
 
 from opentrons.types import Location, Point
 from opentrons.protocols.geometry.planning import (
-    plan_moves, safe_height, should_dodge_thermocycler)
+    plan_moves, safe_height, should_dodge_thermocycler, thermocycler_dodge,
+    LabwareHeightError, plan_cache_info, clear_plan_cache)
 from opentrons.protocols.geometry.deck import Deck
 from opentrons.protocol_api import labware
 from opentrons.protocols.geometry import module_geometry
@@ -83,6 +84,73 @@ def test_highest_z():
     assert deck.highest_z == mod.highest_z
 
 
+def test_highest_z_follows_items():
+    deck = Deck()
+    fixed_trash = deck.get_fixed_trash()
+    tall_lw = labware.load(tall_lw_name, deck.position_for(1))
+    deck[1] = tall_lw
+    short_lw = labware.load(labware_name, deck.position_for(2))
+    deck[2] = short_lw
+    assert deck.tallest_item is tall_lw
+
+    tall_lw.set_calibration(Point(0, 0, 5))
+    assert deck.highest_z == tall_lw.highest_z
+    tall_lw.set_calibration(Point(0, 0, -200))
+    assert deck.tallest_item is fixed_trash
+    assert deck.highest_z == fixed_trash.highest_z
+
+    # an item that left the deck no longer counts
+    del deck[1]
+    tall_lw.set_calibration(Point(0, 0, 100))
+    assert deck.highest_z == fixed_trash.highest_z
+
+    mod = module_geometry.load_module(
+        module_geometry.TemperatureModuleModel.TEMPERATURE_V1,
+        deck.position_for(8))
+    deck[8] = mod
+    mod_lw = labware.load(tall_lw_name, mod.location)
+    mod.add_labware(mod_lw)
+    assert deck.highest_z == mod.highest_z
+    mod_lw.set_calibration(Point(0, 0, 10))
+    assert deck.highest_z == mod.highest_z
+    mod.reset_labware()
+    assert deck.highest_z == max(mod.highest_z, fixed_trash.highest_z)
+
+
+def test_thermocycler_tracking():
+    deck = Deck()
+    assert not deck.has_thermocycler
+    tc = module_geometry.load_module(
+        module_geometry.ThermocyclerModuleModel.THERMOCYCLER_V1,
+        deck.position_for(7))
+    deck[7] = tc
+    assert deck.has_thermocycler
+    for slot in (7, 8, 10, 11):
+        assert deck.get_collisions_for_item(
+            slot, labware.load(labware_name, deck.position_for(slot))) \
+            == {7: [tc]}
+    assert deck.get_collisions_for_item(
+        4, labware.load(labware_name, deck.position_for(4))) == {}
+    del deck[7]
+    assert not deck.has_thermocycler
+    deck[8] = labware.load(labware_name, deck.position_for(8))
+
+
+def test_slot_geometry():
+    deck = Deck()
+    for slot in deck.slots:
+        assert deck.get_slot_definition(slot['id']) is slot
+        box = slot['boundingBox']
+        assert deck.get_slot_center(slot['id']) == Point(
+            slot['position'][0] + box['xDimension']/2,
+            slot['position'][1] + box['yDimension']/2,
+            slot['position'][2] + box['zDimension']/2)
+    with pytest.raises(ValueError):
+        deck.get_slot_definition('13')
+    with pytest.raises(ValueError):
+        deck.get_slot_center(5)
+
+
 def check_arc_basic(arc, from_loc, to_loc):
     """ Check the tests that should always be true for different-well moves
     - we should always go only up, then only xy, then only down
@@ -400,6 +468,137 @@ def test_should_dodge():
     )
 
 
+def test_height_map():
+    deck = Deck()
+    fixed_trash = deck.get_fixed_trash()
+    assert [(s.slot, s.item) for s in deck.height_map] == [(12, fixed_trash)]
+    tall_lw = labware.load(tall_lw_name, deck.position_for(3))
+    deck[3] = tall_lw
+    tc = module_geometry.load_module(
+        module_geometry.ThermocyclerModuleModel.THERMOCYCLER_V1,
+        deck.position_for(7))
+    deck[7] = tc
+    by_slot = {s.slot: s for s in deck.height_map}
+    assert sorted(by_slot) == [3, 7, 8, 10, 11, 12]
+    assert by_slot[3].item is tall_lw
+    assert by_slot[3].height == tall_lw.highest_z
+    assert by_slot[3].low == Point(265, 0, 0)
+    assert by_slot[3].high == Point(393, 86, 0)
+    assert by_slot[11].item is tc
+    tall_lw.set_calibration(Point(0, 0, 5))
+    assert {s.slot: s.height for s in deck.height_map}[3] \
+        == tall_lw.highest_z
+    del deck[7]
+    assert [s.slot for s in deck.height_map] == [3, 12]
+
+
+def test_corridor_arc():
+    deck = Deck()
+    lw1 = labware.load(labware_name, deck.position_for(1))
+    lw2 = labware.load(labware_name, deck.position_for(2))
+    tall_lw = labware.load(tall_lw_name, deck.position_for(10))
+    deck[1] = lw1
+    deck[2] = lw2
+    deck[10] = tall_lw
+    from_loc, to_loc = lw1.wells()[0].top(), lw2.wells()[0].bottom()
+
+    # by default arcs clear the tallest thing on the deck
+    arc = plan_moves(from_loc, to_loc, deck, P300M_GEN2_MAX_HEIGHT, 5.0, 10.0)
+    assert arc[0][0].z == tall_lw.highest_z + 10.0
+
+    # but in a corridor only the slots passed over count
+    arc = plan_moves(from_loc, to_loc, deck, P300M_GEN2_MAX_HEIGHT, 5.0, 10.0,
+                     use_corridor_planning=True)
+    check_arc_basic(arc, from_loc, to_loc)
+    assert arc[0][0].z == lw1.highest_z + 10.0
+
+    # moves that pass over the tall labware still clear it
+    to_back = labware.load(labware_name, deck.position_for(11))
+    deck[11] = to_back
+    arc = plan_moves(from_loc, to_back.wells()[0].top(), deck,
+                     P300M_GEN2_MAX_HEIGHT, 5.0, 10.0,
+                     use_corridor_planning=True)
+    assert arc[0][0].z == tall_lw.highest_z + 10.0
+
+    # and an arc too tall for the pipette names what is in the way
+    with pytest.raises(LabwareHeightError, match='Opentrons 96 Tip Rack'):
+        plan_moves(from_loc, to_back.wells()[0].top(), deck,
+                   tall_lw.highest_z - 10, 5.0, 10.0,
+                   use_corridor_planning=True)
+    plan_moves(from_loc, to_loc, deck, tall_lw.highest_z - 10, 5.0, 10.0,
+               use_corridor_planning=True)
+
+
+def test_corridor_dodges_thermocycler():
+    deck = Deck()
+    lw1 = labware.load(labware_name, deck.position_for(1))
+    lw2 = labware.load(labware_name, deck.position_for(2))
+    lw9 = labware.load(labware_name, deck.position_for(9))
+    deck[1] = lw1
+    deck[2] = lw2
+    deck[9] = lw9
+    front, back = lw1.wells()[0].top(), lw9.wells()[0].top()
+    assert not thermocycler_dodge(deck, front.point, back.point)
+
+    tc = module_geometry.load_module(
+        module_geometry.ThermocyclerModuleModel.THERMOCYCLER_V1,
+        deck.position_for(7))
+    deck[7] = tc
+    tc_lw = tc.add_labware(labware.load(labware_name, tc.location))
+    (low, high), = deck.thermocycler_footprints
+    assert (low, high) == (Point(0, 181, 0), Point(260.5, 357.5, 0))
+
+    # crossing the thermocycler goes around its front right corner
+    assert thermocycler_dodge(deck, front.point, back.point) \
+        == [(270.5, 171.0)]
+    arc = plan_moves(front, back, deck, P300M_GEN2_MAX_HEIGHT,
+                     use_corridor_planning=True)
+    assert len(arc) == 4
+    assert arc[1][0]._replace(z=0) == Point(270.5, 171.0, 0)
+    assert arc[0][0].z >= tc.highest_z
+
+    # but not moving next to it, or to and from it
+    assert not thermocycler_dodge(
+        deck, front.point, lw2.wells()[0].top().point)
+    assert not thermocycler_dodge(
+        deck, front.point, tc_lw.wells()[0].top().point)
+    assert not thermocycler_dodge(
+        deck, tc_lw.wells()[0].top().point, back.point)
+
+
+def test_plan_cache():
+    clear_plan_cache()
+    deck = Deck()
+    lw1 = labware.load(labware_name, deck.position_for(1))
+    lw2 = labware.load(labware_name, deck.position_for(2))
+    deck[1] = lw1
+    deck[2] = lw2
+    from_loc, to_loc = lw1.wells()[0].top(), lw2.wells()[0].bottom()
+
+    first = plan_moves(from_loc, to_loc, deck, P300M_GEN2_MAX_HEIGHT)
+    first.append(None)
+    second = plan_moves(from_loc, to_loc, deck, P300M_GEN2_MAX_HEIGHT)
+    assert second == first[:-1]
+    info = plan_cache_info()
+    assert (info.hits, info.misses, info.currsize) == (1, 1, 1)
+
+    # different options, deck contents or calibration are planned again
+    plan_moves(from_loc, to_loc, deck, P300M_GEN2_MAX_HEIGHT, 1.0, 1.0)
+    assert plan_cache_info().misses == 2
+    tall_lw = labware.load(tall_lw_name, deck.position_for(3))
+    deck[3] = tall_lw
+    assert plan_moves(from_loc, to_loc, deck, P300M_GEN2_MAX_HEIGHT)[0][0].z \
+        == tall_lw.highest_z + 10.0
+    tall_lw.set_calibration(Point(0, 0, 5))
+    assert plan_moves(from_loc, to_loc, deck, P300M_GEN2_MAX_HEIGHT)[0][0].z \
+        == tall_lw.highest_z + 10.0
+    plan_moves(from_loc, to_loc, Deck(), P300M_GEN2_MAX_HEIGHT)
+    assert plan_cache_info()[:2] == (1, 5)
+
+    clear_plan_cache()
+    assert plan_cache_info() == (0, 0, plan_cache_info().maxsize, 0)
+
+
 def test_labware_in_next_slot():
     deck = Deck()
     trough = labware.load(trough_name, deck.position_for(4))
@@ -0,0 +1,86 @@
+import pytest
+
+from opentrons.types import Location, Point
+from opentrons.protocol_api import labware
+from opentrons.protocols.implementations.labware import LabwareImplementation
+
+labware_name = 'corning_96_wellplate_360ul_flat'
+trough_name = 'usascientific_12_reservoir_22ml'
+
+
+@pytest.fixture
+def plate():
+    return LabwareImplementation(
+        definition=labware.get_labware_definition(labware_name),
+        parent=Location(Point(100, 200, 0), 'Test Slot'))
+
+
+@pytest.fixture
+def trough():
+    return LabwareImplementation(
+        definition=labware.get_labware_definition(trough_name),
+        parent=Location(Point(0, 0, 0), 'Test Slot'))
+
+
+def test_table_matches_wells(plate):
+    table = plate.get_well_table()
+    wells = plate.get_wells()
+    assert list(table.names) == [well.get_name() for well in wells]
+    for well, top, bottom, center in zip(
+            wells, table.tops(2), table.bottoms(1), table.centers()):
+        geometry = well.get_geometry()
+        assert geometry.table is table
+        assert geometry.name == well.get_name()
+        assert tuple(top) == pytest.approx(geometry.top(2))
+        assert tuple(bottom) == pytest.approx(geometry.bottom(1))
+        assert tuple(center) == pytest.approx(geometry.center())
+
+    column = plate.get_well_grid().get_column('3')
+    names = [well.get_name() for well in column]
+    tops = table.tops(names=names)
+    assert tops.shape == (8, 3)
+    assert tuple(tops[-1]) == pytest.approx(column[-1].get_geometry().top())
+
+
+def test_table_follows_calibration(plate):
+    table = plate.get_well_table()
+    before = table.tops(names=['A1'])[0]
+    plate.set_calibration(Point(1, 2, 3))
+    assert tuple(table.tops(names=['A1'])[0]) \
+        == pytest.approx(tuple(before + (1, 2, 3)))
+
+
+def test_wells_containing(plate, trough):
+    table = plate.get_well_table()
+    b2 = plate.get_wells_by_name()['B2'].get_geometry()
+    assert table.wells_containing(b2.center()) == ['B2']
+    # just inside the rim of a circular well, but not at its corner
+    radius = b2.diameter / 2
+    assert table.wells_containing(
+        b2.center() + Point(radius * 0.99, 0, 0)) == ['B2']
+    assert table.wells_containing(
+        b2.center() + Point(radius * 0.8, radius * 0.8, 0)) == []
+    assert table.wells_containing(b2.top(1)) == []
+    assert table.wells_containing(b2.bottom(-1)) == []
+
+    trough_table = trough.get_well_table()
+    a3 = trough.get_wells_by_name()['A3'].get_geometry()
+    assert trough_table.wells_containing(
+        a3.from_center_cartesian(0.9, 0.9, 0)) == ['A3']
+
+
+def test_wells_in_box_and_bounding_box(plate):
+    table = plate.get_well_table()
+    a1 = plate.get_wells_by_name()['A1'].get_geometry()
+    b2 = plate.get_wells_by_name()['B2'].get_geometry()
+    assert sorted(table.wells_in_box(a1.center(), b2.center())) \
+        == ['A1', 'A2', 'B1', 'B2']
+    assert table.wells_in_box(Point(0, 0, 0), Point(1, 1, 1)) == []
+
+    low, high = table.bounding_box()
+    h12 = plate.get_wells_by_name()['H12'].get_geometry()
+    assert low.x == pytest.approx(a1.top().x - a1.diameter / 2)
+    assert high.x == pytest.approx(h12.top().x + h12.diameter / 2)
+    assert low.y == pytest.approx(h12.top().y - h12.diameter / 2)
+    assert high.z == pytest.approx(a1.top().z)
+    assert sorted(table.wells_in_box(low, high)) == sorted(table.names)
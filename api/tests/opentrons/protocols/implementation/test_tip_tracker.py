@@ -1,3 +1,5 @@
+import random
+from itertools import dropwhile, takewhile
 from typing import List
 
 import pytest
@@ -167,3 +169,55 @@ def test_return_tips(wells, tiptracker):
     assert wells[7].has_tip()
     # But we won't wrap around
     assert not wells[8].has_tip()
+
+
+def _reference_next_tip(columns, num_tips, starting_tip=None):
+    # The list-based search the tracker's bitmasks replaced
+    if starting_tip:
+        columns = list(dropwhile(lambda x: starting_tip not in x, columns))
+        columns[0] = list(dropwhile(lambda w: starting_tip is not w,
+                                    columns[0]))
+    runs = [list(takewhile(lambda x: x.has_tip(),
+                           dropwhile(lambda x: not x.has_tip(), column)))
+            for column in columns]
+    long_enough = [run for run in runs if len(run) >= num_tips]
+    return long_enough[0][0] if long_enough and long_enough[0] else None
+
+
+def _reference_previous_tip(columns, num_tips):
+    runs = [list(takewhile(lambda x: not x.has_tip(),
+                           dropwhile(lambda x: x.has_tip(), column)))
+            for column in columns]
+    long_enough = [run for run in runs if len(run) >= num_tips]
+    return long_enough[0][0] if long_enough else None
+
+
+def test_matches_reference_search(wells, well_grid, tiptracker):
+    rand = random.Random(1234)
+    columns = well_grid.get_columns()
+    for _ in range(200):
+        for well in wells:
+            well.set_has_tip(rand.random() < 0.7)
+        for num_tips in (1, 2, 4, 8):
+            start = rand.choice(wells)
+            assert tiptracker.next_tip(num_tips) \
+                is _reference_next_tip(columns, num_tips)
+            assert tiptracker.next_tip(num_tips, start) \
+                is _reference_next_tip(columns, num_tips, start)
+            assert tiptracker.previous_tip(num_tips) \
+                is _reference_previous_tip(columns, num_tips)
+        start = rand.choice(wells)
+        tiptracker.use_tips(start, num_channels=8)
+        assert tiptracker.next_tip(1, start) \
+            is _reference_next_tip(columns, 1, start)
+
+
+def test_foreign_starting_tip(wells, well_grid, tiptracker):
+    other = WellImplementation(
+        well_geometry=None, display_name='A2', has_tip=True, name='A2')
+    assert other == wells[8]
+    # a tip of the same name from another rack skips the column it names
+    expected = _reference_next_tip(well_grid.get_columns(), 1, other)
+    assert expected is wells[16]
+    assert tiptracker.next_tip(starting_tip=other) is expected
+    assert tiptracker.next_tip(starting_tip=wells[8]) is wells[8]
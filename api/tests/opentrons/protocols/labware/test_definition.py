@@ -0,0 +1,56 @@
+import pytest
+
+from opentrons.protocols.labware import definition
+
+
+@pytest.fixture
+def user_defs(tmp_path, monkeypatch):
+    monkeypatch.setattr(definition, 'USER_DEFS_PATH', tmp_path)
+    (tmp_path / 'custom_beta').mkdir()
+    return tmp_path
+
+
+def custom_def(load_name, display_name='Custom'):
+    labware_def = definition.get_labware_definition(
+        'corning_96_wellplate_360ul_flat')
+    labware_def['namespace'] = 'custom_beta'
+    labware_def['parameters']['loadName'] = load_name
+    labware_def['metadata']['displayName'] = display_name
+    return labware_def
+
+
+def test_loads_are_independent():
+    first = definition.get_labware_definition('opentrons_96_tiprack_300ul')
+    first['parameters']['tipLength'] = 1
+    second = definition.get_labware_definition('opentrons_96_tiprack_300ul')
+    assert second is not first
+    assert second['parameters']['tipLength'] != 1
+
+
+def test_custom_labware_stays_fresh(user_defs):
+    with pytest.raises(FileNotFoundError):
+        definition.get_labware_definition('my_plate')
+    assert 'my_plate' not in definition.get_all_labware_definitions()
+
+    definition.save_definition(custom_def('my_plate', 'First'))
+    loaded = definition.get_labware_definition('my_plate')
+    assert loaded['namespace'] == 'custom_beta'
+    assert loaded['metadata']['displayName'] == 'First'
+    assert 'my_plate' in definition.get_all_labware_definitions()
+
+    definition.save_definition(
+        custom_def('my_plate', 'Second, and longer'), force=True)
+    assert definition.get_labware_definition(
+        'my_plate')['metadata']['displayName'] == 'Second, and longer'
+
+    definition.save_definition(custom_def('my_other_plate'))
+    assert 'my_other_plate' in definition.get_all_labware_definitions()
+    assert definition.get_labware_definition(
+        'my_other_plate', 'custom_beta', 1)['parameters']['loadName'] \
+        == 'my_other_plate'
+
+    definition.delete_all_custom_labware()
+    user_defs.mkdir()
+    with pytest.raises(FileNotFoundError):
+        definition.get_labware_definition('my_plate')
+    assert 'my_plate' not in definition.get_all_labware_definitions()
@@ -0,0 +1,70 @@
+import json
+
+import jsonschema
+import pytest
+
+from opentrons.protocols import schemas
+from opentrons.protocols.labware import verify_definition
+from opentrons_shared_data import load_shared_data
+
+
+@pytest.fixture
+def validations(monkeypatch):
+    schemas.clear_validated()
+    validated = []
+    validate = schemas.validate
+
+    def counting_validate(validator, instance):
+        validated.append(instance)
+        validate(validator, instance)
+
+    monkeypatch.setattr(schemas, 'validate', counting_validate)
+    yield validated
+    schemas.clear_validated()
+
+
+def test_validators_are_built_once():
+    assert schemas.labware_validator() is schemas.labware_validator()
+    assert schemas.protocol_validator(3) is schemas.protocol_validator(3)
+    assert schemas.protocol_validator(3) is not schemas.protocol_validator(4)
+    with pytest.raises(FileNotFoundError):
+        schemas.protocol_validator(1000)
+
+
+def test_definitions_validated_once(validations):
+    raw = load_shared_data(
+        'labware/definitions/2/opentrons_96_tiprack_300ul/1.json')
+    first = verify_definition(raw)
+    second = verify_definition(raw)
+    assert first == second
+    assert len(validations) == 1
+
+    parsed = json.loads(raw)
+    verify_definition(parsed)
+    verify_definition(json.loads(raw))
+    assert len(validations) == 2
+
+    # a changed definition is validated again, and invalid ones every time
+    parsed['parameters']['tipLength'] = 60
+    verify_definition(parsed)
+    assert len(validations) == 3
+    del parsed['parameters']
+    for _ in range(2):
+        with pytest.raises(jsonschema.ValidationError):
+            verify_definition(parsed)
+    assert len(validations) == 5
+
+
+def test_validated_cache_is_bounded(validations, monkeypatch):
+    monkeypatch.setattr(schemas._validated, 'maxsize', 2)
+    definition = json.loads(load_shared_data(
+        'labware/definitions/2/opentrons_96_tiprack_300ul/1.json'))
+    for length in (1, 2, 3):
+        definition['parameters']['tipLength'] = length
+        verify_definition(definition)
+    definition['parameters']['tipLength'] = 3
+    verify_definition(definition)
+    assert len(validations) == 3
+    definition['parameters']['tipLength'] = 1
+    verify_definition(definition)
+    assert len(validations) == 4
@@ -0,0 +1,23 @@
+from opentrons.util.caching import LRUCache, file_stamp
+
+
+def test_lru_cache_forgets_least_recently_used():
+    cache: LRUCache[str, int] = LRUCache(2)
+    cache.put('a', 1)
+    cache.put('b', 2)
+    assert cache.get('a') == 1
+    cache.put('c', 3)
+    assert cache.get('b') is None
+    assert (cache.get('a'), cache.get('c')) == (1, 3)
+    assert cache.info() == (3, 1, 2, 2)
+
+    cache.clear()
+    assert cache.info() == (0, 0, 2, 0)
+
+
+def test_file_stamp_changes_with_contents(tmpdir):
+    path = tmpdir / 'file'
+    path.write('a')
+    before = file_stamp(path)
+    path.write('ab')
+    assert file_stamp(path) != before
@@ -1,5 +1,7 @@
 from math import pi, sin, cos
-from opentrons.util.linal import solve, add_z, apply_transform, solve_attitude
+from opentrons.util.linal import (
+    solve, add_z, apply_transform, apply_reverse, solve_attitude,
+    DeckTransform)
 from numpy.linalg import inv
 import numpy as np
 
@@ -68,3 +70,22 @@ def test_apply_transform():
 
     result = apply_transform(inv(transform), (1, 2, 3))
     assert np.isclose(result, expected, atol=0.1).all()
+
+
+def test_deck_transform():
+    e = ((1, 1, 3), (2, 2, 2), (1, 2, 1))
+    a = (
+        (1.1, 1.2, 1.1),
+        (2.1, 2.2, 2.2),
+        (1.1, 2.2, 1.1))
+    attitude = solve_attitude(e, a)
+    transform = DeckTransform(attitude)
+    points = [(1, 2, 3), (-10.5, 200, 0.25), (0, 0, 0)]
+
+    for point in points:
+        assert np.allclose(
+            transform.apply(point), apply_transform(attitude, point))
+        assert np.allclose(
+            transform.apply_reverse(point), apply_reverse(attitude, point))
+        assert np.allclose(
+            transform.apply(transform.apply_reverse(point)), point)
@@ -204,6 +204,33 @@ class Modules(BaseModel):
         }
 
 
+class ModuleTemperatureHistory(BaseModel):
+    """Temperatures recorded as a module was polled, oldest first"""
+    resolution: str = \
+        Field(...,
+              description="raw for each reading, or 1s or 1min for averages "
+                          "over each second or minute")
+    time: typing.List[float] = \
+        Field(...,
+              description="When each reading was taken, in seconds since the "
+                          "epoch")
+    temperature: typing.List[typing.Optional[float]] = \
+        Field(...,
+              description="The temperature of the module (or block) at each "
+                          "reading")
+    target: typing.List[typing.Optional[float]] = \
+        Field(...,
+              description="The target temperature at each reading, if any")
+    lidTemp: typing.Optional[typing.List[typing.Optional[float]]] = \
+        Field(None,
+              description="The lid temperature at each reading, for a "
+                          "thermocycler")
+    lidTarget: typing.Optional[typing.List[typing.Optional[float]]] = \
+        Field(None,
+              description="The lid target temperature at each reading, for a "
+                          "thermocycler")
+
+
 class ModuleSerial(BaseModel):
     """Data from the module"""
     status: str = Field(...,
@@ -1,7 +1,7 @@
 import typing
 import asyncio
 from starlette import status
-from fastapi import Path, APIRouter, Depends
+from fastapi import Path, Query, APIRouter, Depends
 
 from opentrons.hardware_control import ThreadManager, modules
 from opentrons.hardware_control.modules import AbstractModule
@@ -10,7 +10,7 @@ from robot_server.service.dependencies import get_hardware
 from robot_server.service.legacy.models import V1BasicResponse
 from robot_server.service.errors import V1HandlerError
 from robot_server.service.legacy.models.modules import Module, ModuleSerial,\
-    Modules, SerialCommandResponse, SerialCommand
+    Modules, SerialCommandResponse, SerialCommand, ModuleTemperatureHistory
 
 router = APIRouter()
 
@@ -71,6 +71,56 @@ async def get_module_serial(
     )
 
 
+@router.get("/modules/{serial}/history",
+            description="Get the recorded temperatures of a specific module",
+            summary="The temperatures and targets a Temperature Module or "
+                    "Thermocycler reported while it was polled, over a time "
+                    "range, instead of sampling GET /modules/{serial}/data",
+            response_model=ModuleTemperatureHistory,
+            responses={status.HTTP_404_NOT_FOUND: {"model": V1BasicResponse},
+                       status.HTTP_400_BAD_REQUEST: {"model": V1BasicResponse}}
+            )
+async def get_module_history(
+        serial: str = Path(...,
+                           description="Serial number of the module"),
+        start: typing.Optional[float] = Query(
+            None,
+            description="The earliest reading to return, in seconds since "
+                        "the epoch"),
+        end: typing.Optional[float] = Query(
+            None,
+            description="The latest reading to return, in seconds since "
+                        "the epoch"),
+        resolution: typing.Optional[str] = Query(
+            None,
+            description="raw, 1s or 1min. By default, the finest resolution "
+                        "that still holds readings from start"),
+        hardware: ThreadManager = Depends(get_hardware)) \
+        -> ModuleTemperatureHistory:
+    attached_modules = hardware.attached_modules   # type: ignore
+    matching_module = find_matching_module(serial, attached_modules)
+    if not matching_module \
+            or not hasattr(matching_module, 'temperature_history'):
+        raise V1HandlerError(
+            status_code=status.HTTP_404_NOT_FOUND,
+            message="Module not found or does not record temperatures")
+
+    try:
+        history = matching_module.temperature_history(  # type: ignore
+            start, end, resolution)
+    except ValueError as e:
+        raise V1HandlerError(status_code=status.HTTP_400_BAD_REQUEST,
+                             message=str(e))
+
+    return ModuleTemperatureHistory(
+        resolution=history['resolution'],
+        time=history['time'],
+        temperature=history['temperature'],
+        target=history['target'],
+        lidTemp=history.get('lid_temp'),
+        lidTarget=history.get('lid_target'))
+
+
 @router.post("/modules/{serial}",
              description="Execute a command on a specific module",
              summary="Command a module to take an action. Valid actions depend"
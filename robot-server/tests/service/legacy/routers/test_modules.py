@@ -43,10 +43,6 @@ def tempdeck():
 
     yield t
 
-    # Have to stop the poller
-    t._poller.stop()
-    t._poller.join()
-
 
 @pytest.fixture
 def thermocycler():
@@ -240,6 +236,54 @@ def test_get_module_serial_no_modules(api_client, hardware):
     assert body['message'] == 'Module not found'
 
 
+def test_get_module_history_tempdeck(api_client, hardware, tempdeck):
+    hardware.attached_modules = [tempdeck]
+    tempdeck._history.record((20.0, 25.0), at=1000.0)
+    tempdeck._history.record((22.5, 25.0), at=1000.5)
+    tempdeck._history.record((24.0, None), at=1002.0)
+
+    resp = api_client.get('/modules/dummySerialTD/history?start=1000.5')
+
+    body = resp.json()
+    assert resp.status_code == 200
+    assert body == {'resolution': 'raw',
+                    'time': [1000.5, 1002.0],
+                    'temperature': [22.5, 24.0],
+                    'target': [25.0, None],
+                    'lidTemp': None,
+                    'lidTarget': None}
+
+    resp = api_client.get('/modules/dummySerialTD/history?resolution=1s')
+
+    body = resp.json()
+    assert resp.status_code == 200
+    assert body['time'] == [1000.0, 1002.0]
+    assert body['temperature'] == [21.25, 24.0]
+
+
+def test_get_module_history_thermocycler(
+        api_client, hardware, thermocycler):
+    hardware.attached_modules = [thermocycler]
+    thermocycler._history.record((95.0, 95.0, 104.0, 105.0), at=1000.0)
+
+    resp = api_client.get('/modules/dummySerialTC/history')
+
+    body = resp.json()
+    assert resp.status_code == 200
+    assert body['lidTemp'] == [104.0]
+    assert body['lidTarget'] == [105.0]
+
+
+def test_get_module_history_errors(api_client, hardware, magdeck, tempdeck):
+    hardware.attached_modules = [magdeck, tempdeck]
+
+    resp = api_client.get('/modules/dummySerialMD/history')
+    assert resp.status_code == 404
+
+    resp = api_client.get('/modules/dummySerialTD/history?resolution=1h')
+    assert resp.status_code == 400
+
+
 def test_execute_module_command(api_client, hardware, magdeck):
     hardware.attached_modules = [magdeck]
 